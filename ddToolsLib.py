@@ -38,20 +38,19 @@
 
 import os
 import sys
+import atexit
 import shutil as shutil
+import bisect
 import psutil
-from datetime import datetime
+import time
+import threading
 
-import xml.dom
-import xml.dom.minidom
-from xml.dom.minidom import parseString
+import xml.etree.ElementTree as ET
 
 import subprocess
+import shlex
 from pathlib import Path
 
-# My own libraries
-import xmlTools as dxml
-
 #random.seed(3)
 NEWLINE_STR = "\n"
 
@@ -69,6 +68,37 @@ g_LogLineNum = 0
 g_DebugLogResetInterval = -1
 g_DebugMode = False
 
+# The log file is opened once and lines are buffered in memory, rather than
+# opening, appending and closing the file on every call to DDTools_Log.
+# The buffer is written out every g_LogBufferMax lines. A background thread also
+# flushes it to disk every g_LogFlushIntervalSec, even if nothing else is logged.
+# g_LogLock protects the buffer and the file handle, since both threads use them.
+g_LogFileHandle = None
+g_LogBuffer = []
+g_LogBufferMax = 64
+g_LogFlushIntervalSec = 5
+g_LogFlushThread = None
+g_LogLock = threading.RLock()
+
+# When several processes share one log file, each line is instead written with a
+# single os.write on an O_APPEND file descriptor, so lines from different
+# processes never interleave.
+g_LogAtomicAppend = False
+g_LogFd = None
+
+# The last timestamp written to the log, and the time in seconds it was made from.
+g_LogTimeSec = 0
+g_LogTimeStr = ""
+
+# Units used by DDTools_ConvertSizeIntToStr. A size above a threshold is shown in the next unit.
+g_SizeUnitThresholds = (1000, 1000000, 1000000000)
+g_SizeUnitDivisors = (1.0, 1000.0, 1000000.0, 1000000000.0)
+g_SizeUnitSuffixes = ("", " KB", " MB", " GB")
+
+# The parsed contents of the local secrets file, and the file time when we parsed it.
+g_LocalSecretsCache = None
+g_LocalSecretsCacheMTime = 0
+
 
 
 
@@ -78,10 +108,11 @@ g_DebugMode = False
 # [DDTools_Init]
 #
 ################################################################################
-def DDTools_Init(logPrefixStr, logFileID):
+def DDTools_Init(logPrefixStr, logFileID, fAtomicAppend=False):
     global g_LogFilePathName
     global g_LogLinePrefix
     global g_DebugMode
+    global g_LogAtomicAppend
     #print("DDTools_Init. logFileID=" + logFileID)
 
     g_LogLinePrefix = logPrefixStr
@@ -106,11 +137,125 @@ def DDTools_Init(logPrefixStr, logFileID):
         g_LogFilePathName = g_TasksLogFilePathName
     else:
         g_LogFilePathName = g_BackupLogFilePathName
+
+    # Close the old log before changing modes, so its buffered lines are written the old way.
+    DDTools_CloseLogFile()
+    g_LogAtomicAppend = fAtomicAppend
+    DDTools_OpenLogFile()
 # End - DDTools_Init
 
 
 
 
+################################################################################
+#
+# [DDTools_OpenLogFile]
+#
+################################################################################
+def DDTools_OpenLogFile():
+    global g_LogFileHandle
+    global g_LogFd
+
+    with g_LogLock:
+        # If we are switching log files, then write out anything buffered for the old one.
+        DDTools_CloseLogFile()
+
+        if (g_LogAtomicAppend):
+            g_LogFd = os.open(g_LogFilePathName, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        else:
+            g_LogFileHandle = open(g_LogFilePathName, "a")
+# End - DDTools_OpenLogFile
+
+
+
+
+################################################################################
+#
+# [DDTools_CloseLogFile]
+#
+################################################################################
+def DDTools_CloseLogFile():
+    global g_LogFileHandle
+    global g_LogFd
+
+    with g_LogLock:
+        if (g_LogFd is not None):
+            os.close(g_LogFd)
+            g_LogFd = None
+
+        if (g_LogFileHandle is None):
+            return
+
+        DDTools_FlushLog()
+        g_LogFileHandle.close()
+        g_LogFileHandle = None
+# End - DDTools_CloseLogFile
+
+
+
+
+################################################################################
+#
+# [DDTools_FlushLog]
+#
+# The flush thread calls this every g_LogFlushIntervalSec, so log lines may sit
+# in memory for up to that long. Call this from shutdown or test code that needs
+# to see the file on disk now.
+################################################################################
+def DDTools_FlushLog():
+    global g_LogBuffer
+
+    with g_LogLock:
+        if (g_LogFileHandle is None):
+            return
+
+        g_LogFileHandle.writelines(g_LogBuffer)
+        g_LogBuffer = []
+        g_LogFileHandle.flush()
+# End - DDTools_FlushLog
+
+
+
+
+################################################################################
+#
+# [DDToolsLogFlushThreadMain]
+#
+# This is the body of the daemon thread that flushes the log buffer on a timer,
+# so the last lines before a process goes quiet still reach the file.
+################################################################################
+def DDToolsLogFlushThreadMain():
+    while (True):
+        time.sleep(g_LogFlushIntervalSec)
+        DDTools_FlushLog()
+# End - DDToolsLogFlushThreadMain
+
+
+
+
+################################################################################
+#
+# [DDToolsResetLogAfterFork]
+#
+# A forked child only has the thread that called fork, and the lock may have
+# been held by another thread at that moment. Give the child a new lock, and let
+# its next DDTools_Log start its own flush thread.
+################################################################################
+def DDToolsResetLogAfterFork():
+    global g_LogLock
+    global g_LogFlushThread
+
+    g_LogLock = threading.RLock()
+    g_LogFlushThread = None
+# End - DDToolsResetLogAfterFork
+
+os.register_at_fork(after_in_child=DDToolsResetLogAfterFork)
+
+atexit.register(DDTools_CloseLogFile)
+
+
+
+
 ################################################################################
 #
 # [DDTools_InitDebug]
@@ -158,23 +303,50 @@ def DDTools_Log(message):
     global g_LogFilePathName
     global g_LogLineNum
     global g_DebugMode
-
-    now = datetime.now()
-    timeStr = now.strftime("%Y-%m-%d %H:%M:%S")
-    textStr = timeStr + " " + g_LogLinePrefix + message
-
-    print("DDTools_Log: " + textStr)
-
-    if ((g_DebugMode) and (g_DebugLogResetInterval > 0) and ((g_LogLineNum % g_DebugLogResetInterval) == 0)):
-        fileH = open(g_LogFilePathName, "w+")
-        fileH.write("Removed...." + NEWLINE_STR)
-        fileH.close()
-    g_LogLineNum += 1
-
-    fileH = open(g_LogFilePathName, "a+")
-    fileH.write(textStr + NEWLINE_STR)
-    #fileH.flush()
-    fileH.close()
+    global g_LogBuffer
+    global g_LogFlushThread
+    global g_LogTimeSec
+    global g_LogTimeStr
+
+    # The timestamp only has 1-second resolution, so only format it again when the second changes.
+    nowSec = int(time.time())
+    if (nowSec != g_LogTimeSec):
+        g_LogTimeStr = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(nowSec))
+        g_LogTimeSec = nowSec
+    textStr = g_LogTimeStr + " " + g_LogLinePrefix + message
+
+    # Only echo log lines to the console when debugging. In production stdout is often a pipe.
+    if (g_DebugMode):
+        print("DDTools_Log:", textStr)
+
+    with g_LogLock:
+        if ((g_LogFileHandle is None) and (g_LogFd is None)):
+            DDTools_OpenLogFile()
+
+        if (g_DebugMode):
+            if ((g_DebugLogResetInterval > 0) and ((g_LogLineNum % g_DebugLogResetInterval) == 0)):
+                if (g_LogFd is not None):
+                    os.ftruncate(g_LogFd, 0)
+                    os.write(g_LogFd, ("Removed...." + NEWLINE_STR).encode('utf-8'))
+                else:
+                    g_LogBuffer = []
+                    g_LogFileHandle.seek(0)
+                    g_LogFileHandle.truncate()
+                    g_LogFileHandle.write("Removed...." + NEWLINE_STR)
+            g_LogLineNum += 1
+
+        if (g_LogFd is not None):
+            os.write(g_LogFd, (textStr + NEWLINE_STR).encode('utf-8'))
+            return
+
+        if (g_LogFlushThread is None):
+            g_LogFlushThread = threading.Thread(target=DDToolsLogFlushThreadMain, daemon=True)
+            g_LogFlushThread.start()
+
+        g_LogBuffer.append(textStr + NEWLINE_STR)
+        if (len(g_LogBuffer) >= g_LogBufferMax):
+            g_LogFileHandle.writelines(g_LogBuffer)
+            g_LogBuffer = []
 # End - DDTools_Log
 
 
@@ -187,33 +359,31 @@ def DDTools_Log(message):
 # [DDTools_RunProgram]
 #
 # commandStr has the format "ls -l"
+#
+# By default the command is run directly rather than through a shell, which
+# lets subprocess launch it with posix_spawn instead of fork+exec of a shell.
+# Pass useShell=True for commands that need shell features like pipes,
+# redirection or wildcards.
 ################################################################################
-def DDTools_RunProgram(commandStr):
-    # commandArgStrList has the format ["ls", "-l"]
-    commandArgStrList = [commandStr]
-
+def DDTools_RunProgram(commandStr, useShell=False):
     try:
-        # shell=True - run in a shell, so has all environment variables set
+        if (useShell):
+            # commandArgStrList has the format ["ls -l"]
+            commandArgStrList = [commandStr]
+        else:
+            # commandArgStrList has the format ["ls", "-l"]
+            commandArgStrList = shlex.split(commandStr)
+
+        # shell=True - run in a shell, so the command line is parsed and expanded by the shell
         # check=True - raise an exception if the return code is not 0
         # capture_output=True - Save stdOut and stderr in processResult.stdout and processResult.stderr
         #   Leave this as false. If you run a program from the shell prompt, this will print an
         #   error or user prompt, where you can see it during debugging. Otherwise, this
         #   gets silently tucked away and a command may hang.
-        subprocess.run(commandArgStrList, capture_output=False, check=False, shell=True)
-    except subprocess.CalledProcessError:  # as err:
-        message = "DDTools_RunProgram Error: " + str(commandStr)
-        DDTools_Log(message)
-        return
-    except subprocess.SubprocessError:  # as err:
-        message = "DDTools_RunProgram Subprocess error: " + str(commandStr)
-        DDTools_Log(message)
-        return
-    except OSError:  # as err:
-        message = "DDTools_RunProgram OS error: " + str(commandStr)
-        DDTools_Log(message)
-        return
-    except Exception:
-        message = "DDTools_RunProgram. Unknown error cmd: " + str(commandStr)
+        subprocess.run(commandArgStrList, capture_output=False, check=False, shell=useShell)
+    # ValueError comes from shlex.split when the command has unbalanced quotes.
+    except (subprocess.SubprocessError, OSError, ValueError) as err:
+        message = "DDTools_RunProgram error (" + type(err).__name__ + "): " + str(commandStr) + ": " + str(err)
         DDTools_Log(message)
         return
 # End - DDTools_RunProgram
@@ -229,21 +399,13 @@ def DDTools_RunProgram(commandStr):
 #
 ################################################################################
 def DDTools_ConvertSizeIntToStr(resultInt):
-    if (resultInt > 1000000000):
-        resultFloat = float(resultInt) / 1000000000.0
-        suffix = " GB"
-    elif (resultInt > 1000000):
-        resultFloat = float(resultInt) / 1000000.0
-        suffix = " MB"
-    elif (resultInt > 1000):
-        resultFloat = float(resultInt) / 1000.0
-        suffix = " KB"
-    else:
-        resultFloat = float(resultInt)
-        suffix = ""
+    # bisect_left counts how many thresholds are strictly below resultInt, which
+    # is the index of the unit to use.
+    unitIndex = bisect.bisect_left(g_SizeUnitThresholds, resultInt)
+    resultFloat = float(resultInt) / g_SizeUnitDivisors[unitIndex]
 
     resultFloat = round(resultFloat, 1)
-    result = str(resultFloat) + suffix
+    result = str(resultFloat) + g_SizeUnitSuffixes[unitIndex]
 
     return(result)
 # End - DDTools_ConvertSizeIntToStr
@@ -275,13 +437,18 @@ def DDTools_GetFileSizeAsStr(filePath):
 def DDTools_GetDirSizeAsInt(folder):
     totalSize = os.path.getsize(folder)
 
-    for fileName in os.listdir(folder):
-        filePath = os.path.join(folder, fileName)
-
-        if os.path.isfile(filePath):
-            totalSize += os.path.getsize(filePath)
-        elif os.path.isdir(filePath):
-            totalSize += DDTools_GetDirSizeAsInt(filePath)
+    # Walk the tree with an explicit stack rather than recursion. The DirEntry
+    # objects from scandir already know their type, so we only stat each file once.
+    dirStack = [folder]
+    while (len(dirStack) > 0):
+        currentDir = dirStack.pop()
+        with os.scandir(currentDir) as dirIter:
+            for entry in dirIter:
+                if entry.is_file():
+                    totalSize += entry.stat().st_size
+                elif entry.is_dir():
+                    totalSize += entry.stat().st_size
+                    dirStack.append(entry.path)
 
     return totalSize
 # End - DDTools_GetDirSizeAsInt
@@ -290,6 +457,45 @@ def DDTools_GetDirSizeAsInt(folder):
 
 
 
+################################################################################
+#
+# [DDTools_GetDirSizeFromDu]
+#
+# This is usually faster than DDTools_GetDirSizeAsInt on large trees, because du
+# reads directories in large batches. The result can differ slightly, since du
+# does not follow symlinks and counts hard links once.
+# If du is not available, this falls back to DDTools_GetDirSizeAsInt.
+################################################################################
+def DDTools_GetDirSizeFromDu(folder):
+    try:
+        processResult = subprocess.run(["du", "-sb", folder], capture_output=True, check=True, text=True)
+        totalSize = int(processResult.stdout.split()[0])
+    except (subprocess.SubprocessError, OSError, ValueError, IndexError):
+        totalSize = DDTools_GetDirSizeAsInt(folder)
+
+    return totalSize
+# End - DDTools_GetDirSizeFromDu
+
+
+
+
+
+################################################################################
+#
+# [DDTools_GetMountUsedBytes]
+#
+# Returns the number of bytes used on the whole volume that contains folder.
+# This is a single statvfs call, so use it when the size of the volume is enough.
+################################################################################
+def DDTools_GetMountUsedBytes(folder):
+    volumeInfo = os.statvfs(folder)
+    return (volumeInfo.f_blocks - volumeInfo.f_bfree) * volumeInfo.f_frsize
+# End - DDTools_GetMountUsedBytes
+
+
+
+
+
 ################################################################################
 #
 # [DDTools_GetDirSizeAsStr]
@@ -314,15 +520,16 @@ def DDTools_DeleteDirContents(dirPathName):
     if not os.path.exists(dirPathName):
         return
 
-    for filename in os.listdir(dirPathName):
-        file_path = os.path.join(dirPathName, filename)
-        try:
-            if os.path.isfile(file_path) or os.path.islink(file_path):
-                os.unlink(file_path)
-            elif os.path.isdir(file_path):
-                shutil.rmtree(file_path)
-        except Exception as e:
-            print('Failed to delete %s. Reason: %s' % (file_path, e))
+    # The scandir entries already know their type, so this does not stat each entry again.
+    with os.scandir(dirPathName) as dirIter:
+        for entry in dirIter:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+            except OSError as e:
+                print('Failed to delete %s. Reason: %s' % (entry.path, e))
 # End - DDTools_DeleteDirContents
 
 
@@ -333,41 +540,68 @@ def DDTools_DeleteDirContents(dirPathName):
 #
 # [DDTools_GetLocalSecret]
 #
+# The secrets file is parsed once into a dictionary, and only re-read if the
+# file has been modified since the last time we parsed it.
 ################################################################################
 def DDTools_GetLocalSecret(secretName):
+    global g_LocalSecretsCache
+    global g_LocalSecretsCacheMTime
+
+    fileMTime = os.stat(g_LocalSecretsFilePathName).st_mtime
+    if ((g_LocalSecretsCache is None) or (fileMTime != g_LocalSecretsCacheMTime)):
+        g_LocalSecretsCache = DDTools_ReadLocalSecretsFile()
+        g_LocalSecretsCacheMTime = fileMTime
+
+    # Tag names are compared case-insensitively, just like XMLTools_GetChildNode
+    return(g_LocalSecretsCache.get(secretName.lower(), ""))
+# End - DDTools_GetLocalSecret
+
+
+
+
+################################################################################
+#
+# [DDTools_ReadLocalSecretsFile]
+#
+# Returns a dictionary that maps each lower-case secret name to its value.
+################################################################################
+def DDTools_ReadLocalSecretsFile():
+    secretDict = {}
+
     # Read the file to a string.
     fileH = open(g_LocalSecretsFilePathName, "r")
     contentsText = fileH.read()
     fileH.close()
     #print("File contents = [" + contentsText + "]")
 
-    # Parse the text string into am XML DOM
+    # Parse the text string into an XML tree. ElementTree is implemented in C and
+    # is much cheaper than building a minidom DOM.
     try:
-        xmlDOMObj = parseString(contentsText)
-    except xml.parsers.expat.ExpatError as err:
+        rootXMLNode = ET.fromstring(contentsText)
+    except ET.ParseError as err:
         print("DDTools_GetLocalSecret. Error from parsing string:")
-        print("ExpatError:" + str(err))
+        print("ParseError:" + str(err))
         print("contentsText=[" + contentsText + "]")
-        return ""
+        return secretDict
     except Exception:
         print("DDTools_GetLocalSecret. Error from parsing string:")
         print("contentsText=[" + contentsText + "]")
         print("Unexpected error:", sys.exc_info()[0])
-        return ""
+        return secretDict
 
-    try:
-        rootXMLNode = xmlDOMObj.getElementsByTagName("LocalSecrets")[0]
-    except Exception:
+    if (rootXMLNode.tag != "LocalSecrets"):
+        rootXMLNode = rootXMLNode.find(".//LocalSecrets")
+    if (rootXMLNode is None):
         print("DDTools_GetLocalSecret. Required elements are missing: [" + contentsText + "]")
-        return ""
+        return secretDict
 
-    valueNode = dxml.XMLTools_GetChildNode(rootXMLNode, secretName)
-    if (valueNode is None):
-        return ""
+    for valueNode in rootXMLNode:
+        secretName = valueNode.tag.lower()
+        if (secretName not in secretDict):
+            secretDict[secretName] = valueNode.text or ""
 
-    resultStr = dxml.XMLTools_GetTextContents(valueNode)
-    return(resultStr)
-# End - DDTools_GetLocalSecret
+    return(secretDict)
+# End - DDTools_ReadLocalSecretsFile
 
 
 
@@ -27,6 +27,7 @@
 ################################################################################
 from datetime import datetime
 import random
+import queue
 
 # GUI classes
 import matplotlib
@@ -106,6 +107,18 @@ class ImageGridUIClass:
         self.ProcessInfo = None
         self.CommandQueue = None
         self.ReportQueue = None
+        self.JobID = 0
+        self.StartWorkerProcess()
+
+        # The values currently shown in the status labels, so we only update labels that change.
+        self.LastNumRequests = None
+        self.LastNumSuccess = None
+        self.LastNumErrors = None
+
+        # The plot is created by the first call to OnPlot and then reused.
+        self.PlotFigure = None
+        self.PlotAxes = None
+        self.PlotCanvas = None
 
         self.window.title("Image Grid")
         self.window.geometry(WINDOW_DIMENSION_STR)
@@ -184,33 +197,72 @@ class ImageGridUIClass:
 
 
 
+    ########################################
+    # The worker process is started once and then runs one job after another,
+    # so OnStart does not pay the cost of forking a new process each time.
+    ########################################
+    def StartWorkerProcess(self):
+        # Make a pipe that will be used to send commands and return status updates
+        recvPipe, sendPipeEnd = multiprocessing.Pipe(False)
+        self.CommandQueue = multiprocessing.Queue()
+        self.ReportQueue = multiprocessing.Queue()
+
+        #self.ProcessInfo = Process(target=jobRunnerProcessMain, args=(self.CommandQueue, self.ReportQueue, sendPipeEnd, "param1"))
+        self.ProcessInfo = Process(target=workerProcessMain, args=(self.CommandQueue, self.ReportQueue, sendPipeEnd))
+        self.ProcessInfo.daemon = True
+        self.ProcessInfo.start()
+    # End - StartWorkerProcess
+
+
+
+
     ########################################
     ########################################
     def OnTimer(self):
         # Check if the process stopped.
-        if (self.RunningJobs):
-            if (not (self.ProcessInfo.is_alive())):
-                print("Process Stopped")
-                self.OnStop()
-            else:
-                #print("Process Still Running")
-                pass
-        # End - if (self.RunningJobs)
+        if (not (self.ProcessInfo.is_alive())):
+            print("Process Stopped")
+            self.OnStop()
+            self.StartWorkerProcess()
+        # End - if (not (self.ProcessInfo.is_alive()))
 
 
         ###########################
         if ((self.RunningJobs) and (self.ReportQueue != None)):
             #print("Process Still Running")
-            try:
-                reportStr = self.ReportQueue.get(False)
-            except Exception:
-                reportStr = None
-            if (reportStr != None):
-                #print("Valid Report: " + reportStr)
-                statusDict = eval(reportStr)
-                self.NumTestsValue.config(text=statusDict['numRequests'])
-                self.NumSuccessValue.config(text=statusDict['numSuccess'])
-                self.NumErrorssValue.config(text=statusDict['numErrors'])
+            # The worker puts its status dictionary directly on the queue, which pickles it for us.
+            # Drain every report that arrived since the last tick and only show the newest one.
+            statusDict = None
+            fJobDone = False
+            while (True):
+                try:
+                    report = self.ReportQueue.get_nowait()
+                except queue.Empty:
+                    break
+                # Ignore anything left over from an earlier job that was stopped before it finished.
+                if (report['jobID'] != self.JobID):
+                    continue
+                if ('jobDone' in report):
+                    fJobDone = True
+                else:
+                    statusDict = report['status']
+            # End - while (True)
+
+            if (statusDict != None):
+                #print("Valid Report: " + str(statusDict))
+                if (statusDict['numRequests'] != self.LastNumRequests):
+                    self.LastNumRequests = statusDict['numRequests']
+                    self.NumTestsValue.config(text=self.LastNumRequests)
+                if (statusDict['numSuccess'] != self.LastNumSuccess):
+                    self.LastNumSuccess = statusDict['numSuccess']
+                    self.NumSuccessValue.config(text=self.LastNumSuccess)
+                if (statusDict['numErrors'] != self.LastNumErrors):
+                    self.LastNumErrors = statusDict['numErrors']
+                    self.NumErrorssValue.config(text=self.LastNumErrors)
+
+            if (fJobDone):
+                print("Job Stopped")
+                self.OnStop()
         # End - if ((self.RunningJobs) and (self.ReportQueue != None)):
 
 
@@ -241,11 +293,6 @@ class ImageGridUIClass:
         else:
             paramDict['opName'] = "CKDProgression"
 
-        # Make a pipe that will be used to send commands and return status updates
-        recvPipe, sendPipeEnd = multiprocessing.Pipe(False)
-        self.CommandQueue = multiprocessing.Queue()
-        self.ReportQueue = multiprocessing.Queue()
-
         # clear the canvas
         #self.ImageCanvas.delete('all')
         # Save the filename object as a member - it cannot be garbage collected.
@@ -254,10 +301,9 @@ class ImageGridUIClass:
         #image = self.ImageCanvas.create_image(100, 100, image=self.filename)
         #self.ImageCanvas.pack()
 
-        # Fork the job process.
-        #self.ProcessInfo = Process(target=jobRunnerProcessMain, args=(self.CommandQueue, self.ReportQueue, sendPipeEnd, "param1"))
-        self.ProcessInfo = Process(target=serverClientProcessMain, args=(self.CommandQueue, self.ReportQueue, sendPipeEnd, str(paramDict)))
-        self.ProcessInfo.start()
+        # Tell the worker process to start the job.
+        self.JobID += 1
+        self.CommandQueue.put({'command': 'Start', 'jobID': self.JobID, 'params': paramDict})
         self.RunningJobs = True
 
         # Update the GUI to show we started the job.
@@ -268,6 +314,9 @@ class ImageGridUIClass:
         self.NumTestsValue.config(text="0")
         self.NumSuccessValue.config(text="0")
         self.NumErrorssValue.config(text="0")
+        self.LastNumRequests = None
+        self.LastNumSuccess = None
+        self.LastNumErrors = None
     # End - OnStart
 
 
@@ -318,8 +367,17 @@ class ImageGridUIClass:
         v = np.array([16, 16.31925, 17.6394, 16.003, 17.2861, 17.3131, 19.1259, 18.9694, 22.0003, 22.81226])
         p = np.array([16.23697, 17.31653, 17.22094, 17.68631, 17.73641,  18.6368, 19.32125, 19.31756 , 21.20247, 22.41444, 22.11718, 22.12453])
 
-        fig = Figure(figsize=(16, 16))
-        a = fig.add_subplot(111)
+        # Reuse the figure and canvas from the last plot. Making a new one each
+        # time leaks the old canvas widget and its image.
+        if (self.PlotFigure is None):
+            self.PlotFigure = Figure(figsize=(16, 16))
+            self.PlotAxes = self.PlotFigure.add_subplot(111)
+            self.PlotCanvas = FigureCanvasTkAgg(self.PlotFigure, master=self.window)
+            self.PlotCanvas.get_tk_widget().pack()
+        else:
+            self.PlotAxes.clear()
+
+        a = self.PlotAxes
         a.scatter(v, x, color='red')
         a.plot(p, range(2 + max(x)), color='blue')
         a.invert_yaxis()
@@ -328,9 +386,7 @@ class ImageGridUIClass:
         a.set_ylabel("Y", fontsize=14)
         a.set_xlabel("X", fontsize=14)
 
-        canvas = FigureCanvasTkAgg(fig, master=self.window)
-        canvas.get_tk_widget().pack()
-        canvas.draw()
+        self.PlotCanvas.draw()
     # End - OnPlot
 
 # End - class ImageGridUIClass:
@@ -340,21 +396,97 @@ class ImageGridUIClass:
 
 
 
+################################################################################
+#
+# [JobReportQueue]
+#
+# The worker and its ReportQueue are shared by every job, so a status report
+# from a job that was stopped can still be on the queue when the next job
+# starts. This wraps the ReportQueue for one job and tags every report with
+# that job's ID, so the GUI can drop reports from any other job.
+################################################################################
+class JobReportQueue:
+    ########################################
+    ########################################
+    def __init__(self, reportQueue, jobID):
+        self.ReportQueue = reportQueue
+        self.JobID = jobID
+    # End - __init__
+
+    ########################################
+    ########################################
+    def put(self, statusDict, block=True, timeout=None):
+        self.ReportQueue.put({'jobID': self.JobID, 'status': statusDict}, block, timeout)
+    # End - put
+
+    ########################################
+    ########################################
+    def put_nowait(self, statusDict):
+        self.put(statusDict, False)
+    # End - put_nowait
+# End - class JobReportQueue:
+
+
+
+
+
+################################################################################
+#
+# [workerProcessMain]
+#
+# This is the main loop of the long-lived worker process. It waits for a
+# "Start" command, runs one job, and then waits for the next one. Each job
+# starts from a fresh call to serverClientProcessMain, so no state is carried
+# over between jobs. Any other command, like a "Quit" that arrives after the
+# job already ended, is ignored. Every report the job sends is tagged with
+# its jobID.
+################################################################################
+def workerProcessMain(commandQueue, reportQueue, sendPipeEnd):
+    while (True):
+        command = commandQueue.get()
+        if (not isinstance(command, dict)):
+            continue
+        if (command['command'] == 'Exit'):
+            break
+        if (command['command'] != 'Start'):
+            continue
+
+        jobID = command['jobID']
+        serverClientProcessMain(commandQueue, JobReportQueue(reportQueue, jobID), sendPipeEnd, command['params'])
+
+        # Tell the GUI this job is finished.
+        reportQueue.put({'jobID': jobID, 'jobDone': True})
+    # End - while (True)
+# End - workerProcessMain
+
+
+
+
+
+
 
 ################################################################################
 # MAIN
 ################################################################################
 
-# The main tkinter window
-window = tk.Tk()
-window.title('TDF Widget')
-window.geometry("800x800")
+# The worker is launched with forkserver rather than fork. Forking a process that
+# already has Tk and matplotlib running copies all of that state and can deadlock
+# on locks held by Tk's threads. The forkserver re-imports this module in the
+# worker, so the GUI below must only run in the main process.
+if __name__ == "__main__":
+    multiprocessing.set_start_method('forkserver', force=True)
+
+    # The main tkinter window
+    window = tk.Tk()
+    window.title('TDF Widget')
+    window.geometry("800x800")
 
-# Make the gui class which is attached to this window.
-tdfGui = ImageGridUIClass(window)
+    # Make the gui class which is attached to this window.
+    tdfGui = ImageGridUIClass(window)
 
-# Run the gui
-window.mainloop()
+    # Run the gui
+    window.mainloop()
+# End - if __name__ == "__main__":
 
 
 
@@ -27,14 +27,15 @@
 #
 ################################################################################
 import os
+import sys
+import atexit
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import matplotlib.pyplot as plt
 from sklearn.metrics import roc_curve
 from sklearn.metrics import precision_recall_curve
 
-# File ops
-from os.path import isfile
-
 import tdfTools as tdf
 import dataShow as DataShow
 import mlJob as mlJob
@@ -48,6 +49,61 @@ MLJOB_FILE_REPORT               = "MLJOB_FILE_REPORT"
 MLJOB_LOG_REPORT                = "MLJOB_LOG_REPORT"
 MLJOB_LEARNING_RATE_CSV_REPORT  = "MLJOB_LEARNING_RATE_CSV_REPORT"
 
+# The accuracy lines for INT and FLOAT results, in report order.
+# Each entry is (label, name of the count in the job test results).
+JOBSHOW_ACCURACY_REPORT_LIST = (
+    ("Exact Accuracy", "NumCorrectPredictions"),
+    ("Within 2 percent Accuracy", "NumPredictionsWithin2Percent"),
+    ("Within 5 percent Accuracy", "NumPredictionsWithin5Percent"),
+    ("Within 10 percent Accuracy", "NumPredictionsWithin10Percent"),
+    ("Within 20 percent Accuracy", "NumPredictionsWithin20Percent"),
+    ("Within 50 percent Accuracy", "NumPredictionsWithin50Percent"),
+    ("Within 100 percent Accuracy", "NumPredictionsWithin100Percent"),
+)
+
+# These report types are written as text to a file.
+JOBSHOW_TEXT_FILE_REPORT_TYPES = (MLJOB_FILE_REPORT, MLJOB_LOG_REPORT)
+
+# Report files stay open between calls to JobShow_WriteReport, so a sweep that
+# writes many reports does not open and close the file for each one.
+# This maps each file path to its open file handle.
+g_OpenReportFileDict = {}
+REPORT_FILE_BUFFER_SIZE = 64 * 1024
+
+# Rows for MLJOB_LEARNING_RATE_CSV_REPORT are collected in memory and written
+# in blocks. This maps each file path to [list of rows, total size of the rows].
+g_CSVBufferDict = {}
+CSV_BUFFER_FLUSH_SIZE = 64 * 1024
+
+# ShowAvgLossPerEpoch graphs this many epochs, labelled "0", "1", ...
+# The label list is shared and must not be changed.
+JOBSHOW_LOSS_GRAPH_MAX_EPOCHS = 20
+JOBSHOW_LOSS_GRAPH_EPOCH_NAME_LIST = [str(epochNum) for epochNum in range(JOBSHOW_LOSS_GRAPH_MAX_EPOCHS)]
+
+# Report paths that could not be opened or written. These are reported once and
+# then skipped, rather than failing again on every report.
+g_BadReportPathSet = set()
+
+# Jobs read by the Show* helpers are kept, so analyzing one directory for
+# several properties parses each job file only once.
+# This maps each job file path to (file mtime, job). An entry is used only
+# while the file mtime is unchanged.
+# Each job holds its whole parsed file, including network weights, so the
+# number of cached jobs is bounded.
+g_JobCacheDict = {}
+JOB_CACHE_MAX_ENTRIES = 512
+
+# This maps each job file path to (file mtime, result of MLJob_PeekJobFile).
+# The entries are small, so this is not bounded.
+g_JobPeekCacheDict = {}
+
+# Job files that are not cached are read on this many threads at most.
+# Most of a read is parsing, which holds the GIL, so more threads do not help.
+JOB_READ_MAX_THREADS = 8
+
+# This maps each job directory path to (directory mtime, list of job file paths).
+g_JobDirListCacheDict = {}
+
 
 
 #####################################################
@@ -56,9 +112,67 @@ MLJOB_LEARNING_RATE_CSV_REPORT  = "MLJOB_LEARNING_RATE_CSV_REPORT"
 #
 #####################################################
 def JobShow_WriteReport(job, fileType, filePathName):
+    # Only build the text that this kind of report needs. The CSV line and the
+    # full text report share very little, so there is no point making both.
+    ########################
+    if (fileType == MLJOB_LEARNING_RATE_CSV_REPORT):
+        JobShow_WriteReportFile(filePathName, f"{JobShow_MakeCSVLine(job)}{NEWLINE_STR}", True)
+    ########################
+    elif (fileType == MLJOB_CONSOLE_REPORT):
+        print(JobShow_MakeReportStr(job))
+    ########################
+    elif (fileType in JOBSHOW_TEXT_FILE_REPORT_TYPES):
+        JobShow_WriteReportFile(filePathName, JobShow_MakeReportStr(job), False)
+# End - JobShow_WriteReport
+
+
+
+
+
+#####################################################
+#
+# [JobShow_WriteReportFile]
+#
+# This is the one place where reports are written to a file.
+# CSV lines are collected in memory and written in blocks. Text reports are
+# written straight to the buffered report file.
+#####################################################
+def JobShow_WriteReportFile(filePathName, reportStr, fIsCSVLine):
+    if (filePathName in g_BadReportPathSet):
+        return
+
+    if (fIsCSVLine):
+        csvBuffer = g_CSVBufferDict.get(filePathName)
+        if (csvBuffer is None):
+            csvBuffer = [[], 0]
+            g_CSVBufferDict[filePathName] = csvBuffer
+        csvBuffer[0].append(reportStr)
+        csvBuffer[1] += len(reportStr)
+
+        if (csvBuffer[1] >= CSV_BUFFER_FLUSH_SIZE):
+            JobShow_WriteCSVBuffer(filePathName, csvBuffer)
+        return
+    # End - if (fIsCSVLine):
+
+    try:
+        fileH = JobShow_GetReportFile(filePathName)
+        fileH.write(reportStr)
+    except OSError as err:
+        JobShow_SetBadReportPath(filePathName, err)
+# End - JobShow_WriteReportFile
+
+
+
+
+
+#####################################################
+#
+# [JobShow_MakeReportStr]
+#
+# Returns the full text report for a job.
+#####################################################
+def JobShow_MakeReportStr(job):
     indentStr = "   "
-    completeReportStr = ""
-    csvLineReport = ""
 
     # Extract the results we will report.
     jobNameStr = job.GetTrainingParamStr("JobName", "")
@@ -67,95 +181,170 @@ def JobShow_WriteReport(job, fileType, filePathName):
     lrStr = job.GetTrainingParamStr("LearningRate", "0.1")
     jobStatus, errCode, errorMsg = job.GetJobStatus()
 
-    avgLossStr = ""
+    # Read each job value once, rather than calling the getters again in every branch.
+    bucketMinValue = job.GetResultValMinValue()
+    bucketSize = job.GetResultValBucketSize()
+    numSequencesTrainedPerEpoch = job.GetNumSequencesTrainedPerEpoch()
+    numSequencesTested = job.GetNumSequencesTested()
+    testNumItemsPerClass = job.GetTestNumItemsPerClass()
+    testNumPredictionsPerClass = job.GetTestNumPredictionsPerClass()
+    testNumCorrectPerClass = job.GetTestNumCorrectPerClass()
+
+    # Each part of the report is collected in a list and joined once at the end,
+    # rather than growing a string with repeated concatenation.
+    avgLossPartList = []
     lossList = job.GetAvgLossPerEpochList()
     for avgLoss in lossList:
         avgLoss = round(avgLoss, 4)
-        avgLossStr = avgLossStr + " " + str(avgLoss)
-
-    trainResultGroupBucketsizeStr = ""
-    if (job.GetNumSequencesTrainedPerEpoch() > 0):
-        bucketNum = 0
-        bucketStartValue = job.GetResultValMinValue()
-        bucketStopValue = bucketStartValue + job.GetResultValBucketSize()
-        for numItems in job.GetTrainNumItemsPerClass():
-            bucketStartValue = round(bucketStartValue, 2)
-            bucketStopValue = round(bucketStopValue, 2)
-
-            trainResultGroupBucketsizeStr += indentStr + indentStr
-            trainResultGroupBucketsizeStr += "[" + str(bucketStartValue) + " - " + str(bucketStopValue) + "]:    " 
-            trainResultGroupBucketsizeStr += str(numItems) + NEWLINE_STR
-
-            bucketNum += 1
-            bucketStartValue += job.GetResultValBucketSize()
-            bucketStopValue += job.GetResultValBucketSize()
-        # End - for numItems in job.GetTrainNumItemsPerClass():
-    # End - if (job.GetNumSequencesTrainedPerEpoch() > 0):
-
-    csvLineReport = lrStr
+        avgLossPartList.append(f" {avgLoss}")
+    avgLossStr = "".join(avgLossPartList)
+
+    # The training and test buckets use the same edges, so compute the rounded
+    # edges once for the longer of the two lists.
+    trainNumItemsPerClass = job.GetTrainNumItemsPerClass()
+    numClasses = len(testNumItemsPerClass)
+    bucketStartList, bucketStopList = JobShow_GetBucketEdges(bucketMinValue, bucketSize, 
+                                                    max(len(trainNumItemsPerClass), numClasses))
+
+    trainResultGroupBucketsizePartList = []
+    if (numSequencesTrainedPerEpoch > 0):
+        for bucketNum, numItems in enumerate(trainNumItemsPerClass):
+            trainResultGroupBucketsizePartList.append(f"{indentStr}{indentStr}[{bucketStartList[bucketNum]} - "
+                        f"{bucketStopList[bucketNum]}]:    {numItems}{NEWLINE_STR}")
+        # End - for bucketNum, numItems in enumerate(trainNumItemsPerClass):
+    # End - if (numSequencesTrainedPerEpoch > 0):
+    trainResultGroupBucketsizeStr = "".join(trainResultGroupBucketsizePartList)
+
+    testResultPartList, _ = JobShow_GetTestSummary(job)
+    testResultPartList.append(NEWLINE_STR)
+    testResultStr = "".join(testResultPartList)
+
+    testPredictionPerBucketPartList = []
+    testActualAndCorrectPerBucketPartList = []
+    if (numSequencesTested > 0):
+        for index in range(numClasses):
+            numItems = testNumItemsPerClass[index]
+            numPredictions = testNumPredictionsPerClass[index]
+            numCorrectItems = testNumCorrectPerClass[index]
+
+            bucketNameStr = f"{indentStr}{indentStr}[{bucketStartList[index]} - {bucketStopList[index]}]:    "
+            testPredictionPerBucketPartList.append(f"{bucketNameStr}{numPredictions}{NEWLINE_STR}")
+            testActualAndCorrectPerBucketPartList.append(
+                        f"{bucketNameStr}{numItems} ({numCorrectItems} correct){NEWLINE_STR}")
+        # End - for index in range(numClasses):
+    # End - if (numSequencesTested > 0):
+    testPredictionPerBucketStr = "".join(testPredictionPerBucketPartList)
+    testActualAndCorrectPerBucketStr = "".join(testActualAndCorrectPerBucketPartList)
+
+
+    reportPartList = [f"{NEWLINE_STR}{NEWLINE_STR}=========================================================={NEWLINE_STR}"]
+    if (jobNameStr != ""):
+        reportPartList.append(f"{jobNameStr}{NEWLINE_STR}")
+    reportPartList.append(f"Inputs: {inputStr}{NEWLINE_STR}")
+    reportPartList.append(f"Result: {resultStr}{NEWLINE_STR}")
+    reportPartList.append(f"Learning Rate: {lrStr}{NEWLINE_STR}")
+    reportPartList.append(NEWLINE_STR)
+
+    reportPartList.append(f"Training Results:{NEWLINE_STR}")
+    reportPartList.append(f"{RESULT_SECTION_SEPARATOR_STR}{NEWLINE_STR}")
+    reportPartList.append(f"Data Sequences per Epoch:  {numSequencesTrainedPerEpoch}{NEWLINE_STR}")
+
+    reportPartList.append(f"Patients Trained per Epoch: {job.GetNumPatientsTrainedPerEpoch()}{NEWLINE_STR}")
+    reportPartList.append(f"Patients Skipped per Epoch: {job.GetNumPatientsSkippedPerEpoch()}{NEWLINE_STR}")
+
+    if (numSequencesTrainedPerEpoch > 0):
+        reportPartList.append(f"Average Losses Per Epoch: {avgLossStr}{NEWLINE_STR}")
+        reportPartList.append(f"Num Items in Each Class:{NEWLINE_STR}{trainResultGroupBucketsizeStr}{NEWLINE_STR}")
+
+    reportPartList.append(f"{NEWLINE_STR}Test Results:{NEWLINE_STR}")
+    reportPartList.append(f"{RESULT_SECTION_SEPARATOR_STR}{NEWLINE_STR}")
+    reportPartList.append(f"Num Sequences Tested: {numSequencesTested}{NEWLINE_STR}")
+
+    if (numSequencesTested > 0):
+        # Do not show the num predictions if this is a logistic.
+        if (not job.GetIsLogisticNetwork()):
+            reportPartList.append(f"Num Predictions for Each Class: {NEWLINE_STR}{testPredictionPerBucketStr}")
+        reportPartList.append(f"Num Items in Each Class: {NEWLINE_STR}{testActualAndCorrectPerBucketStr}")
+    # End - if (numSequencesTested > 0):
+
+    reportPartList.append(f"{NEWLINE_STR}{testResultStr}{NEWLINE_STR}")
+
+    reportPartList.append(f"Job Status: {jobStatus}{NEWLINE_STR}")
+    reportPartList.append(f"Err Code: {errCode}  ({errorMsg}){NEWLINE_STR}")
+    reportPartList.append(f"Start Time: {job.GetStartRequestTimeStr()}{NEWLINE_STR}")
+    reportPartList.append(f"Stop Time: {job.GetStopRequestTimeStr()}{NEWLINE_STR}")
+    reportPartList.append(f"============================{NEWLINE_STR}")
+
+    return "".join(reportPartList)
+# End - JobShow_MakeReportStr
+
+
+
+
+
+#####################################################
+#
+# [JobShow_MakeCSVLine]
+#
+# Returns one line for MLJOB_LEARNING_RATE_CSV_REPORT, without the newline.
+#####################################################
+def JobShow_MakeCSVLine(job):
+    csvFieldList = [job.GetTrainingParamStr("LearningRate", "0.1")]
+
+    _, testSummaryFieldList = JobShow_GetTestSummary(job)
+    csvFieldList.extend(testSummaryFieldList)
+
+    if (job.GetNumSequencesTested() > 0):
+        for numCorrectItems in job.GetTestNumCorrectPerClass()[:len(job.GetTestNumItemsPerClass())]:
+            csvFieldList.append(f"{numCorrectItems}")
+    # End - if (job.GetNumSequencesTested() > 0):
+
+    return ", ".join(csvFieldList)
+# End - JobShow_MakeCSVLine
+
+
+
+
+
+#####################################################
+#
+# [JobShow_GetTestSummary]
+#
+# Returns the summary of the test results that depends on the type of the result.
+# This is a list of lines for the text report, and a list of fields for the CSV report.
+#####################################################
+def JobShow_GetTestSummary(job):
+    testResultPartList = []
+    csvFieldList = []
+
+    resultValueType = job.GetResultValueType()
     numSequencesTested = job.GetNumSequencesTested()
     testResults = job.GetTestResults()
     testNumItemsPerClass = job.GetTestNumItemsPerClass()
 
-
     #########################
-    testResultStr = ""
-    if (((job.GetResultValueType() == tdf.TDF_DATA_TYPE_INT) or (job.GetResultValueType() == tdf.TDF_DATA_TYPE_FLOAT)) 
+    if (((resultValueType == tdf.TDF_DATA_TYPE_INT) or (resultValueType == tdf.TDF_DATA_TYPE_FLOAT)) 
             and (numSequencesTested > 0)):
-        csvLineReport += ", " + str(numSequencesTested)
-
-        percentAccurate = float(testResults["NumCorrectPredictions"]) / float(numSequencesTested)
-        percentAccurate = percentAccurate * 100.0
-        fractionInt = round(percentAccurate)
-        testResultStr += "Exact Accuracy: " + str(fractionInt) + "%" + NEWLINE_STR
-        csvLineReport += ", " + str(fractionInt)
-
-        percentAccurate = float(testResults["NumPredictionsWithin2Percent"]) / float(numSequencesTested)
-        percentAccurate = percentAccurate * 100.0
-        fractionInt = round(percentAccurate)
-        testResultStr += "Within 2 percent Accuracy: " + str(fractionInt) + "%" + NEWLINE_STR
-        csvLineReport += ", " + str(fractionInt)
-
-        percentAccurate = float(testResults["NumPredictionsWithin5Percent"]) / float(numSequencesTested)
-        percentAccurate = percentAccurate * 100.0
-        fractionInt = round(percentAccurate)
-        testResultStr += "Within 5 percent Accuracy: " + str(fractionInt) + "%" + NEWLINE_STR
-        csvLineReport += ", " + str(fractionInt)
-
-        percentAccurate = float(testResults["NumPredictionsWithin10Percent"]) / float(numSequencesTested)
-        percentAccurate = percentAccurate * 100.0
-        fractionInt = round(percentAccurate)
-        testResultStr += "Within 10 percent Accuracy: " + str(fractionInt) + "%" + NEWLINE_STR
-        csvLineReport += ", " + str(fractionInt)
-
-        percentAccurate = float(testResults["NumPredictionsWithin20Percent"]) / float(numSequencesTested)
-        percentAccurate = percentAccurate * 100.0
-        fractionInt = round(percentAccurate)
-        testResultStr += "Within 20 percent Accuracy: " + str(fractionInt) + "%" + NEWLINE_STR
-        csvLineReport += ", " + str(fractionInt)
-
-        percentAccurate = float(testResults["NumPredictionsWithin50Percent"]) / float(numSequencesTested)
-        percentAccurate = percentAccurate * 100.0
-        fractionInt = round(percentAccurate)
-        testResultStr += "Within 50 percent Accuracy: " + str(fractionInt) + "%" + NEWLINE_STR
-        csvLineReport += ", " + str(fractionInt)
-
-        percentAccurate = float(testResults["NumPredictionsWithin100Percent"]) / float(numSequencesTested)
-        percentAccurate = percentAccurate * 100.0
-        fractionInt = round(percentAccurate)
-        testResultStr += "Within 100 percent Accuracy: " + str(fractionInt) + "%" + NEWLINE_STR
-        csvLineReport += ", " + str(fractionInt)
+        csvFieldList.append(f"{numSequencesTested}")
+
+        for labelStr, resultName in JOBSHOW_ACCURACY_REPORT_LIST:
+            percentAccurate = (testResults[resultName] / numSequencesTested) * 100.0
+            fractionInt = round(percentAccurate)
+            testResultPartList.append(f"{labelStr}: {fractionInt}%{NEWLINE_STR}")
+            csvFieldList.append(f"{fractionInt}")
+        # End - for labelStr, resultName in JOBSHOW_ACCURACY_REPORT_LIST:
 
     #########################
-    elif ((job.GetResultValueType() == tdf.TDF_DATA_TYPE_FUTURE_EVENT_CLASS) and (numSequencesTested > 0)):
-        totalNumItems = 0
-        for classNum in range(tdf.TDF_NUM_FUTURE_EVENT_CATEGORIES):
-            totalNumItems += testNumItemsPerClass[classNum]
-        # End - for classNum in range(tdf.TDF_NUM_FUTURE_EVENT_CATEGORIES):
+    elif ((resultValueType == tdf.TDF_DATA_TYPE_FUTURE_EVENT_CLASS) and (numSequencesTested > 0)):
+        numCorrectPredictions = testResults["NumCorrectPredictions"]
+        numPredictionsWithin1Class = testResults["NumPredictionsWithin1Class"]
+        # testNumItemsPerClass is a list for a new job and a numpy array for a job read from a file.
+        # np.sum handles both, and keeps the element type so the report text is unchanged.
+        totalNumItems = np.sum(testNumItemsPerClass[:tdf.TDF_NUM_FUTURE_EVENT_CATEGORIES])
 
         if (totalNumItems > 0):
-            totalAcc = float(testResults["NumCorrectPredictions"]) / float(totalNumItems)
-            totalCloseAcc = float(testResults["NumPredictionsWithin1Class"]) / float(totalNumItems)
+            totalAcc = float(numCorrectPredictions) / float(totalNumItems)
+            totalCloseAcc = float(numPredictionsWithin1Class) / float(totalNumItems)
         else:
             totalAcc = 0.0
             totalCloseAcc = 0.0
@@ -166,155 +355,190 @@ def JobShow_WriteReport(job, fileType, filePathName):
         totalCloseAcc = totalCloseAcc * 100.0
         totalCloseAcc = round(totalCloseAcc, 1)
 
-        testResultStr += NEWLINE_STR + "Total Cases: " + str(totalNumItems) + NEWLINE_STR
-        testResultStr += "Total Correct: " + str(testResults["NumCorrectPredictions"]) + NEWLINE_STR
-        testResultStr += "Total Within 1 Class: " + str(testResults["NumPredictionsWithin1Class"]) + NEWLINE_STR
-        testResultStr += "Accurracy: " + str(totalAcc) + " percent" + NEWLINE_STR
-        testResultStr += "Percent Within 1 Class: " + str(totalCloseAcc) + " percent" + NEWLINE_STR
+        testResultPartList.append(f"{NEWLINE_STR}Total Cases: {totalNumItems}{NEWLINE_STR}")
+        testResultPartList.append(f"Total Correct: {numCorrectPredictions}{NEWLINE_STR}")
+        testResultPartList.append(f"Total Within 1 Class: {numPredictionsWithin1Class}{NEWLINE_STR}")
+        testResultPartList.append(f"Accurracy: {totalAcc} percent{NEWLINE_STR}")
+        testResultPartList.append(f"Percent Within 1 Class: {totalCloseAcc} percent{NEWLINE_STR}")
 
-        csvLineReport += ", " + str(totalNumItems) + ", " + str(totalAcc) + ", " + str(totalCloseAcc)
+        csvFieldList.extend((f"{totalNumItems}", f"{totalAcc}", f"{totalCloseAcc}"))
 
     #########################
-    elif ((job.GetResultValueType() == tdf.TDF_DATA_TYPE_BOOL) and (numSequencesTested > 0)):
+    elif ((resultValueType == tdf.TDF_DATA_TYPE_BOOL) and (numSequencesTested > 0)):
+        rocAUC = job.GetROCAUC()
+        auprc = job.GetAUPRC()
+        f1Score = job.GetF1Score()
+        numCorrectPredictions = testResults["NumCorrectPredictions"]
         totalNumItems = testNumItemsPerClass[0] + testNumItemsPerClass[1]
         if (totalNumItems > 0):
-            totalAcc = float(testResults["NumCorrectPredictions"]) / float(totalNumItems)
+            totalAcc = float(numCorrectPredictions) / float(totalNumItems)
         else:
             totalAcc = 0.0
         totalAcc = totalAcc * 100.0
         totalAcc = round(totalAcc, 1)
-        testResultStr += NEWLINE_STR + "Total Cases: " + str(totalNumItems) + NEWLINE_STR
-        testResultStr += "Total Correct: " + str(testResults["NumCorrectPredictions"]) + NEWLINE_STR
-        testResultStr += "Total Accurracy: " + str(totalAcc) + " percent" + NEWLINE_STR
+        testResultPartList.append(f"{NEWLINE_STR}Total Cases: {totalNumItems}{NEWLINE_STR}")
+        testResultPartList.append(f"Total Correct: {numCorrectPredictions}{NEWLINE_STR}")
+        testResultPartList.append(f"Total Accurracy: {totalAcc} percent{NEWLINE_STR}")
 
-        csvLineReport += ", " + str(totalNumItems) + ", " + str(totalAcc)
+        csvFieldList.extend((f"{totalNumItems}", f"{totalAcc}"))
 
-        if (job.GetROCAUC() > 0):
-            roundedAUC = round(job.GetROCAUC(), 3)
-            testResultStr += "ROC AUC: " + str(roundedAUC) + NEWLINE_STR
-            csvLineReport += ", " + str(roundedAUC)
+        if (rocAUC > 0):
+            roundedAUC = round(rocAUC, 3)
+            testResultPartList.append(f"ROC AUC: {roundedAUC}{NEWLINE_STR}")
+            csvFieldList.append(f"{roundedAUC}")
         else:
-            csvLineReport += ", "
+            csvFieldList.append("")
 
-        if (job.GetAUPRC() > 0):
-            roundedAUPRC = round(job.GetAUPRC(), 3)
-            testResultStr += "AUPRC: " + str(roundedAUPRC) + NEWLINE_STR
-            csvLineReport += ", " + str(roundedAUPRC)
+        if (auprc > 0):
+            roundedAUPRC = round(auprc, 3)
+            testResultPartList.append(f"AUPRC: {roundedAUPRC}{NEWLINE_STR}")
+            csvFieldList.append(f"{roundedAUPRC}")
         else:
-            csvLineReport += ", "
+            csvFieldList.append("")
 
-        if (job.GetF1Score() > 0):
-            roundedF1Score = round(job.GetF1Score(), 3)
-            testResultStr += "F1Score: " + str(roundedF1Score) + NEWLINE_STR
-            csvLineReport += ", " + str(roundedF1Score)
+        if (f1Score > 0):
+            roundedF1Score = round(f1Score, 3)
+            testResultPartList.append(f"F1Score: {roundedF1Score}{NEWLINE_STR}")
+            csvFieldList.append(f"{roundedF1Score}")
         else:
-            csvLineReport += ", "
-    # End - elif ((job.GetResultValueType() == tdf.TDF_DATA_TYPE_BOOL) and (numSequencesTested > 0)):
+            csvFieldList.append("")
+    # End - elif ((resultValueType == tdf.TDF_DATA_TYPE_BOOL) and (numSequencesTested > 0)):
 
+    return testResultPartList, csvFieldList
+# End - JobShow_GetTestSummary
 
 
-    testResultStr += NEWLINE_STR
-    testPredictionPerBucketStr = ""
-    testActualAndCorrectPerBucketStr = ""
-    testNumPredictionsPerClass = job.GetTestNumPredictionsPerClass()
-    testNumCorrectPerClass = job.GetTestNumCorrectPerClass()
-    if (numSequencesTested > 0):
-        bucketStartValue = job.GetResultValMinValue()
-        bucketStopValue = bucketStartValue + job.GetResultValBucketSize()
-        numClasses = len(testNumItemsPerClass)
-        for index in range(numClasses):
-            numItems = testNumItemsPerClass[index]
-            numPredictions = testNumPredictionsPerClass[index]
-            numCorrectItems = testNumCorrectPerClass[index]
 
-            bucketStartValue = round(bucketStartValue, 2)
-            bucketStopValue = round(bucketStopValue, 2)
 
-            testPredictionPerBucketStr += indentStr + indentStr + "[" + str(bucketStartValue) + " - " + str(bucketStopValue) + "]:    " 
-            testPredictionPerBucketStr += str(numPredictions) + NEWLINE_STR
 
-            testActualAndCorrectPerBucketStr += indentStr + indentStr + "[" + str(bucketStartValue) + " - " + str(bucketStopValue) + "]:    " 
-            testActualAndCorrectPerBucketStr += str(numItems) + " (" + str(numCorrectItems) + " correct)" + NEWLINE_STR
+#####################################################
+#
+# [JobShow_GetBucketEdges]
+#
+# Returns the start and stop values of each result bucket, rounded to 2 places,
+# as two lists of Python floats.
+# Each edge is the previous rounded edge plus the bucket size, then rounded again.
+# This is what the reports have always printed, and it differs from rounding
+# minValue + (k * bucketSize) whenever the rounding error adds up.
+#####################################################
+def JobShow_GetBucketEdges(minValue, bucketSize, numBuckets):
+    bucketStartList = [0.0] * numBuckets
+    bucketStopList = [0.0] * numBuckets
+    bucketStartValue = minValue
+    bucketStopValue = minValue + bucketSize
+    for bucketNum in range(numBuckets):
+        bucketStartValue = round(bucketStartValue, 2)
+        bucketStopValue = round(bucketStopValue, 2)
+        bucketStartList[bucketNum] = bucketStartValue
+        bucketStopList[bucketNum] = bucketStopValue
+
+        bucketStartValue += bucketSize
+        bucketStopValue += bucketSize
+    # End - for bucketNum in range(numBuckets):
+
+    return bucketStartList, bucketStopList
+# End - JobShow_GetBucketEdges
 
-            csvLineReport += ", " + str(numCorrectItems)
 
-            bucketStartValue += job.GetResultValBucketSize()
-            bucketStopValue += job.GetResultValBucketSize()
-        # End - for numItems in job.GetTrainNumItemsPerClass():
-    # End - if (numSequencesTested > 0):
 
 
-    completeReportStr = NEWLINE_STR + NEWLINE_STR + "==========================================================" + NEWLINE_STR
-    if (jobNameStr != ""):
-        completeReportStr += jobNameStr + NEWLINE_STR
-    completeReportStr += "Inputs: " + inputStr + NEWLINE_STR
-    completeReportStr += "Result: " + resultStr + NEWLINE_STR
-    completeReportStr += "Learning Rate: " + lrStr + NEWLINE_STR
-    completeReportStr += NEWLINE_STR
 
-    completeReportStr += "Training Results:" + NEWLINE_STR
-    completeReportStr += RESULT_SECTION_SEPARATOR_STR + NEWLINE_STR
-    completeReportStr += "Data Sequences per Epoch:  " + str(job.GetNumSequencesTrainedPerEpoch()) + NEWLINE_STR
+#####################################################
+#
+# [JobShow_GetReportFile]
+#
+# Returns the open, buffered file handle for a report file, opening it the
+# first time it is used.
+#####################################################
+def JobShow_GetReportFile(filePathName):
+    fileH = g_OpenReportFileDict.get(filePathName)
+    if (fileH is None):
+        fileH = open(filePathName, "a", buffering=REPORT_FILE_BUFFER_SIZE)
+        g_OpenReportFileDict[filePathName] = fileH
+
+    return fileH
+# End - JobShow_GetReportFile
 
-    completeReportStr += "Patients Trained per Epoch: " + str(job.GetNumPatientsTrainedPerEpoch()) + NEWLINE_STR
-    completeReportStr += "Patients Skipped per Epoch: " + str(job.GetNumPatientsSkippedPerEpoch()) + NEWLINE_STR
 
-    if (job.GetNumSequencesTrainedPerEpoch() > 0):
-        completeReportStr += "Average Losses Per Epoch: " + avgLossStr + NEWLINE_STR
-        completeReportStr += "Num Items in Each Class:" + NEWLINE_STR + trainResultGroupBucketsizeStr + NEWLINE_STR
 
-    completeReportStr += NEWLINE_STR + "Test Results:" + NEWLINE_STR 
-    completeReportStr += RESULT_SECTION_SEPARATOR_STR + NEWLINE_STR
-    completeReportStr += "Num Sequences Tested: " + str(numSequencesTested) + NEWLINE_STR
 
-    if (numSequencesTested > 0):
-        # Do not show the num predictions if this is a logistic.
-        if (not job.GetIsLogisticNetwork()):
-            completeReportStr += "Num Predictions for Each Class: " + NEWLINE_STR + testPredictionPerBucketStr 
-        completeReportStr += "Num Items in Each Class: " + NEWLINE_STR + testActualAndCorrectPerBucketStr 
-    # End - if (numSequencesTested > 0):
 
-    completeReportStr += NEWLINE_STR + testResultStr + NEWLINE_STR
+#####################################################
+#
+# [JobShow_SetBadReportPath]
+#
+#####################################################
+def JobShow_SetBadReportPath(filePathName, err):
+    g_BadReportPathSet.add(filePathName)
+    sys.stderr.write("JobShow: Cannot write report file [" + filePathName + "]: " + str(err) + NEWLINE_STR)
+# End - JobShow_SetBadReportPath
 
-    completeReportStr += "Job Status: " + str(jobStatus) + NEWLINE_STR
-    completeReportStr += "Err Code: " + str(errCode) + "  (" + str(errorMsg) + ")" + NEWLINE_STR
-    completeReportStr += "Start Time: " + job.GetStartRequestTimeStr() + NEWLINE_STR
-    completeReportStr += "Stop Time: " + job.GetStopRequestTimeStr() + NEWLINE_STR
-    completeReportStr += "============================" + NEWLINE_STR
 
 
-    ########################
-    if (fileType == MLJOB_CONSOLE_REPORT):
-        print(completeReportStr)
-    ########################
-    elif (fileType == MLJOB_FILE_REPORT):
-        try:
-            fileH = open(filePathName, "a+")
-            fileH.write(completeReportStr)
-            fileH.flush()
-            fileH.close()
-        except Exception:
-            pass
-    ########################
-    elif (fileType == MLJOB_LOG_REPORT):
-        try:
-            fileH = open(filePathName, "a+")
-            fileH.write(completeReportStr)
-            fileH.flush()
-            fileH.close()
-        except Exception:
-            pass 
-    ########################
-    elif (fileType == MLJOB_LEARNING_RATE_CSV_REPORT):
-        fullLineStr = csvLineReport + NEWLINE_STR
+
+
+#####################################################
+#
+# [JobShow_WriteCSVBuffer]
+#
+#####################################################
+def JobShow_WriteCSVBuffer(filePathName, csvBuffer):
+    try:
+        fileH = JobShow_GetReportFile(filePathName)
+        fileH.write("".join(csvBuffer[0]))
+    except OSError as err:
+        JobShow_SetBadReportPath(filePathName, err)
+
+    csvBuffer[0] = []
+    csvBuffer[1] = 0
+# End - JobShow_WriteCSVBuffer
+
+
+
+
+
+#####################################################
+#
+# [JobShow_FlushCSVBuffers]
+#
+# Writes all buffered CSV report rows to their files. Call this at the end
+# of a sweep, so the CSV file is complete on disk.
+#####################################################
+def JobShow_FlushCSVBuffers():
+    for filePathName, csvBuffer in g_CSVBufferDict.items():
+        if (len(csvBuffer[0]) > 0):
+            JobShow_WriteCSVBuffer(filePathName, csvBuffer)
+            fileH = g_OpenReportFileDict.get(filePathName)
+            if (fileH is not None):
+                fileH.flush()
+    # End - for filePathName, csvBuffer in g_CSVBufferDict.items():
+# End - JobShow_FlushCSVBuffers
+
+
+
+
+
+#####################################################
+#
+# [JobShow_CloseReports]
+#
+# Writes out and closes every open report file. This runs automatically
+# at exit, but call it directly to read a report file before then.
+#####################################################
+def JobShow_CloseReports():
+    JobShow_FlushCSVBuffers()
+
+    for fileH in g_OpenReportFileDict.values():
         try:
-            fileH = open(filePathName, "a+")
-            fileH.write(fullLineStr)
-            fileH.flush()
             fileH.close()
         except Exception:
             pass
-# End - JobShow_WriteReport
+    # End - for fileH in g_OpenReportFileDict.values():
+
+    g_OpenReportFileDict.clear()
+# End - JobShow_CloseReports
+
+atexit.register(JobShow_CloseReports)
 
 
 
@@ -328,39 +552,45 @@ def JobShow_WriteReport(job, fileType, filePathName):
 # 
 #####################################################
 def JobShow_DrawROCCurves(job, fROC, fPRC, titleStr, showInGUI, filePath):
-    logisticResultsTrueValueList = job.GetLogisticResultsTrueValueList()
-    logisticResultsPredictedProbabilityList = job.GetLogisticResultsPredictedProbabilityList()
+    # Convert the results to numpy arrays once. Otherwise sklearn converts and
+    # checks the Python lists again in every call.
+    trueValueArray = np.asarray(job.GetLogisticResultsTrueValueList(), dtype=np.int8)
+    predictedProbabilityArray = np.asarray(job.GetLogisticResultsPredictedProbabilityList(), dtype=np.float64)
+
+    # Use a figure of our own and close it when done. Drawing on the global pyplot
+    # figure leaves every plot in memory when this is called for many jobs.
+    fig, ax = plt.subplots()
 
     ####################################
     # plot the precision-recall curves
     if (fPRC):
-        PrecisionResults, RecallResults, _ = precision_recall_curve(logisticResultsTrueValueList, 
-                                    logisticResultsPredictedProbabilityList)
-        plt.plot(RecallResults, PrecisionResults, marker='.', label='Logistic')
+        PrecisionResults, RecallResults, _ = precision_recall_curve(trueValueArray, predictedProbabilityArray)
+        ax.plot(RecallResults, PrecisionResults, marker='.', label='Logistic')
         # axis labels
-        plt.xlabel('Recall')
-        plt.ylabel('Precision')
-        plt.legend()
+        ax.set_xlabel('Recall')
+        ax.set_ylabel('Precision')
+        ax.legend()
     ####################################
     # plot the roc curve for the model
     elif (fROC):
-        falsePositiveRateCurve, truePositiveRateCurve, _ = roc_curve(logisticResultsTrueValueList, 
-                                                    logisticResultsPredictedProbabilityList)
-        plt.plot(falsePositiveRateCurve, truePositiveRateCurve, marker='.', label='Logistic')
+        falsePositiveRateCurve, truePositiveRateCurve, _ = roc_curve(trueValueArray, predictedProbabilityArray)
+        ax.plot(falsePositiveRateCurve, truePositiveRateCurve, marker='.', label='Logistic')
         # axis labels
-        plt.xlabel('False Positive Rate')
-        plt.ylabel('True Positive Rate')
+        ax.set_xlabel('False Positive Rate')
+        ax.set_ylabel('True Positive Rate')
         # show the legend
-        plt.legend()
+        ax.legend()
 
     if ((titleStr is not None) and (titleStr != "")):
-        plt.title(titleStr)
+        ax.set_title(titleStr)
 
     if ((filePath is not None) and (filePath != "")):
-        plt.savefig(filePath)
+        fig.savefig(filePath)
 
     if (showInGUI):
         plt.show()
+
+    plt.close(fig)
 # End - JobShow_DrawROCCurves
 
 
@@ -369,6 +599,171 @@ def JobShow_DrawROCCurves(job, fROC, fPRC, titleStr, showInGUI, filePath):
 
 
 
+################################################################################
+#
+# GetJobValue handlers
+#
+# Each handler is called as handler(job, valueIndex, numSequencesTested, testResults)
+# and returns the value, or None if the value does not apply to this job.
+# Handlers are grouped by the result value type they apply to, so a handler
+# does not check the result type itself.
+#
+################################################################################
+def JobShowValue_NetworkType(job, valueIndex, numSequencesTested, testResults):
+    return job.GetNetworkType()
+
+def JobShowValue_InputNames(job, valueIndex, numSequencesTested, testResults):
+    return job.GetNetworkInputVarNames()
+
+def JobShowValue_OutputNames(job, valueIndex, numSequencesTested, testResults):
+    return job.GetNetworkOutputVarName()
+
+def JobShowValue_LearningRate(job, valueIndex, numSequencesTested, testResults):
+    lrStr = job.GetTrainingParamStr("LearningRate", "0.1")
+    return float(lrStr)
+
+def JobShowValue_NumSequencesTrainedPerEpoch(job, valueIndex, numSequencesTested, testResults):
+    return job.GetNumSequencesTrainedPerEpoch()
+
+def JobShowValue_NumSequencesTested(job, valueIndex, numSequencesTested, testResults):
+    return numSequencesTested
+
+def JobShowValue_FinalLoss(job, valueIndex, numSequencesTested, testResults):
+    lossList = job.GetAvgLossPerEpochList()
+    lastLoss = lossList[len(lossList) - 1]
+    return round(lastLoss, 4)
+
+#########################
+# BOOL and FUTURE_EVENT_CLASS results
+def JobShowValue_PercentCorrect(job, valueIndex, numSequencesTested, testResults):
+    if (numSequencesTested <= 0):
+        return None
+    totalAcc = float(testResults["NumCorrectPredictions"]) / float(numSequencesTested)
+    return round((totalAcc * 100.0), 1)
+
+#########################
+# BOOL results
+def JobShowValue_AUC(job, valueIndex, numSequencesTested, testResults):
+    if (numSequencesTested <= 0):
+        return None
+    rocAUC = job.GetROCAUC()
+    if (rocAUC <= 0):
+        return None
+    return round(rocAUC, 3)
+
+def JobShowValue_AUPRC(job, valueIndex, numSequencesTested, testResults):
+    if (numSequencesTested <= 0):
+        return None
+    auprc = job.GetAUPRC()
+    if (auprc <= 0):
+        return None
+    return round(auprc, 3)
+
+def JobShowValue_F1(job, valueIndex, numSequencesTested, testResults):
+    if (numSequencesTested <= 0):
+        return None
+    f1Score = job.GetF1Score()
+    if (f1Score <= 0):
+        return None
+    return round(f1Score, 3)
+
+#########################
+# FUTURE_EVENT_CLASS results
+def JobShowValue_PercentClose(job, valueIndex, numSequencesTested, testResults):
+    if (numSequencesTested <= 0):
+        return None
+    totalCloseAcc = float(testResults["NumPredictionsWithin1Class"]) / float(numSequencesTested)
+    return round((totalCloseAcc * 100.0), 1)
+
+#########################
+# INT and FLOAT results
+
+# The count for each percent bucket does not include the closer buckets, so the 
+# number within N percent is the sum of the counts for every bucket up to N.
+def JobShowGetPercentAccurateWithin(testResults, numSequencesTested, percentIndex):
+    lastBucketNum = JOBSHOW_PERCENT_BUCKET_NUM_BY_INDEX[percentIndex]
+    totalCorrect = 0.0
+    for label, resultName in JOBSHOW_ACCURACY_REPORT_LIST[:lastBucketNum + 1]:
+        totalCorrect += float(testResults[resultName])
+    resultValue = totalCorrect / float(numSequencesTested)
+    return round(resultValue * 100.0)
+
+def JobShowValue_AccurateWithin10Percent(job, valueIndex, numSequencesTested, testResults):
+    return JobShowGetPercentAccurateWithin(testResults, numSequencesTested, 10)
+
+def JobShowValue_AccurateWithin20Percent(job, valueIndex, numSequencesTested, testResults):
+    return JobShowGetPercentAccurateWithin(testResults, numSequencesTested, 20)
+
+def JobShowValue_PercentInBucket(job, valueIndex, numSequencesTested, testResults):
+    resultName = JOBSHOW_PERCENT_RESULT_NAME_BY_INDEX.get(valueIndex)
+    if (resultName is None):
+        return None
+    # Older jobs may not record the 10 percent count.
+    if ((valueIndex == 10) 
+            and (("NumPredictionsWithin10Percent" not in testResults) or (numSequencesTested <= 0))):
+        return 0
+    resultValue = float(testResults[resultName]) / float(numSequencesTested)
+    return round(resultValue * 100.0)
+
+
+# The valueIndex of "PercentAccurate" for INT and FLOAT results, in the order
+# of the buckets in JOBSHOW_ACCURACY_REPORT_LIST.
+JOBSHOW_PERCENT_INDEX_LIST = (1, 2, 5, 10, 20, 50, 100)
+
+# Maps each valueIndex to its position in JOBSHOW_ACCURACY_REPORT_LIST.
+JOBSHOW_PERCENT_BUCKET_NUM_BY_INDEX = {percentIndex: bucketNum 
+                        for bucketNum, percentIndex in enumerate(JOBSHOW_PERCENT_INDEX_LIST)}
+
+# Maps each valueIndex to the name of its count in the job test results.
+JOBSHOW_PERCENT_RESULT_NAME_BY_INDEX = {percentIndex: JOBSHOW_ACCURACY_REPORT_LIST[bucketNum][1]
+                        for percentIndex, bucketNum in JOBSHOW_PERCENT_BUCKET_NUM_BY_INDEX.items()}
+
+# Each of these maps a lower-case value name to its handler.
+# These values apply to every job.
+JOBSHOW_COMMON_VALUE_HANDLER_DICT = {
+    "networktype": JobShowValue_NetworkType,
+    "inputnames": JobShowValue_InputNames,
+    "outputnames": JobShowValue_OutputNames,
+    "learningrate": JobShowValue_LearningRate,
+    "numsequencestrainedperepoch": JobShowValue_NumSequencesTrainedPerEpoch,
+    "numsequencestested": JobShowValue_NumSequencesTested,
+    "finalloss": JobShowValue_FinalLoss,
+}
+
+JOBSHOW_BOOL_VALUE_HANDLER_DICT = {
+    **JOBSHOW_COMMON_VALUE_HANDLER_DICT,
+    "accuracy": JobShowValue_PercentCorrect,
+    "auc": JobShowValue_AUC,
+    "auprc": JobShowValue_AUPRC,
+    "f1": JobShowValue_F1,
+    "percentaccurate": JobShowValue_PercentCorrect,
+}
+
+JOBSHOW_CLASS_VALUE_HANDLER_DICT = {
+    **JOBSHOW_COMMON_VALUE_HANDLER_DICT,
+    "percentaccurate": JobShowValue_PercentCorrect,
+    "percentclose": JobShowValue_PercentClose,
+}
+
+# The spelling "accurrate" is kept because callers use it.
+JOBSHOW_NUMBER_VALUE_HANDLER_DICT = {
+    **JOBSHOW_COMMON_VALUE_HANDLER_DICT,
+    "accurratewithin10percent": JobShowValue_AccurateWithin10Percent,
+    "accurratewithin20percent": JobShowValue_AccurateWithin20Percent,
+    "percentaccurate": JobShowValue_PercentInBucket,
+}
+
+# Maps each result value type to its handlers. INT and FLOAT share one dict.
+JOBSHOW_VALUE_HANDLERS_BY_TYPE = {
+    tdf.TDF_DATA_TYPE_BOOL: JOBSHOW_BOOL_VALUE_HANDLER_DICT,
+    tdf.TDF_DATA_TYPE_FUTURE_EVENT_CLASS: JOBSHOW_CLASS_VALUE_HANDLER_DICT,
+    tdf.TDF_DATA_TYPE_INT: JOBSHOW_NUMBER_VALUE_HANDLER_DICT,
+    tdf.TDF_DATA_TYPE_FLOAT: JOBSHOW_NUMBER_VALUE_HANDLER_DICT,
+}
+
+
+
+
 ################################################################################
 #
 # [GetJobValue]
@@ -396,145 +791,22 @@ def JobShow_DrawROCCurves(job, fROC, fPRC, titleStr, showInGUI, filePath):
 ################################################################################
 def GetJobValue(job, valueName, valueIndex):
     fDebug = False
-    resultValue = None
 
     numSequencesTested = job.GetNumSequencesTested()
     testResults = job.GetTestResults()
+    resultValueType = job.GetResultValueType()
     if (fDebug):
         print("valueName = " + str(valueName))
         print("numSequencesTested = " + str(numSequencesTested))
-        print("job.GetResultValueType() = " + str(job.GetResultValueType()))
+        print("job.GetResultValueType() = " + str(resultValueType))
         print("job.GetROCAUC() = " + str(job.GetROCAUC()))
 
+    handlerDict = JOBSHOW_VALUE_HANDLERS_BY_TYPE.get(resultValueType, JOBSHOW_COMMON_VALUE_HANDLER_DICT)
+    handlerFunction = handlerDict.get(valueName.lower())
+    if (handlerFunction is None):
+        return None
 
-    valueName = valueName.lower()
-    #########################
-    if (valueName == "networktype"):
-        return job.GetNetworkType()
-    #########################
-    elif (valueName == "inputnames"):
-        return job.GetNetworkInputVarNames()
-    #########################
-    elif (valueName == "outputnames"):
-        return job.GetNetworkOutputVarName()
-    #########################
-    elif (valueName == "learningrate"):
-        lrStr = job.GetTrainingParamStr("LearningRate", "0.1")
-        return float(lrStr)
-    #########################
-    elif (valueName == "numsequencestrainedperepoch"):
-        return job.GetNumSequencesTrainedPerEpoch()
-    #########################
-    elif (valueName == "numsequencestested"):
-        return numSequencesTested
-    #########################
-    elif (valueName == "finalloss"):
-        lossList = job.GetAvgLossPerEpochList()
-        lastLoss = lossList[len(lossList) - 1]
-        return round(lastLoss, 4)
-    #########################
-    elif ((valueName == "accuracy") and (job.GetResultValueType() == tdf.TDF_DATA_TYPE_BOOL) 
-            and (numSequencesTested > 0)):
-        totalAcc = float(testResults["NumCorrectPredictions"]) / float(numSequencesTested)
-        return round((totalAcc * 100.0), 1)
-    #########################
-    elif ((valueName == "auc") and (job.GetResultValueType() == tdf.TDF_DATA_TYPE_BOOL) 
-            and (numSequencesTested > 0) and (job.GetROCAUC() > 0)):
-        return round(job.GetROCAUC(), 3)
-    #########################
-    elif ((valueName == "auprc") and (job.GetResultValueType() == tdf.TDF_DATA_TYPE_BOOL) 
-            and (numSequencesTested > 0) and (job.GetAUPRC() > 0)):
-        return round(job.GetAUPRC(), 3)
-    #########################
-    elif ((valueName == "f1") and (job.GetResultValueType() == tdf.TDF_DATA_TYPE_BOOL) 
-            and (numSequencesTested > 0) and (job.GetF1Score() > 0)):
-        return round(job.GetF1Score(), 3)
-    #########################
-    elif ((valueName == "accurratewithin10percent")
-            and ((job.GetResultValueType() == tdf.TDF_DATA_TYPE_INT) 
-                or (job.GetResultValueType() == tdf.TDF_DATA_TYPE_FLOAT))):
-        totalCorrect = float(testResults["NumCorrectPredictions"])
-        totalCorrect += float(testResults["NumPredictionsWithin2Percent"])
-        totalCorrect += float(testResults["NumPredictionsWithin5Percent"])
-        totalCorrect += float(testResults["NumPredictionsWithin10Percent"])
-        resultValue = totalCorrect / float(numSequencesTested)
-        return round(resultValue * 100.0)
-    #########################
-    elif ((valueName == "accurratewithin20percent")
-            and ((job.GetResultValueType() == tdf.TDF_DATA_TYPE_INT) 
-                or (job.GetResultValueType() == tdf.TDF_DATA_TYPE_FLOAT))):
-        totalCorrect = float(testResults["NumCorrectPredictions"])
-        totalCorrect += float(testResults["NumPredictionsWithin2Percent"])
-        totalCorrect += float(testResults["NumPredictionsWithin5Percent"])
-        totalCorrect += float(testResults["NumPredictionsWithin10Percent"])
-        totalCorrect += float(testResults["NumPredictionsWithin20Percent"])
-        resultValue = totalCorrect / float(numSequencesTested)
-        return round(resultValue * 100.0)
-    #########################
-    elif ((valueName == "percentaccurate") and (valueIndex == 1)
-            and ((job.GetResultValueType() == tdf.TDF_DATA_TYPE_INT) 
-                or (job.GetResultValueType() == tdf.TDF_DATA_TYPE_FLOAT))):
-        resultValue = float(testResults["NumCorrectPredictions"]) / float(numSequencesTested)
-        return round(resultValue * 100.0)
-    #########################
-    elif ((valueName == "percentaccurate") and (valueIndex == 2) 
-        and ((job.GetResultValueType() == tdf.TDF_DATA_TYPE_INT) 
-            or (job.GetResultValueType() == tdf.TDF_DATA_TYPE_FLOAT))):
-        resultValue = float(testResults["NumPredictionsWithin2Percent"]) / float(numSequencesTested)
-        return round(resultValue * 100.0)
-    #########################
-    elif ((valueName == "percentaccurate") and (valueIndex == 5) 
-        and ((job.GetResultValueType() == tdf.TDF_DATA_TYPE_INT) 
-            or (job.GetResultValueType() == tdf.TDF_DATA_TYPE_FLOAT))):
-        resultValue = float(testResults["NumPredictionsWithin5Percent"]) / float(numSequencesTested)
-        return round(resultValue * 100.0)
-    #########################
-    elif ((valueName == "percentaccurate") and (valueIndex == 10) 
-        and ((job.GetResultValueType() == tdf.TDF_DATA_TYPE_INT) 
-            or (job.GetResultValueType() == tdf.TDF_DATA_TYPE_FLOAT))):
-        if (("NumPredictionsWithin10Percent" in testResults) and (numSequencesTested > 0)):
-            resultValue = float(testResults["NumPredictionsWithin10Percent"]) / float(numSequencesTested)
-        else:
-            resultValue = 0
-        return round(resultValue * 100.0)
-    #########################
-    elif ((valueName == "percentaccurate") and (valueIndex == 20) 
-        and ((job.GetResultValueType() == tdf.TDF_DATA_TYPE_INT) 
-            or (job.GetResultValueType() == tdf.TDF_DATA_TYPE_FLOAT))):
-        resultValue = float(testResults["NumPredictionsWithin20Percent"]) / float(numSequencesTested)
-        return round(resultValue * 100.0)
-    #########################
-    elif ((valueName == "percentaccurate") and (valueIndex == 50) 
-        and ((job.GetResultValueType() == tdf.TDF_DATA_TYPE_INT) 
-            or (job.GetResultValueType() == tdf.TDF_DATA_TYPE_FLOAT))):
-        resultValue = float(testResults["NumPredictionsWithin50Percent"]) / float(numSequencesTested)
-        return round(resultValue * 100.0)
-    #########################
-    elif ((valueName == "percentaccurate") and (valueIndex == 100) 
-        and ((job.GetResultValueType() == tdf.TDF_DATA_TYPE_INT) 
-            or (job.GetResultValueType() == tdf.TDF_DATA_TYPE_FLOAT))):
-        resultValue = float(testResults["NumPredictionsWithin100Percent"]) / float(numSequencesTested)
-        return round(resultValue * 100.0)
-    #########################
-    elif ((valueName == "percentaccurate")
-               and (job.GetResultValueType() == tdf.TDF_DATA_TYPE_FUTURE_EVENT_CLASS) 
-               and (numSequencesTested > 0)):
-        totalAcc = float(testResults["NumCorrectPredictions"]) / float(numSequencesTested)
-        return round((totalAcc * 100.0), 1)
-    #########################
-    elif ((valueName == "percentclose")
-               and (job.GetResultValueType() == tdf.TDF_DATA_TYPE_FUTURE_EVENT_CLASS) 
-               and (numSequencesTested > 0)):
-        totalCloseAcc = float(testResults["NumPredictionsWithin1Class"]) / float(numSequencesTested)
-        return round((totalCloseAcc * 100.0), 1)
-    #########################
-    elif ((valueName == "percentaccurate") 
-            and (job.GetResultValueType() == tdf.TDF_DATA_TYPE_BOOL) 
-            and (numSequencesTested > 0)):
-        totalAcc = float(testResults["NumCorrectPredictions"]) / float(numSequencesTested)
-        return round((totalAcc * 100.0), 1)
-
-    return None
+    return handlerFunction(job, valueIndex, numSequencesTested, testResults)
 # End - GetJobValue
 
 
@@ -607,6 +879,25 @@ def JobShowGetXGBoostInputWeights(job, inputNameList, numInputVars):
 
 
 
+################################################################################
+#
+# [JobShowScaleInputWeights]
+#
+# Returns a new float64 array with the absolute value of each input weight,
+# scaled so the weights add up to 1. The array passed in is not changed.
+################################################################################
+def JobShowScaleInputWeights(inputWtArray):
+    # np.abs makes the copy, so the scaling can be done in place.
+    scaledWtArray = np.abs(np.asarray(inputWtArray, dtype=np.float64))
+    scaledWtArray /= np.sum(scaledWtArray)
+
+    return scaledWtArray
+# End - JobShowScaleInputWeights
+
+
+
+
+
 ################################################################################
 #
 # [JobShow_ShowInputWeights]
@@ -616,7 +907,7 @@ def JobShow_ShowInputWeights(jobFilePathName, graphFilePath, reportFilePathName)
     fDebug = False
     err = mlJob.JOB_E_NO_ERROR
     
-    err, job = mlJob.MLJob_ReadExistingMLJob(jobFilePathName)
+    err, job = JobShow_ReadJobCached(jobFilePathName)
     if (job is None):
         print("Error. JobShow_ShowInputWeights cannot open the file: " + jobFilePathName)
         return
@@ -642,40 +933,26 @@ def JobShow_ShowInputWeights(jobFilePathName, graphFilePath, reportFilePathName)
         return
 
 
-    # Get the absolute value of all inputs
-    polarity = [1] * numInputVars
-    varInfoList = []
-    for inputNum in range(numInputVars):
-        if (inputWtArray[inputNum] < 0):
-            polarity[inputNum] = -1
-            inputWtArray[inputNum] = - inputWtArray[inputNum]
-
-        newDict = {"name": inputNameList[inputNum], "pol": polarity[inputNum], "rawWt": inputWtArray[inputNum]}
-        varInfoList.append(newDict)
-    # End - for inputNum in range(numInputVars):
-
     if (fDebug):
+        polarity = np.where(np.asarray(inputWtArray) < 0, -1, 1).astype(np.int8)
         print("JobShow_ShowInputWeights. polarity=" + str(polarity))
-        print("JobShow_ShowInputWeights. positive inputWtArray=" + str(inputWtArray))
 
-    sumOfAllWeights = np.sum(inputWtArray)
-    inputWtArray /= sumOfAllWeights
+    # Get the absolute value of all inputs, and scale them so they add up to 1
+    inputWtArray = JobShowScaleInputWeights(inputWtArray)
     if (fDebug):
-        print("JobShow_ShowInputWeights. sumOfAllWeights=" + str(sumOfAllWeights))
         print("JobShow_ShowInputWeights. SCALED inputWtArray=" + str(inputWtArray))
 
-    for inputNum in range(numInputVars):
-        varInfoList[inputNum]["wt"] = inputWtArray[inputNum]
-    # End - for inputNum in range(numInputVars):
+    # Order the inputs from largest to smallest weight. A stable sort keeps 
+    # inputs with equal weights in their original order.
+    sortedIndexArray = np.argsort(-inputWtArray[:numInputVars], kind='stable')
+    listOfWts = np.round(100.0 * inputWtArray[sortedIndexArray], 1).tolist()
+    listOfNames = [inputNameList[index] for index in sortedIndexArray]
 
-    varInfoList = sorted(varInfoList, reverse=True, key=lambda entry: entry['wt'])
-    listOfWts = [round((100.0 * x['wt']), 1) for x in varInfoList]
-    listOfNames = [x['name'] for x in varInfoList]
-
-    sumOfAllFractions = np.sum(inputWtArray)
     if (fDebug):
+        sumOfAllFractions = np.sum(inputWtArray)
         print("JobShow_ShowInputWeights. sumOfAllFractions=" + str(sumOfAllFractions))
-        print("JobShow_ShowInputWeights. varInfoList=" + str(varInfoList))
+        print("JobShow_ShowInputWeights. sortedIndexArray=" + str(sortedIndexArray))
+        print("JobShow_ShowInputWeights. sorted polarity=" + str(polarity[sortedIndexArray]))
         print("JobShow_ShowInputWeights. listOfWts=" + str(listOfWts))
         print("JobShow_ShowInputWeights. listOfNames=" + str(listOfNames))
 
@@ -710,7 +987,7 @@ def JobShow_MakeBarGraph(jobFileList, jobFileDirPathName,
         jobFilePathname = os.path.join(jobFileDirPathName, jobFileName)
 
         # Read the job
-        jobErr, job = mlJob.MLJob_ReadExistingMLJob(jobFilePathname)
+        jobErr, job = JobShow_ReadJobCached(jobFilePathname)
         if (mlJob.JOB_E_NO_ERROR != jobErr):
             continue
 
@@ -734,51 +1011,283 @@ def JobShow_MakeBarGraph(jobFileList, jobFileDirPathName,
 
 ################################################################################
 #
-# [GetMatchingJobsInDir]
+# [JobShowGetCachedJob]
 #
+# Returns the cached job for a file, or None if the file is not cached or has
+# changed since it was read.
 ################################################################################
-def GetMatchingJobsInDir(srcDirPathName, resultVarName, fIsLogistic):
-    fDebug = False
-    resultJobList = []
+def JobShowGetCachedJob(jobFilePathName, fileMTime):
+    cacheEntry = g_JobCacheDict.get(jobFilePathName)
+    if ((cacheEntry is not None) and (cacheEntry[0] == fileMTime)):
+        return cacheEntry[1]
+    return None
+# End - JobShowGetCachedJob
+
+
+
+################################################################################
+#
+# [JobShowAddCachedJob]
+#
+################################################################################
+def JobShowAddCachedJob(jobFilePathName, fileMTime, err, job):
+    global g_JobCacheDict
+
+    if (mlJob.JOB_E_NO_ERROR != err):
+        g_JobCacheDict.pop(jobFilePathName, None)
+        return
 
-    fileNameList = os.listdir(srcDirPathName)
-    for fileName in fileNameList:
-        if (fileName.endswith(".xgboost")):
+    # Drop the oldest entry when the cache is full. Dicts keep insertion order.
+    if ((jobFilePathName not in g_JobCacheDict) 
+            and (len(g_JobCacheDict) >= JOB_CACHE_MAX_ENTRIES)):
+        del g_JobCacheDict[next(iter(g_JobCacheDict))]
+    g_JobCacheDict[jobFilePathName] = (fileMTime, job)
+# End - JobShowAddCachedJob
+
+
+
+################################################################################
+#
+# [JobShow_ReadJobCached]
+#
+# This is MLJob_ReadExistingMLJob, but a job file that has not changed since
+# it was last read is not parsed again. Only successful reads are cached.
+################################################################################
+def JobShow_ReadJobCached(jobFilePathName):
+    try:
+        fileMTime = os.path.getmtime(jobFilePathName)
+    except OSError:
+        return mlJob.MLJob_ReadExistingMLJob(jobFilePathName)
+
+    job = JobShowGetCachedJob(jobFilePathName, fileMTime)
+    if (job is not None):
+        return mlJob.JOB_E_NO_ERROR, job
+
+    err, job = mlJob.MLJob_ReadExistingMLJob(jobFilePathName)
+    JobShowAddCachedJob(jobFilePathName, fileMTime, err, job)
+
+    return err, job
+# End - JobShow_ReadJobCached
+
+
+
+################################################################################
+#
+# [JobShow_ReadJobListCached]
+#
+# Like JobShow_ReadJobCached, but for a list of files. Returns a list of 
+# (err, job) in the same order as the paths.
+#
+# Files that are not cached are read on a thread pool, so the file reads 
+# overlap. The cache is only changed on this thread.
+################################################################################
+def JobShow_ReadJobListCached(jobFilePathList):
+    resultList = [None] * len(jobFilePathList)
+    readIndexList = []
+    readMTimeList = []
+
+    for index, jobFilePathName in enumerate(jobFilePathList):
+        try:
+            fileMTime = os.path.getmtime(jobFilePathName)
+        except OSError:
+            resultList[index] = mlJob.MLJob_ReadExistingMLJob(jobFilePathName)
             continue
 
-        srcFilePathName = os.path.join(srcDirPathName, fileName)
-        if (isfile(srcFilePathName)):
-            if (fDebug):
-                print("GetMatchingJobsInDir. file: " + srcFilePathName)
+        job = JobShowGetCachedJob(jobFilePathName, fileMTime)
+        if (job is not None):
+            resultList[index] = (mlJob.JOB_E_NO_ERROR, job)
+        else:
+            readIndexList.append(index)
+            readMTimeList.append(fileMTime)
+    # End - for index, jobFilePathName in enumerate(jobFilePathList):
 
-            jobErr, job = mlJob.MLJob_ReadExistingMLJob(srcFilePathName)
-            if (mlJob.JOB_E_NO_ERROR != jobErr):
-                print("Error. Invalid job found in the list of Done jobs")
-                continue
+    if (len(readIndexList) == 0):
+        return resultList
 
-            jobStatus, errCode, errorMsg = job.GetJobStatus()
-            if (mlJob.MLJOB_STATUS_DONE == jobStatus):
-                pass
-                #print("Error. Incomplete job found in the list of Done jobs")
-                #continue
+    readPathList = [jobFilePathList[index] for index in readIndexList]
+    if (len(readPathList) == 1):
+        readResultList = [mlJob.MLJob_ReadExistingMLJob(readPathList[0])]
+    else:
+        numThreads = min(JOB_READ_MAX_THREADS, len(readPathList))
+        with ThreadPoolExecutor(max_workers=numThreads) as executor:
+            readResultList = list(executor.map(mlJob.MLJob_ReadExistingMLJob, readPathList))
 
-            if (resultVarName != job.GetNetworkOutputVarName()):
+    for index, fileMTime, readResult in zip(readIndexList, readMTimeList, readResultList):
+        err, job = readResult
+        JobShowAddCachedJob(jobFilePathList[index], fileMTime, err, job)
+        resultList[index] = readResult
+    # End - for index, fileMTime, readResult in zip(readIndexList, readMTimeList, readResultList):
+
+    return resultList
+# End - JobShow_ReadJobListCached
+
+
+
+
+
+################################################################################
+#
+# [JobShow_PeekJobCached]
+#
+# Returns err, outputVarName, resultValueType, fIsLogistic for a job file.
+# A job already in the cache is used as is. Otherwise only the header of the
+# file is read, with MLJob_PeekJobFile, and the header is cached too.
+################################################################################
+def JobShow_PeekJobCached(jobFilePathName):
+    global g_JobPeekCacheDict
+
+    try:
+        fileMTime = os.path.getmtime(jobFilePathName)
+    except OSError:
+        return mlJob.MLJob_PeekJobFile(jobFilePathName)
+
+    job = JobShowGetCachedJob(jobFilePathName, fileMTime)
+    if (job is not None):
+        return (mlJob.JOB_E_NO_ERROR, job.GetNetworkOutputVarName(), 
+                    job.GetResultValueType(), job.GetIsLogisticNetwork())
+
+    cacheEntry = g_JobPeekCacheDict.get(jobFilePathName)
+    if ((cacheEntry is not None) and (cacheEntry[0] == fileMTime)):
+        return cacheEntry[1]
+
+    peekResult = mlJob.MLJob_PeekJobFile(jobFilePathName)
+    if (mlJob.JOB_E_NO_ERROR == peekResult[0]):
+        g_JobPeekCacheDict[jobFilePathName] = (fileMTime, peekResult)
+
+    return peekResult
+# End - JobShow_PeekJobCached
+
+
+
+
+
+################################################################################
+#
+# [JobShow_GetJobFilesInDir]
+#
+# Returns the paths of the job files in a directory. The list is rebuilt only
+# when the directory mtime changes, which happens when files are added, removed
+# or renamed. Changes to the contents of a job file are caught by 
+# JobShow_ReadJobCached.
+################################################################################
+def JobShow_GetJobFilesInDir(srcDirPathName):
+    global g_JobDirListCacheDict
+
+    dirMTime = os.path.getmtime(srcDirPathName)
+    cacheEntry = g_JobDirListCacheDict.get(srcDirPathName)
+    if ((cacheEntry is not None) and (cacheEntry[0] == dirMTime)):
+        return cacheEntry[1]
+
+    # scandir returns the file type with each entry, so this does not stat every file.
+    jobFilePathList = []
+    with os.scandir(srcDirPathName) as dirEntryList:
+        for dirEntry in dirEntryList:
+            if (dirEntry.name.endswith(".xgboost")):
                 continue
-            if (fDebug):
-                print("GetMatchingJobsInDir. Found job with desired output: " + resultVarName)
+            if (dirEntry.is_file()):
+                jobFilePathList.append(dirEntry.path)
+        # End - for dirEntry in dirEntryList:
+
+    g_JobDirListCacheDict[srcDirPathName] = (dirMTime, jobFilePathList)
+    return jobFilePathList
+# End - JobShow_GetJobFilesInDir
+
+
+
+
 
-            if ((job.GetResultValueType() == tdf.TDF_DATA_TYPE_BOOL)
-                    and (fIsLogistic != job.GetIsLogisticNetwork())):
+
+################################################################################
+#
+# [GetMatchingJobFilesInDir]
+#
+# Returns the paths of the job files in a directory that may be jobs for 
+# resultVarName. This only peeks at each file header, so it is cheap.
+# Files whose header cannot be read are included, so the full read in 
+# ReadMatchingJobs can report them. The jobs that really match are always 
+# a subset of this list.
+################################################################################
+def GetMatchingJobFilesInDir(srcDirPathName, resultVarName, fIsLogistic):
+    fDebug = False
+    # This is checked for every file, so look it up once.
+    boolDataType = tdf.TDF_DATA_TYPE_BOOL
+    resultPathList = []
+
+    jobFilePathList = JobShow_GetJobFilesInDir(srcDirPathName)
+    for srcFilePathName in jobFilePathList:
+        if (fDebug):
+            print("GetMatchingJobFilesInDir. file: " + srcFilePathName)
+
+        peekErr, outputVarName, resultValueType, fJobIsLogistic = JobShow_PeekJobCached(srcFilePathName)
+        if (mlJob.JOB_E_NO_ERROR == peekErr):
+            if (resultVarName != outputVarName):
                 continue
+            if ((resultValueType == boolDataType) and (fIsLogistic != fJobIsLogistic)):
+                continue
+
+        resultPathList.append(srcFilePathName)
+    # End - for srcFilePathName in jobFilePathList:
+
+    return resultPathList
+# End - GetMatchingJobFilesInDir
+
+
+
 
-            resultJobList.append(job)
-        # End - if (isfile(srcFilePathName)):
-    # End - for fileName in fileNameList:
+
+################################################################################
+#
+# [ReadMatchingJobs]
+#
+# Reads the job files from GetMatchingJobFilesInDir, and returns the jobs 
+# that really are for resultVarName.
+################################################################################
+def ReadMatchingJobs(jobFilePathList, resultVarName, fIsLogistic):
+    fDebug = False
+    boolDataType = tdf.TDF_DATA_TYPE_BOOL
+    resultJobList = []
+
+    for jobErr, job in JobShow_ReadJobListCached(jobFilePathList):
+        if (mlJob.JOB_E_NO_ERROR != jobErr):
+            print("Error. Invalid job found in the list of Done jobs")
+            continue
+
+        jobStatus, errCode, errorMsg = job.GetJobStatus()
+        if (mlJob.MLJOB_STATUS_DONE == jobStatus):
+            pass
+            #print("Error. Incomplete job found in the list of Done jobs")
+            #continue
+
+        if (resultVarName != job.GetNetworkOutputVarName()):
+            continue
+        if (fDebug):
+            print("ReadMatchingJobs. Found job with desired output: " + resultVarName)
+
+        if ((job.GetResultValueType() == boolDataType)
+                and (fIsLogistic != job.GetIsLogisticNetwork())):
+            continue
+
+        resultJobList.append(job)
+    # End - for jobErr, job in JobShow_ReadJobListCached(jobFilePathList):
 
     if (fDebug):
         print("resultJobList = " + str(resultJobList))
 
     return resultJobList
+# End - ReadMatchingJobs
+
+
+
+
+
+################################################################################
+#
+# [GetMatchingJobsInDir]
+#
+################################################################################
+def GetMatchingJobsInDir(srcDirPathName, resultVarName, fIsLogistic):
+    jobFilePathList = GetMatchingJobFilesInDir(srcDirPathName, resultVarName, fIsLogistic)
+    return ReadMatchingJobs(jobFilePathList, resultVarName, fIsLogistic)
 # End - GetMatchingJobsInDir
 
 
@@ -798,8 +1307,14 @@ def ShowBoolVsLogistic(jobDirName, titleStr, compareProperty,
     varNameList = []
 
     for outputVarName in listOfOutputVars:
-        logisticJobList = GetMatchingJobsInDir(jobDirName, outputVarName, True)
-        boolJobList = GetMatchingJobsInDir(jobDirName, outputVarName, False)
+        # Only read the jobs when there may be both a logistic and a bool job.
+        logisticPathList = GetMatchingJobFilesInDir(jobDirName, outputVarName, True)
+        boolPathList = GetMatchingJobFilesInDir(jobDirName, outputVarName, False)
+        if ((len(logisticPathList) == 0) or (len(boolPathList) == 0)):
+            continue
+
+        logisticJobList = ReadMatchingJobs(logisticPathList, outputVarName, True)
+        boolJobList = ReadMatchingJobs(boolPathList, outputVarName, False)
         if ((len(logisticJobList) != 1) or (len(boolJobList) != 1)):
             continue
 
@@ -827,7 +1342,7 @@ def ShowBoolVsLogistic(jobDirName, titleStr, compareProperty,
     DataShow.DrawDoubleBarGraph(titleStr, 
                         "", varNameList, 
                         compareProperty,  #yLabelStr, 
-                        "Boolean", boolJobList, "Logistic", logisticJobList, 
+                        "Boolean", boolResList, "Logistic", logisticResultList, 
                         False, reportFilePathName)
 # End - ShowBoolVsLogistic
 
@@ -842,6 +1357,24 @@ def ShowBoolVsLogistic(jobDirName, titleStr, compareProperty,
 ################################################################################
 def ShowResultVsLearningRate(jobDirName, titleStr, compareProperty,
                         outputVarName, isLogistic, reportFilePathName):
+    jobList = GetMatchingJobsInDir(jobDirName, outputVarName, isLogistic)
+    ShowResultVsLearningRateForJobs(jobList, titleStr, compareProperty,
+                        outputVarName, isLogistic, reportFilePathName)
+# End - ShowResultVsLearningRate
+
+
+
+
+
+
+################################################################################
+# 
+# [ShowResultVsLearningRateForJobs]
+# 
+# jobList is the result of GetMatchingJobsInDir for outputVarName and isLogistic.
+################################################################################
+def ShowResultVsLearningRateForJobs(jobList, titleStr, compareProperty,
+                        outputVarName, isLogistic, reportFilePathName):
     fDebug = False
 
     # Value Types (case IN-sensitive)
@@ -860,14 +1393,13 @@ def ShowResultVsLearningRate(jobDirName, titleStr, compareProperty,
     else:
         compareProperty = "PercentAccurate"
 
-    jobList = GetMatchingJobsInDir(jobDirName, outputVarName, isLogistic)
-
     xyPairList = []
     for currentJob in jobList:
+        lrStr = currentJob.GetTrainingParamStr("LearningRate", "0.1")
         try:
-            lr = float(currentJob.GetTrainingParamStr("LearningRate", "0.1"))
-        except Exception:
-            print("ShowResultVsLearningRate. Cannot parse learningRate =" + str(currentJob.GetTrainingParamStr("LearningRate", "0.1")))
+            lr = float(lrStr)
+        except ValueError:
+            print("ShowResultVsLearningRate. Cannot parse learningRate =" + lrStr)
             continue
 
         # Value Types (case IN-sensitive)
@@ -882,18 +1414,15 @@ def ShowResultVsLearningRate(jobDirName, titleStr, compareProperty,
         #   F1 - only for results of type for TDF_DATA_TYPE_BOOL
         accuracyFloat = float(GetJobValue(currentJob, compareProperty, 10))
 
-        newDictEntry = {'x': lr, 'y': accuracyFloat}
-        xyPairList.append(newDictEntry)
+        xyPairList.append((lr, accuracyFloat))
     # End - for currentJob in jobList:
-    sortedXYPairList = sorted(xyPairList, key=lambda k: k['x'])
+    # Sort on the learning rate only, so jobs with the same rate keep their order.
+    sortedXYPairList = sorted(xyPairList, key=itemgetter(0))
     if (fDebug):
         print("ShowResultVsLearningRate. sortedXYPairList =" + str(sortedXYPairList))
 
-    xValueList = []
-    yValueList = []
-    for xyPair in xyPairList:
-        xValueList.append(xyPair['x'])
-        yValueList.append(xyPair['y'])
+    xValueList = [xVal for xVal, yVal in sortedXYPairList]
+    yValueList = [yVal for xVal, yVal in sortedXYPairList]
 
     if (fDebug):
         print("ShowResultVsLearningRate. xValueList =" + str(xValueList))
@@ -905,7 +1434,7 @@ def ShowResultVsLearningRate(jobDirName, titleStr, compareProperty,
                 "Learning Rate", xValueList, 
                 compareProperty, yValueList, 
                 False, reportFilePathName)
-# End - ShowResultVsLearningRate
+# End - ShowResultVsLearningRateForJobs
 
 
 
@@ -919,34 +1448,68 @@ def ShowResultVsLearningRate(jobDirName, titleStr, compareProperty,
 ################################################################################
 def ShowAvgLossPerEpoch(jobDirName, titleStr,
                         outputVarName, isLogistic, reportFilePathName):
-    MAX_EPOCHS = 20
+    jobList = GetMatchingJobsInDir(jobDirName, outputVarName, isLogistic)
+    ShowAvgLossPerEpochForJobs(jobList, titleStr, reportFilePathName)
+# End - ShowAvgLossPerEpoch
+
+
+
+
+
+
+################################################################################
+# 
+# [ShowAvgLossPerEpochForJobs]
+# 
+################################################################################
+def ShowAvgLossPerEpochForJobs(jobList, titleStr, reportFilePathName):
     curveNamesList = []
     lossSequencesList = []
 
-    jobList = GetMatchingJobsInDir(jobDirName, outputVarName, isLogistic)
     for currentJob in jobList:
         lrStr = currentJob.GetTrainingParamStr("LearningRate", "0.1")
         curveNamesList.append("LR=" + lrStr)
 
+        # Epochs that did not run are plotted as 0.
         avgLossList = currentJob.GetAvgLossPerEpochList()
-        newLossSequence = [0] * MAX_EPOCHS
-        epochNum = 0
-        for avgLoss in avgLossList:
-            newLossSequence[epochNum] = avgLoss
-            epochNum += 1
+        numEpochs = min(len(avgLossList), JOBSHOW_LOSS_GRAPH_MAX_EPOCHS)
+        newLossSequence = np.zeros(JOBSHOW_LOSS_GRAPH_MAX_EPOCHS)
+        newLossSequence[:numEpochs] = avgLossList[:numEpochs]
         lossSequencesList.append(newLossSequence)
     # End - for currentJob in jobList:
 
-    epochNames = []
-    for epochNum in range(MAX_EPOCHS):
-        epochNames.append(str(epochNum))
-
     DataShow.DrawMultiLineGraph(titleStr, 
-                        "Epoch", epochNames, 
+                        "Epoch", JOBSHOW_LOSS_GRAPH_EPOCH_NAME_LIST, 
                         "Loss", curveNamesList, 
                         lossSequencesList, 
                         False, reportFilePathName)
-# End - ShowAvgLossPerEpoch
+# End - ShowAvgLossPerEpochForJobs
+
+
+
+
+
+
+################################################################################
+# 
+# [ShowLearningRateGraphs]
+# 
+# This draws both ShowResultVsLearningRate and ShowAvgLossPerEpoch for one
+# output variable, but finds and reads the matching jobs only once.
+# An empty graph file path skips that graph.
+################################################################################
+def ShowLearningRateGraphs(jobDirName, outputVarName, isLogistic,
+                        resultTitleStr, resultGraphFilePathName,
+                        lossTitleStr, lossGraphFilePathName):
+    jobList = GetMatchingJobsInDir(jobDirName, outputVarName, isLogistic)
+
+    if ((resultGraphFilePathName is not None) and (resultGraphFilePathName != "")):
+        ShowResultVsLearningRateForJobs(jobList, resultTitleStr, "", 
+                        outputVarName, isLogistic, resultGraphFilePathName)
+
+    if ((lossGraphFilePathName is not None) and (lossGraphFilePathName != "")):
+        ShowAvgLossPerEpochForJobs(jobList, lossTitleStr, lossGraphFilePathName)
+# End - ShowLearningRateGraphs
 
 
 
@@ -44,7 +44,7 @@ import os
 import sys
 import time
 from datetime import datetime
-import random
+import numpy as np
 
 g_libDirPath = "/home/ddean/ddRoot/lib"
 g_srcTDFFilePath = "/home/ddean/dLargeData/mlData/UKData/UKHC_4942/UKDailyLabsBloodLossMissedAKI.tdf"
@@ -60,7 +60,7 @@ from tdfTools import *
 from dataShow import *
 import elixhauser as Elixhauser
 
-random.seed(3)
+np.random.seed(3)
 
 MIN_GFR_FOR_NON_ESRD = 20
 
@@ -74,15 +74,16 @@ g_TotalDaysInHospital = 0
 g_TotalNonESRDDaysInHospital = 0
 g_TotalVirtDaysInHospital = 0
 
+NUM_AKI_GRADES = 4
+
 # Total AKIs (max 1 per admission)
 g_TotalAKIAllYears = 0
 g_TotalAKI1AllYears = 0
 g_TotalAKI2AllYears = 0
 g_TotalAKI3AllYears = 0
 g_TotalAKIOnAdmissionAllYears = 0
-g_TotalAKI1OnAdmissionAllYears = 0
-g_TotalAKI2OnAdmissionAllYears = 0
-g_TotalAKI3OnAdmissionAllYears = 0
+# Indexed by AKI grade, so entry 0 is always 0.
+g_TotalAKIOnAdmissionByGrade = np.zeros(NUM_AKI_GRADES, dtype=np.int64)
 
 # Num AKIs per patient 
 g_TotalNumPatientsWithAKI = 0
@@ -94,33 +95,48 @@ g_AKI2ComorbidityGroup = None
 g_AKI3ComorbidityGroup = None
 g_CKDComorbidityGroup = None
 
-g_OnDiureticsAtAKI = 0
-g_OnVancAtAKI = 0
-g_OnACEARBAtAKI = 0
-g_OnNSAIDAtAKI = 0
-g_OnTacCsaAtAKI = 0
-g_OnPamidAtAKI = 0
-g_OnChemoAtAKI = 0
+# Drug classes counted for each AKI. Each admission's med list is reduced to
+# a mask once, instead of being searched again for every AKI.
+# Bit N of the mask is set if the admission had a med in class N.
+MED_CLASS_DIURETIC = 0
+MED_CLASS_VANC = 1
+MED_CLASS_ACE_ARB = 2
+MED_CLASS_NSAID = 3
+MED_CLASS_TAC_CSA = 4
+MED_CLASS_PAMID = 5
+MED_CLASS_CHEMO = 6
+NUM_MED_CLASSES = 7
+MED_CLASS_BIT_SHIFTS = np.arange(NUM_MED_CLASSES)
+
+# Number of AKIs in a patient on each class of med, indexed by MED_CLASS_*.
+g_NumAKIsOnMedClass = np.zeros(NUM_MED_CLASSES, dtype=np.int64)
+
+DIURETIC_MED_NAMES = ("FurosIV", "Furos", "Tors", "Bumet", "Spiro", "Chlorthal")
+VANC_MED_NAMES = ("Vanc",)
+ACE_ARB_MED_NAMES = ("Lisin", "Enalapril", "Losar", "Valsar")
+NSAID_MED_NAMES = ("Ibup", "Ketor", "Naprox", "Diclof")
+TAC_CSA_MED_NAMES = ("Tac", "CsA")
+PAMID_MED_NAMES = ("Pamid",)
+CHEMO_MED_NAMES = ("Cisplat", "Tenof", "MTX")
+MED_CLASS_NAMES_LIST = ((MED_CLASS_DIURETIC, DIURETIC_MED_NAMES), (MED_CLASS_VANC, VANC_MED_NAMES), 
+                        (MED_CLASS_ACE_ARB, ACE_ARB_MED_NAMES), (MED_CLASS_NSAID, NSAID_MED_NAMES), 
+                        (MED_CLASS_TAC_CSA, TAC_CSA_MED_NAMES), (MED_CLASS_PAMID, PAMID_MED_NAMES), 
+                        (MED_CLASS_CHEMO, CHEMO_MED_NAMES))
 
 g_TotalVirtualDays = 0
 g_NumVirtualAdmissions = 0
 
 MAX_NUM_SKIPPED_DAYS = 20
-g_DayNumOfAKI = [0] * MAX_NUM_SKIPPED_DAYS
-g_DayNumOfAKI1 = [0] * MAX_NUM_SKIPPED_DAYS
-g_DayNumOfAKI2 = [0] * MAX_NUM_SKIPPED_DAYS
-g_DayNumOfAKI3 = [0] * MAX_NUM_SKIPPED_DAYS
-g_NumPtsWithConsecutiveSkippedDays = [0] * MAX_NUM_SKIPPED_DAYS
-
-g_NumAKI0AfterSkippedDays = [0] * MAX_NUM_SKIPPED_DAYS
-g_NumAKI1AfterSkippedDays = [0] * MAX_NUM_SKIPPED_DAYS
-g_NumAKI2AfterSkippedDays = [0] * MAX_NUM_SKIPPED_DAYS
-g_NumAKI3AfterSkippedDays = [0] * MAX_NUM_SKIPPED_DAYS
-
-g_NumAKI0OnCKDAfterSkippedDays = [0] * MAX_NUM_SKIPPED_DAYS
-g_NumAKI1OnCKDAfterSkippedDays = [0] * MAX_NUM_SKIPPED_DAYS
-g_NumAKI2OnCKDAfterSkippedDays = [0] * MAX_NUM_SKIPPED_DAYS
-g_NumAKI3OnCKDAfterSkippedDays = [0] * MAX_NUM_SKIPPED_DAYS
+
+# Indexed by [akiGrade, dayNum]. Row 0 is always 0, since only real AKIs are recorded.
+g_DayNumOfAKIByGrade = np.zeros((NUM_AKI_GRADES, MAX_NUM_SKIPPED_DAYS), dtype=np.int64)
+g_NumPtsWithConsecutiveSkippedDays = np.zeros(MAX_NUM_SKIPPED_DAYS, dtype=np.int64)
+
+# Indexed by [patientGroup, akiGrade, numDaysSkipped]. 
+# The CKD group is a subset of all patients, so CKD labs are counted in both.
+AKI_COUNTS_ALL_PATIENTS = 0
+AKI_COUNTS_CKD_PATIENTS = 1
+g_AKICountsAfterSkippedDays = np.zeros((2, NUM_AKI_GRADES, MAX_NUM_SKIPPED_DAYS), dtype=np.int64)
 
 g_TotalNumLabsConsidered = 0
 g_TotalNumLabsChecked = 0
@@ -129,10 +145,10 @@ g_TotalNumLabsPerformed = 0
 
 NUM_BASELINE_CR_BUCKETS = 20
 INCREMENT_PER_CR_BUCKET = 0.25
-g_BaselineCrBeforeAKI = [0] * NUM_BASELINE_CR_BUCKETS
+g_BaselineCrBeforeAKI = np.zeros(NUM_BASELINE_CR_BUCKETS, dtype=np.int64)
 
-g_NumDaysSkippedXAxis = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19]
-g_NumDaysSkippedXAxisString = ['0', '1', '2', '3', '4', '5', '6', '7', '8', '9', '10', '11', '12', '13', '14', '15', '16', '17', '18', '19']
+g_NumDaysSkippedXAxis = np.arange(MAX_NUM_SKIPPED_DAYS)
+g_NumDaysSkippedXAxisString = g_NumDaysSkippedXAxis.astype(str)
 
 
 ######################################################################################
@@ -177,10 +193,6 @@ g_NumLabsSkipped10PercentRandom = 9244
 g_NumAKI10PercentRandom = [1869, 1390, 353, 126]
 g_NumPtsWithConsecutiveSkippedDays10PercentRandom = [36546, 1878, 109, 6, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
 g_FractionAKI10PercentRandom = [0.1935, 0.1439, 0.0366, 0.013]
-g_SensitivityAnyAKI10PercentRandom = 0.8645
-g_SensitivityAKI110PercentRandom = 0.8655
-g_SensitivityAKI210PercentRandom = 0.8738
-g_SensitivityAKI310PercentRandom = 0.8289
 
 #20PercentRandomVariables. (COPY THESE INTO THE CODE)
 g_NumLabsConsidered20PercentRandom = 91758
@@ -188,10 +200,6 @@ g_NumLabsSkipped20PercentRandom = 18456
 g_NumAKI20PercentRandom = [1551, 1151, 293, 107]
 g_NumPtsWithConsecutiveSkippedDays20PercentRandom = [28677, 2918, 336, 23, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
 g_FractionAKI20PercentRandom = [0.1896, 0.1407, 0.0358, 0.0131]
-g_SensitivityAnyAKI20PercentRandom = 0.7174
-g_SensitivityAKI120PercentRandom = 0.7167
-g_SensitivityAKI220PercentRandom = 0.7252
-g_SensitivityAKI320PercentRandom = 0.7039
 
 #30PercentRandomVariables. (COPY THESE INTO THE CODE)
 g_NumLabsConsidered30PercentRandom = 91758
@@ -199,10 +207,6 @@ g_NumLabsSkipped30PercentRandom = 27617
 g_NumAKI30PercentRandom = [1254, 939, 230, 85]
 g_NumPtsWithConsecutiveSkippedDays30PercentRandom = [21720, 3333, 578, 73, 16, 2, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
 g_FractionAKI30PercentRandom = [0.1858, 0.1391, 0.0341, 0.0126]
-g_SensitivityAnyAKI30PercentRandom = 0.58
-g_SensitivityAKI130PercentRandom = 0.5847
-g_SensitivityAKI230PercentRandom = 0.5693
-g_SensitivityAKI330PercentRandom = 0.5592
 
 #40PercentRandomVariables. (COPY THESE INTO THE CODE)
 g_NumLabsConsidered40PercentRandom = 91758
@@ -210,10 +214,6 @@ g_NumLabsSkipped40PercentRandom = 36828
 g_NumAKI40PercentRandom = [960, 720, 179, 61]
 g_NumPtsWithConsecutiveSkippedDays40PercentRandom = [15904, 3190, 737, 152, 28, 14, 7, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
 g_FractionAKI40PercentRandom = [0.1779, 0.1334, 0.0332, 0.0113]
-g_SensitivityAnyAKI40PercentRandom = 0.444
-g_SensitivityAKI140PercentRandom = 0.4483
-g_SensitivityAKI240PercentRandom = 0.4431
-g_SensitivityAKI340PercentRandom = 0.4013
 
 #50PercentRandomVariables. (COPY THESE INTO THE CODE)
 g_NumLabsConsidered50PercentRandom = 91758
@@ -221,10 +221,6 @@ g_NumLabsSkipped50PercentRandom = 46069
 g_NumAKI50PercentRandom = [702, 528, 135, 39]
 g_NumPtsWithConsecutiveSkippedDays50PercentRandom = [10868, 2702, 802, 211, 51, 18, 15, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
 g_FractionAKI50PercentRandom = [0.1735, 0.1305, 0.0334, 0.0096]
-g_SensitivityAnyAKI50PercentRandom = 0.3247
-g_SensitivityAKI150PercentRandom = 0.3288
-g_SensitivityAKI250PercentRandom = 0.3342
-g_SensitivityAKI350PercentRandom = 0.2566
 
 #60PercentRandomVariables. (COPY THESE INTO THE CODE)
 g_NumLabsConsidered60PercentRandom = 91758
@@ -232,10 +228,6 @@ g_NumLabsSkipped60PercentRandom = 55158
 g_NumAKI60PercentRandom = [482, 372, 87, 23]
 g_NumPtsWithConsecutiveSkippedDays60PercentRandom = [6799, 2045, 724, 234, 77, 24, 13, 8, 1, 2, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0]
 g_FractionAKI60PercentRandom = [0.1712, 0.1321, 0.0309, 0.0082]
-g_SensitivityAnyAKI60PercentRandom = 0.2229
-g_SensitivityAKI160PercentRandom = 0.2316
-g_SensitivityAKI260PercentRandom = 0.2153
-g_SensitivityAKI360PercentRandom = 0.1513
 
 #70PercentRandomVariables. (COPY THESE INTO THE CODE)
 g_NumLabsConsidered70PercentRandom = 91758
@@ -243,10 +235,6 @@ g_NumLabsSkipped70PercentRandom = 64307
 g_NumAKI70PercentRandom = [315, 253, 55, 7]
 g_NumPtsWithConsecutiveSkippedDays70PercentRandom = [3766, 1421, 526, 232, 95, 39, 18, 12, 4, 2, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0]
 g_FractionAKI70PercentRandom = [0.1754, 0.1409, 0.0306, 0.0039]
-g_SensitivityAnyAKI70PercentRandom = 0.1457
-g_SensitivityAKI170PercentRandom = 0.1575
-g_SensitivityAKI270PercentRandom = 0.1361
-g_SensitivityAKI370PercentRandom = 0.0461
 
 #80PercentRandomVariables. (COPY THESE INTO THE CODE)
 g_NumLabsConsidered80PercentRandom = 91758
@@ -254,10 +242,6 @@ g_NumLabsSkipped80PercentRandom = 73480
 g_NumAKI80PercentRandom = [162, 128, 30, 4]
 g_NumPtsWithConsecutiveSkippedDays80PercentRandom = [1555, 683, 294, 151, 71, 25, 23, 13, 7, 2, 4, 2, 0, 2, 0, 0, 0, 0, 0, 0]
 g_FractionAKI80PercentRandom = [0.189, 0.1494, 0.035, 0.0047]
-g_SensitivityAnyAKI80PercentRandom = 0.0749
-g_SensitivityAKI180PercentRandom = 0.0797
-g_SensitivityAKI280PercentRandom = 0.0743
-g_SensitivityAKI380PercentRandom = 0.0263
 
 #90PercentRandomVariables. (COPY THESE INTO THE CODE)
 g_NumLabsConsidered90PercentRandom = 91758
@@ -265,10 +249,6 @@ g_NumLabsSkipped90PercentRandom = 82788
 g_NumAKI90PercentRandom = [42, 36, 6, 0]
 g_NumPtsWithConsecutiveSkippedDays90PercentRandom = [365, 190, 92, 59, 26, 19, 10, 13, 2, 4, 0, 1, 0, 2, 0, 0, 0, 0, 0, 1]
 g_FractionAKI90PercentRandom = [0.1707, 0.1463, 0.0244, 0.0]
-g_SensitivityAnyAKI90PercentRandom = 0.0194
-g_SensitivityAKI190PercentRandom = 0.0224
-g_SensitivityAKI290PercentRandom = 0.0149
-g_SensitivityAKI390PercentRandom = 0.0
 
 
 
@@ -292,10 +272,6 @@ g_LongAdmissionNumLabsSkipped10PercentRandom = 1019
 g_LongAdmissionNumAKI10PercentRandom = [181, 157, 19, 5]
 g_LongAdmissionNumPtsWithConsecutiveSkippedDays10PercentRandom = [5614, 321, 23, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
 g_LongAdmissionFractionAKI10PercentRandom = [0.1347, 0.1168, 0.0141, 0.0037]
-g_LongAdmissionSensitivityAnyAKI10PercentRandom = 0.866
-g_LongAdmissionSensitivityAKI110PercentRandom = 0.882
-g_LongAdmissionSensitivityAKI210PercentRandom = 0.7308
-g_LongAdmissionSensitivityAKI310PercentRandom = 1.0
 
 #20PercentRandomVariables. (COPY THESE INTO THE CODE)
 g_LongAdmissionNumLabsConsidered20PercentRandom = 10350
@@ -303,10 +279,6 @@ g_LongAdmissionNumLabsSkipped20PercentRandom = 2007
 g_LongAdmissionNumAKI20PercentRandom = [156, 137, 15, 4]
 g_LongAdmissionNumPtsWithConsecutiveSkippedDays20PercentRandom = [4489, 526, 54, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
 g_LongAdmissionFractionAKI20PercentRandom = [0.1322, 0.1161, 0.0127, 0.0034]
-g_LongAdmissionSensitivityAnyAKI20PercentRandom = 0.7464
-g_LongAdmissionSensitivityAKI120PercentRandom = 0.7697
-g_LongAdmissionSensitivityAKI220PercentRandom = 0.5769
-g_LongAdmissionSensitivityAKI320PercentRandom = 0.8
 
 #30PercentRandomVariables. (COPY THESE INTO THE CODE)
 g_LongAdmissionNumLabsConsidered30PercentRandom = 10350
@@ -314,10 +286,6 @@ g_LongAdmissionNumLabsSkipped30PercentRandom = 3080
 g_LongAdmissionNumAKI30PercentRandom = [131, 113, 15, 3]
 g_LongAdmissionNumPtsWithConsecutiveSkippedDays30PercentRandom = [3433, 593, 128, 22, 2, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
 g_LongAdmissionFractionAKI30PercentRandom = [0.1314, 0.1133, 0.015, 0.003]
-g_LongAdmissionSensitivityAnyAKI30PercentRandom = 0.6268
-g_LongAdmissionSensitivityAKI130PercentRandom = 0.6348
-g_LongAdmissionSensitivityAKI230PercentRandom = 0.5769
-g_LongAdmissionSensitivityAKI330PercentRandom = 0.6
 
 #40PercentRandomVariables. (COPY THESE INTO THE CODE)
 g_LongAdmissionNumLabsConsidered40PercentRandom = 10350
@@ -325,10 +293,6 @@ g_LongAdmissionNumLabsSkipped40PercentRandom = 4193
 g_LongAdmissionNumAKI40PercentRandom = [106, 93, 11, 2]
 g_LongAdmissionNumPtsWithConsecutiveSkippedDays40PercentRandom = [2468, 596, 160, 35, 7, 7, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
 g_LongAdmissionFractionAKI40PercentRandom = [0.1312, 0.1151, 0.0136, 0.0025]
-g_LongAdmissionSensitivityAnyAKI40PercentRandom = 0.5072
-g_LongAdmissionSensitivityAKI140PercentRandom = 0.5225
-g_LongAdmissionSensitivityAKI240PercentRandom = 0.4231
-g_LongAdmissionSensitivityAKI340PercentRandom = 0.4
 
 #50PercentRandomVariables. (COPY THESE INTO THE CODE)
 g_LongAdmissionNumLabsConsidered50PercentRandom = 10350
@@ -336,10 +300,6 @@ g_LongAdmissionNumLabsSkipped50PercentRandom = 5237
 g_LongAdmissionNumAKI50PercentRandom = [84, 75, 8, 1]
 g_LongAdmissionNumPtsWithConsecutiveSkippedDays50PercentRandom = [1694, 525, 171, 40, 15, 8, 2, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
 g_LongAdmissionFractionAKI50PercentRandom = [0.134, 0.1196, 0.0128, 0.0016]
-g_LongAdmissionSensitivityAnyAKI50PercentRandom = 0.4019
-g_LongAdmissionSensitivityAKI150PercentRandom = 0.4213
-g_LongAdmissionSensitivityAKI250PercentRandom = 0.3077
-g_LongAdmissionSensitivityAKI350PercentRandom = 0.2
 
 #60PercentRandomVariables. (COPY THESE INTO THE CODE)
 g_LongAdmissionNumLabsConsidered60PercentRandom = 10350
@@ -347,10 +307,6 @@ g_LongAdmissionNumLabsSkipped60PercentRandom = 6257
 g_LongAdmissionNumAKI60PercentRandom = [60, 55, 4, 1]
 g_LongAdmissionNumPtsWithConsecutiveSkippedDays60PercentRandom = [1134, 401, 151, 51, 20, 12, 2, 5, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
 g_LongAdmissionFractionAKI60PercentRandom = [0.1274, 0.1168, 0.0085, 0.0021]
-g_LongAdmissionSensitivityAnyAKI60PercentRandom = 0.2871
-g_LongAdmissionSensitivityAKI160PercentRandom = 0.309
-g_LongAdmissionSensitivityAKI260PercentRandom = 0.1538
-g_LongAdmissionSensitivityAKI360PercentRandom = 0.2
 
 #70PercentRandomVariables. (COPY THESE INTO THE CODE)
 g_LongAdmissionNumLabsConsidered70PercentRandom = 10350
@@ -358,10 +314,6 @@ g_LongAdmissionNumLabsSkipped70PercentRandom = 7247
 g_LongAdmissionNumAKI70PercentRandom = [42, 38, 3, 1]
 g_LongAdmissionNumPtsWithConsecutiveSkippedDays70PercentRandom = [640, 296, 126, 52, 25, 17, 7, 5, 1, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0]
 g_LongAdmissionFractionAKI70PercentRandom = [0.1284, 0.1162, 0.0092, 0.0031]
-g_LongAdmissionSensitivityAnyAKI70PercentRandom = 0.201
-g_LongAdmissionSensitivityAKI170PercentRandom = 0.2135
-g_LongAdmissionSensitivityAKI270PercentRandom = 0.1154
-g_LongAdmissionSensitivityAKI370PercentRandom = 0.2
 
 #80PercentRandomVariables. (COPY THESE INTO THE CODE)
 g_LongAdmissionNumLabsConsidered80PercentRandom = 10350
@@ -369,10 +321,6 @@ g_LongAdmissionNumLabsSkipped80PercentRandom = 8235
 g_LongAdmissionNumAKI80PercentRandom = [23, 20, 2, 1]
 g_LongAdmissionNumPtsWithConsecutiveSkippedDays80PercentRandom = [301, 178, 101, 32, 20, 18, 11, 4, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
 g_LongAdmissionFractionAKI80PercentRandom = [0.115, 0.1, 0.01, 0.005]
-g_LongAdmissionSensitivityAnyAKI80PercentRandom = 0.11
-g_LongAdmissionSensitivityAKI180PercentRandom = 0.1124
-g_LongAdmissionSensitivityAKI280PercentRandom = 0.0769
-g_LongAdmissionSensitivityAKI380PercentRandom = 0.2
 
 #90PercentRandomVariables. (COPY THESE INTO THE CODE)
 g_LongAdmissionNumLabsConsidered90PercentRandom = 10350
@@ -380,10 +328,6 @@ g_LongAdmissionNumLabsSkipped90PercentRandom = 9302
 g_LongAdmissionNumAKI90PercentRandom = [8, 6, 1, 1]
 g_LongAdmissionNumPtsWithConsecutiveSkippedDays90PercentRandom = [79, 35, 22, 14, 2, 18, 5, 6, 0, 2, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0]
 g_LongAdmissionFractionAKI90PercentRandom = [0.1379, 0.1034, 0.0172, 0.0172]
-g_LongAdmissionSensitivityAnyAKI90PercentRandom = 0.0383
-g_LongAdmissionSensitivityAKI190PercentRandom = 0.0337
-g_LongAdmissionSensitivityAKI290PercentRandom = 0.0385
-g_LongAdmissionSensitivityAKI390PercentRandom = 0.2
 
 
 ######################################
@@ -395,10 +339,6 @@ g_NumLabsSkipped10PercentBandSkipping = 3435
 g_NumAKI10PercentBandSkipping = [1956, 1433, 376, 147]
 g_NumPtsWithConsecutiveSkippedDays10PercentBandSkipping = [39477, 56, 719, 55, 7, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
 g_FractionAKI10PercentBandSkipping = [0.1916, 0.1403, 0.0368, 0.0144]
-g_SensitivityAnyAKI10PercentBandSkipping = 0.9047
-g_SensitivityAKI110PercentBandSkipping = 0.8923
-g_SensitivityAKI210PercentBandSkipping = 0.9307
-g_SensitivityAKI310PercentBandSkipping = 0.9671
 
 #20Percent Variables for BandSkipping:
 g_NumLabsConsidered20PercentBandSkipping = 91758
@@ -406,10 +346,6 @@ g_NumLabsSkipped20PercentBandSkipping = 6429
 g_NumAKI20PercentBandSkipping = [1774, 1273, 356, 145]
 g_NumPtsWithConsecutiveSkippedDays20PercentBandSkipping = [34225, 97, 1310, 142, 28, 4, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
 g_FractionAKI20PercentBandSkipping = [0.189, 0.1356, 0.0379, 0.0154]
-g_SensitivityAnyAKI20PercentBandSkipping = 0.8205
-g_SensitivityAKI120PercentBandSkipping = 0.7927
-g_SensitivityAKI220PercentBandSkipping = 0.8812
-g_SensitivityAKI320PercentBandSkipping = 0.9539
 
 #30Percent Variables for BandSkipping:
 g_NumLabsConsidered30PercentBandSkipping = 91758
@@ -417,10 +353,6 @@ g_NumLabsSkipped30PercentBandSkipping = 9054
 g_NumAKI30PercentBandSkipping = [1634, 1169, 325, 140]
 g_NumPtsWithConsecutiveSkippedDays30PercentBandSkipping = [29369, 139, 1742, 195, 50, 6, 3, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
 g_FractionAKI30PercentBandSkipping = [0.1921, 0.1374, 0.0382, 0.0165]
-g_SensitivityAnyAKI30PercentBandSkipping = 0.7558
-g_SensitivityAKI130PercentBandSkipping = 0.7279
-g_SensitivityAKI230PercentBandSkipping = 0.8045
-g_SensitivityAKI330PercentBandSkipping = 0.9211
 
 #40Percent Variables for BandSkipping:
 g_NumLabsConsidered40PercentBandSkipping = 91758
@@ -428,10 +360,6 @@ g_NumLabsSkipped40PercentBandSkipping = 11507
 g_NumAKI40PercentBandSkipping = [1480, 1051, 299, 130]
 g_NumPtsWithConsecutiveSkippedDays40PercentBandSkipping = [24837, 131, 2260, 263, 71, 18, 4, 3, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
 g_FractionAKI40PercentBandSkipping = [0.1924, 0.1367, 0.0389, 0.0169]
-g_SensitivityAnyAKI40PercentBandSkipping = 0.6846
-g_SensitivityAKI140PercentBandSkipping = 0.6544
-g_SensitivityAKI240PercentBandSkipping = 0.7401
-g_SensitivityAKI340PercentBandSkipping = 0.8553
 
 #50Percent Variables for BandSkipping:
 g_NumLabsConsidered50PercentBandSkipping = 91758
@@ -439,10 +367,6 @@ g_NumLabsSkipped50PercentBandSkipping = 13583
 g_NumAKI50PercentBandSkipping = [1317, 915, 277, 125]
 g_NumPtsWithConsecutiveSkippedDays50PercentBandSkipping = [20597, 138, 2670, 317, 84, 16, 2, 1, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
 g_FractionAKI50PercentBandSkipping = [0.1941, 0.1349, 0.0408, 0.0184]
-g_SensitivityAnyAKI50PercentBandSkipping = 0.6092
-g_SensitivityAKI150PercentBandSkipping = 0.5697
-g_SensitivityAKI250PercentBandSkipping = 0.6856
-g_SensitivityAKI350PercentBandSkipping = 0.8224
 
 #60Percent Variables for BandSkipping:
 g_NumLabsConsidered60PercentBandSkipping = 91758
@@ -450,10 +374,6 @@ g_NumLabsSkipped60PercentBandSkipping = 15356
 g_NumAKI60PercentBandSkipping = [1196, 824, 244, 128]
 g_NumPtsWithConsecutiveSkippedDays60PercentBandSkipping = [16715, 123, 2983, 409, 83, 27, 7, 3, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
 g_FractionAKI60PercentBandSkipping = [0.2022, 0.1393, 0.0412, 0.0216]
-g_SensitivityAnyAKI60PercentBandSkipping = 0.5532
-g_SensitivityAKI160PercentBandSkipping = 0.5131
-g_SensitivityAKI260PercentBandSkipping = 0.604
-g_SensitivityAKI360PercentBandSkipping = 0.8421
 
 #70Percent Variables for BandSkipping:
 g_NumLabsConsidered70PercentBandSkipping = 91758
@@ -461,10 +381,6 @@ g_NumLabsSkipped70PercentBandSkipping = 16905
 g_NumAKI70PercentBandSkipping = [1067, 704, 244, 119]
 g_NumPtsWithConsecutiveSkippedDays70PercentBandSkipping = [13238, 115, 3280, 492, 112, 20, 9, 5, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
 g_FractionAKI70PercentBandSkipping = [0.2086, 0.1377, 0.0477, 0.0233]
-g_SensitivityAnyAKI70PercentBandSkipping = 0.4935
-g_SensitivityAKI170PercentBandSkipping = 0.4384
-g_SensitivityAKI270PercentBandSkipping = 0.604
-g_SensitivityAKI370PercentBandSkipping = 0.7829
 
 #80Percent Variables for BandSkipping:
 g_NumLabsConsidered80PercentBandSkipping = 91758
@@ -472,10 +388,6 @@ g_NumLabsSkipped80PercentBandSkipping = 18395
 g_NumAKI80PercentBandSkipping = [927, 571, 241, 115]
 g_NumPtsWithConsecutiveSkippedDays80PercentBandSkipping = [9794, 103, 3555, 520, 124, 28, 12, 7, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
 g_FractionAKI80PercentBandSkipping = [0.218, 0.1343, 0.0567, 0.027]
-g_SensitivityAnyAKI80PercentBandSkipping = 0.4288
-g_SensitivityAKI180PercentBandSkipping = 0.3555
-g_SensitivityAKI280PercentBandSkipping = 0.5965
-g_SensitivityAKI380PercentBandSkipping = 0.7566
 
 #90Percent Variables for BandSkipping:
 g_NumLabsConsidered90PercentBandSkipping = 91758
@@ -483,20 +395,29 @@ g_NumLabsSkipped90PercentBandSkipping = 19759
 g_NumAKI90PercentBandSkipping = [812, 476, 224, 112]
 g_NumPtsWithConsecutiveSkippedDays90PercentBandSkipping = [6453, 87, 3791, 573, 136, 35, 14, 7, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
 g_FractionAKI90PercentBandSkipping = [0.2395, 0.1404, 0.0661, 0.033]
-g_SensitivityAnyAKI90PercentBandSkipping = 0.3756
-g_SensitivityAKI190PercentBandSkipping = 0.2964
-g_SensitivityAKI290PercentBandSkipping = 0.5545
-g_SensitivityAKI390PercentBandSkipping = 0.7368
 
 
 ########################
-g_SensitivityListForAllAKI = [g_SensitivityAnyAKI10PercentRandom, g_SensitivityAnyAKI20PercentRandom, g_SensitivityAnyAKI30PercentRandom, g_SensitivityAnyAKI40PercentRandom, g_SensitivityAnyAKI50PercentRandom, g_SensitivityAnyAKI60PercentRandom, g_SensitivityAnyAKI70PercentRandom, g_SensitivityAnyAKI80PercentRandom, g_SensitivityAnyAKI90PercentRandom]
-
-g_SensitivityListForAKI1 = [g_SensitivityAKI110PercentRandom, g_SensitivityAKI120PercentRandom, g_SensitivityAKI130PercentRandom, g_SensitivityAKI140PercentRandom, g_SensitivityAKI150PercentRandom, g_SensitivityAKI160PercentRandom, g_SensitivityAKI170PercentRandom, g_SensitivityAKI180PercentRandom, g_SensitivityAKI190PercentRandom]
-
-g_SensitivityListForAKI2 = [g_SensitivityAKI210PercentRandom, g_SensitivityAKI220PercentRandom, g_SensitivityAKI230PercentRandom, g_SensitivityAKI240PercentRandom, g_SensitivityAKI250PercentRandom, g_SensitivityAKI260PercentRandom, g_SensitivityAKI270PercentRandom, g_SensitivityAKI280PercentRandom, g_SensitivityAKI290PercentRandom]
-
-g_SensitivityListForAKI3 = [g_SensitivityAKI310PercentRandom, g_SensitivityAKI320PercentRandom, g_SensitivityAKI330PercentRandom, g_SensitivityAKI340PercentRandom, g_SensitivityAKI350PercentRandom, g_SensitivityAKI360PercentRandom, g_SensitivityAKI370PercentRandom, g_SensitivityAKI380PercentRandom, g_SensitivityAKI390PercentRandom]
+# Sensitivity from the runs above, as printed by FindAKIWithRandomSkips and FindAKIWithBandSkips.
+# Rows are Any AKI, KDIGO 1, KDIGO 2, KDIGO 3.
+# Columns are a 10%, 20%, ... 90% chance of skipping a lab.
+g_SensitivityRandom = np.array([
+    [0.8645, 0.7174, 0.58, 0.444, 0.3247, 0.2229, 0.1457, 0.0749, 0.0194],
+    [0.8655, 0.7167, 0.5847, 0.4483, 0.3288, 0.2316, 0.1575, 0.0797, 0.0224],
+    [0.8738, 0.7252, 0.5693, 0.4431, 0.3342, 0.2153, 0.1361, 0.0743, 0.0149],
+    [0.8289, 0.7039, 0.5592, 0.4013, 0.2566, 0.1513, 0.0461, 0.0263, 0.0]])
+
+g_LongAdmissionSensitivityRandom = np.array([
+    [0.866, 0.7464, 0.6268, 0.5072, 0.4019, 0.2871, 0.201, 0.11, 0.0383],
+    [0.882, 0.7697, 0.6348, 0.5225, 0.4213, 0.309, 0.2135, 0.1124, 0.0337],
+    [0.7308, 0.5769, 0.5769, 0.4231, 0.3077, 0.1538, 0.1154, 0.0769, 0.0385],
+    [1.0, 0.8, 0.6, 0.4, 0.2, 0.2, 0.2, 0.2, 0.2]])
+
+g_SensitivityBandSkipping = np.array([
+    [0.9047, 0.8205, 0.7558, 0.6846, 0.6092, 0.5532, 0.4935, 0.4288, 0.3756],
+    [0.8923, 0.7927, 0.7279, 0.6544, 0.5697, 0.5131, 0.4384, 0.3555, 0.2964],
+    [0.9307, 0.8812, 0.8045, 0.7401, 0.6856, 0.604, 0.604, 0.5965, 0.5545],
+    [0.9671, 0.9539, 0.9211, 0.8553, 0.8224, 0.8421, 0.7829, 0.7566, 0.7368]])
 
 ######################################################################
 INCLUDE_ADDITIVE_CRITERIA_FOR_AKI = True
@@ -514,36 +435,43 @@ MIN_SEQ_LENGTH_FOR_BAND = 2
 g_NumValuesToSkipInBollinger = 1
 
 
-g_TotalCSVFileOutput = ""
+# The lines of the CSV report. These are joined once when the file is written.
+g_CSVFileLineList = []
 
 
 ################################################################################
 #
-# [ProcessOneLabValue]
+# [GetAKIThresholds]
 #
+# The Cr values for AKI 1, 2 and 3 relative to a baseline Cr. These only change
+# when the baseline does, so callers compute them then and reuse them for 
+# every lab until the baseline moves again.
 ################################################################################
-def ProcessOneLabValue(valueFloat, numDaysSkipped, lowestCrIn48Hrs, lowestCrInAdmission, fIsCKD, medList):
-    global MAX_NUM_SKIPPED_DAYS
-    global g_NumPtsWithConsecutiveSkippedDays
-    global g_NumAKI0AfterSkippedDays
-    global g_NumAKI1AfterSkippedDays
-    global g_NumAKI2AfterSkippedDays
-    global g_NumAKI3AfterSkippedDays
-    global g_NumAKI0OnCKDAfterSkippedDays
-    global g_NumAKI1OnCKDAfterSkippedDays
-    global g_NumAKI2OnCKDAfterSkippedDays
-    global g_NumAKI3OnCKDAfterSkippedDays
+def GetAKIThresholds(baselineCr):
+    return (1.5 * baselineCr, 2.0 * baselineCr, 3.0 * baselineCr)
+# End - GetAKIThresholds
+
 
+
+
+
+################################################################################
+#
+# [GetAKIGradeWithAdditiveCriteria]
+#
+# This only classifies a single Cr. It does not touch any of the counters, so
+# it can be called anywhere a grade is needed.
+# akiThresholds comes from GetAKIThresholds for the current baseline.
+################################################################################
+def GetAKIGradeWithAdditiveCriteria(valueFloat, lowestCrIn48Hrs, akiThresholds):
     # From "2012 Kidney Disease: Improving Global Outcomes (KDIGO) Clinical Practice Guideline for Acute Kidney Injury (AKI)", 
     #   Kidney International Supplements (2012) 2, iv
     # AKI is defined as any of the following (Not Graded):
     #   Increase in SCr by X0.3 mg/dl (X26.5 lmol/l) within 48 hours; or
     #   Increase in SCr to X1.5 times baseline, which is known or presumed to have occurred within the prior 7 days; or
     #   Urine volume o0.5 ml/kg/h for 6 hours
-    akin1Threshold = 1.5 * lowestCrInAdmission
-    akin2Threshold = 2.0 * lowestCrInAdmission
-    akin3Threshold = 3.0 * lowestCrInAdmission
-    if ((INCLUDE_ADDITIVE_CRITERIA_FOR_AKI) and (lowestCrIn48Hrs <= MAX_CR_FOR_ADDITIVE_CRITERIA_FOR_AKI)):
+    akin1Threshold, akin2Threshold, akin3Threshold = akiThresholds
+    if (lowestCrIn48Hrs <= MAX_CR_FOR_ADDITIVE_CRITERIA_FOR_AKI):
         akin1aThreshold = lowestCrIn48Hrs + 0.3
     else:
         akin1aThreshold = akin1Threshold
@@ -558,30 +486,57 @@ def ProcessOneLabValue(valueFloat, numDaysSkipped, lowestCrIn48Hrs, lowestCrInAd
     elif ((lowestCrIn48Hrs > 0) and (valueFloat >= akin1aThreshold)):
         akiGrade = 1
 
-    if (numDaysSkipped >= MAX_NUM_SKIPPED_DAYS):
-        numDaysSkipped = MAX_NUM_SKIPPED_DAYS - 1
+    return akiGrade
+# End - GetAKIGradeWithAdditiveCriteria
+
+
+
+
+
+################################################################################
+#
+# [GetAKIGradeWithoutAdditiveCriteria]
+#
+# Without the +0.3 criteria, only the ratios to the baseline matter.
+################################################################################
+def GetAKIGradeWithoutAdditiveCriteria(valueFloat, lowestCrIn48Hrs, akiThresholds):
+    akin1Threshold, akin2Threshold, akin3Threshold = akiThresholds
+    akiGrade = 0
+    if (valueFloat >= akin3Threshold):
+        akiGrade = 3
+    elif (valueFloat >= akin2Threshold):
+        akiGrade = 2
+    elif (valueFloat >= akin1Threshold):
+        akiGrade = 1
+
+    return akiGrade
+# End - GetAKIGradeWithoutAdditiveCriteria
+
+
+# INCLUDE_ADDITIVE_CRITERIA_FOR_AKI does not change during a run, so pick the 
+# classifier once instead of testing the flag on every lab.
+if (INCLUDE_ADDITIVE_CRITERIA_FOR_AKI):
+    GetAKIGrade = GetAKIGradeWithAdditiveCriteria
+else:
+    GetAKIGrade = GetAKIGradeWithoutAdditiveCriteria
 
-    g_NumPtsWithConsecutiveSkippedDays[numDaysSkipped] += 1
 
-    ##################################
-    if (akiGrade == 0):
-        g_NumAKI0AfterSkippedDays[numDaysSkipped] += 1
-        if (fIsCKD):
-            g_NumAKI0OnCKDAfterSkippedDays[numDaysSkipped] += 1
-    elif (akiGrade == 1):
-        g_NumAKI1AfterSkippedDays[numDaysSkipped] += 1
-        if (fIsCKD):
-            g_NumAKI1OnCKDAfterSkippedDays[numDaysSkipped] += 1
-    elif (akiGrade == 2):
-        g_NumAKI2AfterSkippedDays[numDaysSkipped] += 1
-        if (fIsCKD):
-            g_NumAKI2OnCKDAfterSkippedDays[numDaysSkipped] += 1
-    elif (akiGrade == 3):
-        g_NumAKI3AfterSkippedDays[numDaysSkipped] += 1
-        if (fIsCKD):
-            g_NumAKI3OnCKDAfterSkippedDays[numDaysSkipped] += 1
 
 
+
+################################################################################
+#
+# [ProcessOneLabValue]
+#
+################################################################################
+def ProcessOneLabValue(valueFloat, numDaysSkipped, lowestCrIn48Hrs, akiThresholds, 
+                       daysSkippedList, akiGradeList):
+    akiGrade = GetAKIGrade(valueFloat, lowestCrIn48Hrs, akiThresholds)
+
+    # The histograms are updated once per admission by RecordLabGradesForAdmission.
+    daysSkippedList.append(numDaysSkipped)
+    akiGradeList.append(akiGrade)
+
     return akiGrade
 # End - ProcessOneLabValue
 
@@ -591,71 +546,95 @@ def ProcessOneLabValue(valueFloat, numDaysSkipped, lowestCrIn48Hrs, lowestCrInAd
 
 ################################################################################
 #
-# [RecordOneAKI]
+# [RecordLabGradesForAdmission]
 #
+# Add the labs collected by ProcessOneLabValue for one admission to the
+# skipped-day histograms.
 ################################################################################
-def RecordOneAKI(akiGrade, baselineCr, medList, akiDayNum):
-    global g_TotalNumNonESRDAdmissionsAllYears
+def RecordLabGradesForAdmission(daysSkippedList, akiGradeList, fIsCKD):
+    global g_NumPtsWithConsecutiveSkippedDays
+    global g_AKICountsAfterSkippedDays
+
+    if (len(daysSkippedList) <= 0):
+        return
+
+    daysSkippedArray = np.array(daysSkippedList, dtype=np.int64)
+    akiGradeArray = np.array(akiGradeList, dtype=np.int64)
+    # Long gaps all go in the last bucket.
+    np.minimum(daysSkippedArray, MAX_NUM_SKIPPED_DAYS - 1, out=daysSkippedArray)
+
+    g_NumPtsWithConsecutiveSkippedDays += np.bincount(daysSkippedArray, minlength=MAX_NUM_SKIPPED_DAYS)
+
+    np.add.at(g_AKICountsAfterSkippedDays[AKI_COUNTS_ALL_PATIENTS], (akiGradeArray, daysSkippedArray), 1)
+    if (fIsCKD):
+        np.add.at(g_AKICountsAfterSkippedDays[AKI_COUNTS_CKD_PATIENTS], (akiGradeArray, daysSkippedArray), 1)
+# End - RecordLabGradesForAdmission
+
+
+
+
+
+################################################################################
+#
+# [GetMedClassMask]
+#
+# medList is the comma-separated med string of an admission. This is a
+# substring match, so "Furos" also matches "FurosIV".
+################################################################################
+def GetMedClassMask(medList):
+    medClassMask = 0
+    for medClass, medNameTuple in MED_CLASS_NAMES_LIST:
+        if (any((medName in medList) for medName in medNameTuple)):
+            medClassMask |= (1 << medClass)
+    # End - for medClass, medNameTuple in MED_CLASS_NAMES_LIST:
+
+    return medClassMask
+# End - GetMedClassMask
+
+
+
+
+
+################################################################################
+#
+# [RecordAKIsForAdmission]
+#
+# akiList is the (akiGrade, baselineCr, akiDayNum) of each AKI that ExamineLabList
+# found in one admission. Every grade is > 0.
+################################################################################
+def RecordAKIsForAdmission(akiList, medClassMask):
     global g_TotalAKIAllYears
     global g_TotalAKI1AllYears
     global g_TotalAKI2AllYears
     global g_TotalAKI3AllYears
-    global g_OnDiureticsAtAKI
-    global g_OnVancAtAKI
-    global g_OnACEARBAtAKI
-    global g_OnNSAIDAtAKI
-    global g_OnTacCsaAtAKI
-    global g_OnPamidAtAKI
-    global g_OnChemoAtAKI
-    global g_DayNumOfAKI
-    global g_DayNumOfAKI1
-    global g_DayNumOfAKI2
-    global g_DayNumOfAKI3
-
-    if (akiGrade <= 0):
+    global g_NumAKIsOnMedClass
+    global g_DayNumOfAKIByGrade
+    global g_BaselineCrBeforeAKI
+
+    numAKIs = len(akiList)
+    if (numAKIs <= 0):
         return
 
-    g_TotalAKIAllYears += 1
-    if (akiGrade == 3):
-        g_TotalAKI3AllYears += 1
-    elif (akiGrade == 2):
-        g_TotalAKI2AllYears += 1
-    elif (akiGrade == 1):
-        g_TotalAKI1AllYears += 1
+    akiGradeList, baselineCrList, akiDayNumList = zip(*akiList)
+    akiGradeArray = np.array(akiGradeList, dtype=np.int64)
 
-    bucketNum = int(baselineCr / INCREMENT_PER_CR_BUCKET)
-    if (bucketNum >= NUM_BASELINE_CR_BUCKETS):
-        bucketNum = NUM_BASELINE_CR_BUCKETS - 1
-    g_BaselineCrBeforeAKI[bucketNum] += 1
+    numAKIsPerGrade = np.bincount(akiGradeArray, minlength=NUM_AKI_GRADES)
+    g_TotalAKIAllYears += numAKIs
+    g_TotalAKI1AllYears += int(numAKIsPerGrade[1])
+    g_TotalAKI2AllYears += int(numAKIsPerGrade[2])
+    g_TotalAKI3AllYears += int(numAKIsPerGrade[3])
 
-    # Record when this happened.
-    if (akiDayNum >= MAX_NUM_SKIPPED_DAYS):
-        akiDayNum = MAX_NUM_SKIPPED_DAYS - 1
-    g_DayNumOfAKI[akiDayNum] += 1
-    if (akiGrade == 3):
-        g_DayNumOfAKI3[akiDayNum] += 1
-    elif (akiGrade == 2):
-        g_DayNumOfAKI2[akiDayNum] += 1
-    elif (akiGrade == 1):
-        g_DayNumOfAKI1[akiDayNum] += 1
+    bucketArray = (np.array(baselineCrList) / INCREMENT_PER_CR_BUCKET).astype(np.int64)
+    np.clip(bucketArray, 0, NUM_BASELINE_CR_BUCKETS - 1, out=bucketArray)
+    g_BaselineCrBeforeAKI += np.bincount(bucketArray, minlength=NUM_BASELINE_CR_BUCKETS)
 
+    # Record when these happened.
+    akiDayNumArray = np.minimum(np.array(akiDayNumList, dtype=np.int64), MAX_NUM_SKIPPED_DAYS - 1)
+    np.add.at(g_DayNumOfAKIByGrade, (akiGradeArray, akiDayNumArray), 1)
 
-    if (("FurosIV" in medList) or ("Furos" in medList) or ("Tors" in medList) or ("Bumet" in medList) 
-            or ("Spiro" in medList) or ("Chlorthal" in medList)):
-        g_OnDiureticsAtAKI += 1
-    if ("Vanc" in medList):
-        g_OnVancAtAKI += 1
-    if (("Lisin" in medList) or ("Enalapril" in medList) or ("Losar" in medList) or ("Valsar" in medList)):
-        g_OnACEARBAtAKI += 1
-    if (("Ibup" in medList) or ("Ketor" in medList) or ("Naprox" in medList) or ("Diclof" in medList)):
-        g_OnNSAIDAtAKI += 1
-    if (("Tac" in medList) or ("CsA" in medList)):
-        g_OnTacCsaAtAKI += 1
-    if (("Pamid" in medList)):
-        g_OnPamidAtAKI += 1
-    if (("Cisplat" in medList) or ("Tenof" in medList) or ("MTX" in medList)):
-        g_OnChemoAtAKI += 1
-# End - RecordOneAKI
+    # The meds are the same for every AKI in the admission.
+    g_NumAKIsOnMedClass += numAKIs * ((medClassMask >> MED_CLASS_BIT_SHIFTS) & 1)
+# End - RecordAKIsForAdmission
 
 
 
@@ -669,63 +648,80 @@ def RecordOneAKI(akiGrade, baselineCr, medList, akiDayNum):
 # [ExamineLabList]
 #
 ################################################################################
-def ExamineLabList(eventList, medList, fIsCKD, diagnosisList):
+def ExamineLabList(eventList, medClassMask, fIsCKD, diagnosisList):
     global g_TotalNumNonESRDAdmissionsAllYears
     global g_TotalNumLabsChecked
     global g_TotalAKIOnAdmissionAllYears
-    global g_TotalAKI1OnAdmissionAllYears
-    global g_TotalAKI2OnAdmissionAllYears
-    global g_TotalAKI3OnAdmissionAllYears
-    global g_AllPatientsComorbidityGroup
+    global g_TotalAKIOnAdmissionByGrade
     global g_AKI1ComorbidityGroup
     global g_AKI2ComorbidityGroup
     global g_AKI3ComorbidityGroup
-    global g_CKDComorbidityGroup
 
+    # FindAKIInfo adds the diagnoses to g_AllPatientsComorbidityGroup once for the 
+    # real admission, so they are not added again for each virtual admission.
     g_TotalNumNonESRDAdmissionsAllYears += 1
-    g_AllPatientsComorbidityGroup.AddDiagnosisList(diagnosisList)
 
-    # Count the first value.
-    if (len(eventList) > 0):
-        g_TotalNumLabsChecked += 1
+    numEvents = len(eventList)
+    if (numEvents <= 0):
+        return
 
-    # Now, iterate through each event
+    # The day numbers, gaps and the lowest Cr of the admission do not depend on 
+    # the AKI state below, so get them for the whole list at once.
+    # Only the first lab on each day is graded. A later lab on the same day still
+    # moves the 48hr window.
+    dayArray = eventList["Day"]
+    valueArray = eventList["Val"]
+    dayGapArray = np.diff(dayArray)
+    fIsNewDayArray = (dayGapArray != 0)
+    numNewDays = int(np.count_nonzero(fIsNewDayArray))
+
+    # Count the first value, and every value on a new day.
+    g_TotalNumLabsChecked += 1 + numNewDays
+
+    firstCrInAdmission = float(valueArray[0])
     lowestCrInAdmission = -1
-    firstCrInAdmission = -1
-    fHavePreviousValue = False
-    previousDayNum = -1
-    previousValue = -1
-    twoDayPrevValue = -1
-    lowestCrInSequence = -1
-    highestAKIGradeInSequence = 0
-    firstDayOfAdmission = -1
-    for eventInfo in eventList:
-        dayNum = eventInfo["Day"]
-        valueFloat = eventInfo["Val"]
+    if (numNewDays > 0):
+        lowestCrInAdmission = float(valueArray[1:][fIsNewDayArray].min())
 
-        if (firstDayOfAdmission == -1):
-            firstDayOfAdmission = dayNum
-        if (firstCrInAdmission == -1):
-            firstCrInAdmission = valueFloat
+    # The lowest Cr in the 48hrs before each lab is the lower of the two values
+    # before it. The second lab only has one value before it.
+    lowestCrIn48HrsArray = valueArray[:-1].copy()
+    twoValuesBackArray = np.where(valueArray[:-2] > 0, valueArray[:-2], np.inf)
+    lowestCrIn48HrsArray[1:] = np.minimum(valueArray[1:-1], twoValuesBackArray)
 
-        dayNumInCurrentAdmission = dayNum - firstDayOfAdmission
-        #print("dayNumInCurrentAdmission = " + str(dayNumInCurrentAdmission))
+    valueList = valueArray.tolist()
+    lowestCrIn48HrsList = lowestCrIn48HrsArray.tolist()
+    dayNumInAdmissionList = (dayArray - dayArray[0]).tolist()
+    numDaysSkippedList = (dayGapArray - 1).tolist()
+    fIsNewDayList = fIsNewDayArray.tolist()
 
-        if ((fHavePreviousValue) and (dayNum != previousDayNum)):
-            numDaysSkipped = (dayNum - previousDayNum) - 1
+    # Now, iterate through each event
+    resolvedAKIIndex = -1
+    lowestCrInSequence = -1
+    akiThresholdsInSequence = None
+    highestAKIGradeInSequence = 0
+    daysSkippedList = []
+    akiGradeList = []
+    akiList = []
+    for index in range(1, numEvents):
+        valueFloat = valueList[index]
+
+        if (fIsNewDayList[index - 1]):
+            numDaysSkipped = numDaysSkippedList[index - 1]
 
-            g_TotalNumLabsChecked += 1
-            if ((lowestCrInAdmission == -1) or (valueFloat < lowestCrInAdmission)):
-                lowestCrInAdmission = valueFloat
             if ((lowestCrInSequence == -1) or (valueFloat < lowestCrInSequence)):
                 lowestCrInSequence = valueFloat
+                akiThresholdsInSequence = GetAKIThresholds(lowestCrInSequence)
 
-            lowestCrIn48Hrs = previousValue
-            if ((twoDayPrevValue > 0) and (twoDayPrevValue < lowestCrIn48Hrs)):
-                lowestCrIn48Hrs = twoDayPrevValue
+            # Right after an AKI resolves, the 48hr window starts over at the lab 
+            # that ended it.
+            if ((index - 1) == resolvedAKIIndex):
+                lowestCrIn48Hrs = valueList[index - 1]
+            else:
+                lowestCrIn48Hrs = lowestCrIn48HrsList[index - 1]
 
             currentAKIGrade = ProcessOneLabValue(valueFloat, numDaysSkipped, lowestCrIn48Hrs, 
-                                                 lowestCrInSequence, fIsCKD, medList)
+                                                 akiThresholdsInSequence, daysSkippedList, akiGradeList)
 
             # If a Cr rises to AKIN1 then to AKIN2 then to AKIN3, we just count the AKIN3.
             # So, only record the highest grade AKI.
@@ -738,51 +734,43 @@ def ExamineLabList(eventList, medList, fIsCKD, diagnosisList):
                 # We will count the admitting AKI at the end of the admission, after we have
                 # found the final baseline Cr
                 if (lowestCrInSequence != firstCrInAdmission):
-                    RecordOneAKI(highestAKIGradeInSequence, lowestCrInSequence, medList, 
-                                 dayNumInCurrentAdmission)
+                    akiList.append((highestAKIGradeInSequence, lowestCrInSequence, dayNumInAdmissionList[index]))
                 # End - if (lowestCrInSequence != firstCrInAdmission):
 
                 # Reset the state so we can find a second AKI on the same admission.
-                previousValue = -1
+                resolvedAKIIndex = index
                 highestAKIGradeInSequence = 0
                 lowestCrInSequence = -1    
             # End - elif ((currentAKIGrade < highestAKIGradeInSequence) and (highestAKIGradeInSequence > 0)):
-        # End - if (fHavePreviousValue):
-
-        fHavePreviousValue = True
-        previousDayNum = dayNum
-        twoDayPrevValue = previousValue
-        previousValue = valueFloat
-    # End - for eventInfo in eventList:
+        # End - if (fIsNewDayList[index - 1]):
+    # End - for index in range(1, numEvents):
 
     # Finish the AKI we were tracking. It may never have resolved, for example if a patient dies or
     # leaves AMA.
     if (highestAKIGradeInSequence > 0):
-        RecordOneAKI(highestAKIGradeInSequence, lowestCrInSequence, medList, 
-                    dayNumInCurrentAdmission)
+        akiList.append((highestAKIGradeInSequence, lowestCrInSequence, dayNumInAdmissionList[-1]))
 
     # Check if there was an AKI on admission.
     # This is a bit like doing a film effect by filming a structure crumbling and then
     # playing the film backwards so the structure seems to assemble.
     # We look for an AKI on admission by looking for a recovery back to the old baseline,
     # then pretending it went in the reverse order.
+    # The first lab of the admission has no skipped days before it.
     if ((firstCrInAdmission != -1) and (lowestCrInAdmission != -1)):
-        currentAKIGrade = ProcessOneLabValue(firstCrInAdmission, numDaysSkipped, firstCrInAdmission, 
-                                             lowestCrInAdmission, fIsCKD, medList)
+        currentAKIGrade = ProcessOneLabValue(firstCrInAdmission, 0, firstCrInAdmission, 
+                                             GetAKIThresholds(lowestCrInAdmission), 
+                                             daysSkippedList, akiGradeList)
         if (currentAKIGrade > 0):
-            RecordOneAKI(currentAKIGrade, lowestCrInAdmission, medList, 0)
+            akiList.append((currentAKIGrade, lowestCrInAdmission, 0))
             g_TotalAKIOnAdmissionAllYears += 1
-            if (currentAKIGrade == 3):
-                g_TotalAKI3OnAdmissionAllYears += 1
-                g_AKI3ComorbidityGroup.AddDiagnosisList(diagnosisList)
-            elif (currentAKIGrade == 2):
-                g_TotalAKI2OnAdmissionAllYears += 1
-                g_AKI2ComorbidityGroup.AddDiagnosisList(diagnosisList)
-            elif (currentAKIGrade == 1):
-                g_TotalAKI1OnAdmissionAllYears += 1
-                g_AKI1ComorbidityGroup.AddDiagnosisList(diagnosisList)
+            g_TotalAKIOnAdmissionByGrade[currentAKIGrade] += 1
+            akiComorbidityGroupList = [None, g_AKI1ComorbidityGroup, g_AKI2ComorbidityGroup, g_AKI3ComorbidityGroup]
+            akiComorbidityGroupList[currentAKIGrade].AddDiagnosisList(diagnosisList)
         # End - if (currentAKIGrade > 0)
     # if ((firstCrInAdmission != -1) and (lowestCrInAdmission != -1)):
+
+    RecordLabGradesForAdmission(daysSkippedList, akiGradeList, fIsCKD)
+    RecordAKIsForAdmission(akiList, medClassMask)
 # End - ExamineLabList
 
 
@@ -791,6 +779,52 @@ def ExamineLabList(eventList, medList, fIsCKD, diagnosisList):
 
 
 
+################################################################################
+#
+# [FilterLabListWithoutSkips]
+#
+# This is FilterLabList when no labs are skipped. Every lab is kept, so each
+# virtual admission is just a run of consecutive days, and the runs can be
+# found for the whole list at once.
+################################################################################
+def FilterLabListWithoutSkips(eventList, medClassMask, fIsCKD, diagnosisList,
+                                firstDayInt, vitrualAdmissionStartsAfterNDaysInHospital):
+    global g_TotalNumLabsConsidered
+    global g_TotalNumLabsPerformed
+    global g_TotalVirtualDays
+    global g_NumVirtualAdmissions
+    global g_TotalVirtDaysInHospital
+
+    if (vitrualAdmissionStartsAfterNDaysInHospital > 0):
+        daysInHospitalArray = eventList["Day"] - firstDayInt
+        eventList = eventList[daysInHospitalArray >= vitrualAdmissionStartsAfterNDaysInHospital]
+
+    numEvents = len(eventList)
+    if (numEvents <= 0):
+        return
+
+    # A new virtual admission starts at every lab that is not on the day after the 
+    # previous lab. The first lab also counts as a day of the first virtual admission.
+    fExtendsSequenceArray = (np.diff(eventList["Day"]) == 1)
+    numDaysInSequences = 1 + int(np.count_nonzero(fExtendsSequenceArray))
+    g_TotalVirtualDays += numDaysInSequences
+    g_TotalNumLabsConsidered += numDaysInSequences
+    g_TotalNumLabsPerformed += numDaysInSequences
+
+    sequenceStartList = [0] + (np.flatnonzero(~fExtendsSequenceArray) + 1).tolist() + [numEvents]
+    for startIndex, stopIndex in zip(sequenceStartList[:-1], sequenceStartList[1:]):
+        if ((stopIndex - startIndex) >= MIN_NUMBER_DAYS_FOR_SIMULATE_SKIPPING):
+            g_NumVirtualAdmissions += 1
+            g_TotalVirtDaysInHospital += (stopIndex - startIndex)
+            ExamineLabList(eventList[startIndex:stopIndex], medClassMask, fIsCKD, diagnosisList)
+    # End - for startIndex, stopIndex in zip(sequenceStartList[:-1], sequenceStartList[1:]):
+# End - FilterLabListWithoutSkips
+
+
+
+
+
+
 ################################################################################
 #
 # [FilterLabList]
@@ -799,7 +833,7 @@ def ExamineLabList(eventList, medList, fIsCKD, diagnosisList):
 # admission.
 ################################################################################
 def FilterLabList(eventList, fRandomSkips, fBandSkips, randomChanceOfSkip, 
-                    medList, fIsCKD, diagnosisList,
+                    medClassMask, fIsCKD, diagnosisList,
                     firstDayInt, vitrualAdmissionStartsAfterNDaysInHospital):
     global g_TotalNumLabsConsidered
     global g_TotalNumLabsSkipped
@@ -809,7 +843,11 @@ def FilterLabList(eventList, fRandomSkips, fBandSkips, randomChanceOfSkip,
     global g_TotalVirtDaysInHospital
     global g_NumValuesToSkipInBollinger
 
-    currentEventList = []
+    if ((not fRandomSkips) and (not fBandSkips)):
+        FilterLabListWithoutSkips(eventList, medClassMask, fIsCKD, diagnosisList,
+                                    firstDayInt, vitrualAdmissionStartsAfterNDaysInHospital)
+        return
+
     previousDayNum = -1
     numValuesInSeq = 0
     sumOfValuesInSeq = 0
@@ -817,9 +855,17 @@ def FilterLabList(eventList, fRandomSkips, fBandSkips, randomChanceOfSkip,
     fSkipNextNValues = 0
     fAlwaysUseValue = False
     g_NumValuesToSkipInBollinger = 1
-    for eventInfo in eventList:
-        dayNum = eventInfo["Day"]
-        valueFloat = eventInfo["Val"]
+    dayList = eventList["Day"].tolist()
+    valueList = eventList["Val"].tolist()
+    # Draw every random number the skip decisions could need at once.
+    randomDrawList = np.random.random(len(dayList)).tolist()
+    # Each virtual admission is the labs kept from sequenceStartIndex up to the
+    # current lab, so it is a single masked slice of eventList.
+    fKeepLabList = [False] * len(dayList)
+    sequenceStartIndex = 0
+    for eventIndex in range(len(dayList)):
+        dayNum = dayList[eventIndex]
+        valueFloat = valueList[eventIndex]
 
         if (vitrualAdmissionStartsAfterNDaysInHospital > 0):
             daysInHospital = dayNum - firstDayInt
@@ -849,23 +895,24 @@ def FilterLabList(eventList, fRandomSkips, fBandSkips, randomChanceOfSkip,
                 fAlwaysUseValue = False
             ################################
             # Random skips
-            elif ((fRandomSkips) and (random.random() < randomChanceOfSkip)):
+            elif ((fRandomSkips) and (randomDrawList[eventIndex] < randomChanceOfSkip)):
                 fIncludeDay = False
             ################################
             # Bollinger-Band like skips
+            # The random draw is checked first, so the band is only computed when 
+            # this lab could actually be skipped.
             elif ((fBandSkips) 
+                    and (randomDrawList[eventIndex] < randomChanceOfSkip)
                     and (numValuesInSeq >= MIN_SEQ_LENGTH_FOR_BAND) 
                     and (latestPreviousValue > 0)):
-                avgVal = float(sumOfValuesInSeq / numValuesInSeq)
+                avgVal = sumOfValuesInSeq / numValuesInSeq
                 upperBand = avgVal * UPPER_BAND_DISTANCE_FROM_AVG
                 lowerBand = avgVal * LOWER_BAND_DISTANCE_FROM_AVG
-                if ((latestPreviousValue >= lowerBand) 
-                        and (latestPreviousValue <= upperBand) 
-                        and (random.random() < randomChanceOfSkip)):
+                if (lowerBand <= latestPreviousValue <= upperBand):
                     fSkipNextNValues = g_NumValuesToSkipInBollinger
                     g_NumValuesToSkipInBollinger += 1
                     fIncludeDay = False
-                # End - if ((latestPreviousValue >= lowerBand) and (latestPreviousValue <= upperBand)):
+                # End - if (lowerBand <= latestPreviousValue <= upperBand):
             # End - if (fBandSkips)
 
 
@@ -875,33 +922,37 @@ def FilterLabList(eventList, fRandomSkips, fBandSkips, randomChanceOfSkip,
                 numValuesInSeq += 1
                 sumOfValuesInSeq += valueFloat
                 latestPreviousValue = valueFloat
-                currentEventList.append(eventInfo)
+                fKeepLabList[eventIndex] = True
             else:
                 g_TotalNumLabsSkipped += 1
         else:
             # Otherwise, we have skipped a day, so have ended a series of contiguous days.
             # Process the sub-list we have so far
-            if (len(currentEventList) >= MIN_NUMBER_DAYS_FOR_SIMULATE_SKIPPING):
+            if (numValuesInSeq >= MIN_NUMBER_DAYS_FOR_SIMULATE_SKIPPING):
                 g_NumVirtualAdmissions += 1
-                g_TotalVirtDaysInHospital += len(currentEventList)
-                ExamineLabList(currentEventList, medList, fIsCKD, diagnosisList)
+                g_TotalVirtDaysInHospital += numValuesInSeq
+                sequenceEventList = eventList[sequenceStartIndex:eventIndex]
+                ExamineLabList(sequenceEventList[fKeepLabList[sequenceStartIndex:eventIndex]], 
+                               medClassMask, fIsCKD, diagnosisList)
 
             # Now, start a new sub-list
-            currentEventList = []
-            currentEventList.append(eventInfo)
+            sequenceStartIndex = eventIndex
+            fKeepLabList[eventIndex] = True
             numValuesInSeq = 1
             sumOfValuesInSeq = valueFloat
             latestPreviousValue = valueFloat
         # End - Finishing one sequence and starting the next
 
         previousDayNum = dayNum
-    # End - for eventInfo in eventList:
+    # End - for eventIndex in range(len(dayList)):
 
     # Process any sub-list we were building when we hit the end of the main list
-    if (len(currentEventList) >= MIN_NUMBER_DAYS_FOR_SIMULATE_SKIPPING):
+    if (numValuesInSeq >= MIN_NUMBER_DAYS_FOR_SIMULATE_SKIPPING):
         g_NumVirtualAdmissions += 1
-        g_TotalVirtDaysInHospital += len(currentEventList)
-        ExamineLabList(currentEventList, medList, fIsCKD, diagnosisList)
+        g_TotalVirtDaysInHospital += numValuesInSeq
+        sequenceEventList = eventList[sequenceStartIndex:]
+        ExamineLabList(sequenceEventList[fKeepLabList[sequenceStartIndex:]], 
+                       medClassMask, fIsCKD, diagnosisList)
 # End - FilterLabList
 
 
@@ -960,36 +1011,23 @@ def FindAKIInfo(srcFilePathName, fVirtualAdmissions, fRandomSkips, fBandSkips,
         # Get a list of all admissions.
         admissionList = srcTDF.GetAdmissionsForCurrentPatient()
         for admissionInfo in admissionList:
-            firstDay = admissionInfo['FirstDay']
-            lastDay = admissionInfo['LastDay']
-            team = admissionInfo['Team']
-            admitClass = admissionInfo['AdmitClass']
+            # The TDF reader already stores the first and last days as ints.
+            firstDayInt = admissionInfo['FirstDay']
+            lastDayInt = admissionInfo['LastDay']
             medList = admissionInfo['Meds']
 
-            # Get all data points for the patient.
-            firstDayInt = int(firstDay)
-            lastDayInt = int(lastDay)
-
             lengthOfStay = (lastDayInt - firstDayInt) + 1
             g_TotalDaysInHospital += lengthOfStay
 
             # Check if the patient looks like a dialysis patient.
             gfrEventList = srcTDF.GetValuesBetweenDays("GFR", firstDayInt, lastDayInt, True)
-            fIsDialysisPatient = True
             highestGFR = -1
-            for eventInfo in gfrEventList:
-                valueFloat = eventInfo["Val"]
-
-                # A bad AKI may cause GFR to drop to 15 or lower for a brief period before rebounding.
-                # However, a dialysis patient will never have a decent GFR, even after a run.
-                # If a patient never has a GFR over 20, then they are a dialysis patient.
-                if (valueFloat >= MIN_GFR_FOR_NON_ESRD):
-                    fIsDialysisPatient = False
-                    # Don't stop looking, we still need to see the highest GFR
-
-                if ((highestGFR < 0) or (valueFloat >= highestGFR)):
-                    highestGFR = valueFloat
-            # End - for eventInfo in gfrEventList:
+            if (len(gfrEventList) > 0):
+                highestGFR = float(gfrEventList["Val"].max())
+            # A bad AKI may cause GFR to drop to 15 or lower for a brief period before rebounding.
+            # However, a dialysis patient will never have a decent GFR, even after a run.
+            # If a patient never has a GFR over 20, then they are a dialysis patient.
+            fIsDialysisPatient = (highestGFR < MIN_GFR_FOR_NON_ESRD)
 
             g_TotalNumAdmissionsAllYears += 1
 
@@ -1005,7 +1043,7 @@ def FindAKIInfo(srcFilePathName, fVirtualAdmissions, fRandomSkips, fBandSkips,
 
             #################################
             # Diagnoses. These are used for Elixhauser stats
-            diagnosisList = srcTDF.GetDiagnosesForCurrentPatient(firstDay, lastDay)
+            diagnosisList = srcTDF.GetDiagnosesForCurrentPatient(firstDayInt, lastDayInt)
             g_AllPatientsComorbidityGroup.AddDiagnosisList(diagnosisList)
 
             if (highestGFR < 60):
@@ -1015,14 +1053,15 @@ def FindAKIInfo(srcFilePathName, fVirtualAdmissions, fRandomSkips, fBandSkips,
                 fIsCKD = False
 
             saveNumAKIsBeforeAdmission = g_TotalAKIAllYears
+            medClassMask = GetMedClassMask(medList)
             crEventList = srcTDF.GetValuesBetweenDays("Cr", firstDayInt, lastDayInt, True)
 
             if (fVirtualAdmissions):
                 FilterLabList(crEventList, fRandomSkips, fBandSkips, randomChanceOfSkip, 
-                                medList, fIsCKD, diagnosisList,
+                                medClassMask, fIsCKD, diagnosisList,
                                 firstDayInt, vitrualAdmissionStartsAfterNDaysInHospital)
             else:
-                ExamineLabList(crEventList, medList, fIsCKD, diagnosisList)
+                ExamineLabList(crEventList, medClassMask, fIsCKD, diagnosisList)
             
             if (saveNumAKIsBeforePatient != g_TotalAKIAllYears):
                 g_TotalNumPatientsWithAKI += 1
@@ -1041,9 +1080,9 @@ def FindAKIInfo(srcFilePathName, fVirtualAdmissions, fRandomSkips, fBandSkips,
 #
 ################################################################################
 def RecordNumberResult(captionStr, singleValue):
-    global g_TotalCSVFileOutput
+    global g_CSVFileLineList
 
-    g_TotalCSVFileOutput = g_TotalCSVFileOutput + captionStr + "," + str(singleValue) + "\n"
+    g_CSVFileLineList.append(captionStr + "," + str(singleValue) + "\n")
     print(captionStr + ": " + str(singleValue))
 # End - RecordNumberResult
 
@@ -1055,17 +1094,10 @@ def RecordNumberResult(captionStr, singleValue):
 #
 ################################################################################
 def RecordVectorResult(captionStr, valueList):
-    global g_TotalCSVFileOutput
-
-    newLineStr = ""
-    for value in valueList:
-        newLineStr = newLineStr + str(value) + ","
-
-    # Remove the comma at the end.
-    if (newLineStr != ""):
-        newLineStr = newLineStr[:-1]
+    global g_CSVFileLineList
 
-    g_TotalCSVFileOutput = g_TotalCSVFileOutput + captionStr + "," + newLineStr + "\n"
+    newLineStr = ",".join(str(value) for value in valueList)
+    g_CSVFileLineList.append(captionStr + "," + newLineStr + "\n")
     print(captionStr + ": " + str(valueList))
 # End - RecordVectorResult
 
@@ -1077,13 +1109,13 @@ def RecordVectorResult(captionStr, valueList):
 #
 ################################################################################
 def WriteCSVFile(filePathName):
-    global g_TotalCSVFileOutput
+    global g_CSVFileLineList
 
-    if (g_TotalCSVFileOutput == ""):
+    if (len(g_CSVFileLineList) <= 0):
         return
 
     fileH = open(filePathName, "w+")
-    fileH.write(g_TotalCSVFileOutput)
+    fileH.write("".join(g_CSVFileLineList))
     fileH.close()
 # End - WriteCSVFile
 
@@ -1134,24 +1166,25 @@ def ComputeBaseline(filePathName):
     RecordNumberResult("Fraction Non-ESRD Admissions with AKI 2 All Years", fractionAKI2AllYears)
     RecordNumberResult("Fraction Non-ESRD Admissions with AKI 3 All Years", fractionAKI3AllYears)
 
+    totalAKI1OnAdmission, totalAKI2OnAdmission, totalAKI3OnAdmission = g_TotalAKIOnAdmissionByGrade[1:].tolist()
     RecordNumberResult("Num Non-ESRD Admissions with any AKI At Admission All Years", g_TotalAKIOnAdmissionAllYears)
-    RecordNumberResult("Num Non-ESRD Admissions with AKI-1 At Admission All Years", g_TotalAKI1OnAdmissionAllYears)
-    RecordNumberResult("Num Non-ESRD Admissions with AKI-2 At Admission All Years", g_TotalAKI2OnAdmissionAllYears)
-    RecordNumberResult("Num Non-ESRD Admissions with AKI-3 At Admission All Years", g_TotalAKI3OnAdmissionAllYears)
+    RecordNumberResult("Num Non-ESRD Admissions with AKI-1 At Admission All Years", totalAKI1OnAdmission)
+    RecordNumberResult("Num Non-ESRD Admissions with AKI-2 At Admission All Years", totalAKI2OnAdmission)
+    RecordNumberResult("Num Non-ESRD Admissions with AKI-3 At Admission All Years", totalAKI3OnAdmission)
 
     fractionAnyAKIPOAAllYears = round((g_TotalAKIOnAdmissionAllYears / g_TotalAKIAllYears), 4)
-    fractionAKI1POAAllYears = round((g_TotalAKI1OnAdmissionAllYears / g_TotalAKI1AllYears), 4)
-    fractionAKI2POAAllYears = round((g_TotalAKI2OnAdmissionAllYears / g_TotalAKI2AllYears), 4)
-    fractionAKI3POAAllYears = round((g_TotalAKI3OnAdmissionAllYears / g_TotalAKI3AllYears), 4)
+    fractionAKI1POAAllYears = round((totalAKI1OnAdmission / g_TotalAKI1AllYears), 4)
+    fractionAKI2POAAllYears = round((totalAKI2OnAdmission / g_TotalAKI2AllYears), 4)
+    fractionAKI3POAAllYears = round((totalAKI3OnAdmission / g_TotalAKI3AllYears), 4)
     RecordNumberResult("Fraction Non-ESRD Admissions with Any AKI On Admission All Years", fractionAnyAKIPOAAllYears)
     RecordNumberResult("Fraction Non-ESRD Admissions with AKI 1 On Admission All Years", fractionAKI1POAAllYears)
     RecordNumberResult("Fraction Non-ESRD Admissions with AKI 2 On Admission All Years", fractionAKI2POAAllYears)
     RecordNumberResult("Fraction Non-ESRD Admissions with AKI 3 On Admission All Years", fractionAKI3POAAllYears)
 
     numIatrogenicAnyAKIAllYears = g_TotalAKIAllYears - g_TotalAKIOnAdmissionAllYears
-    numIatrogenicAKI1AllYears = g_TotalAKI1AllYears - g_TotalAKI1OnAdmissionAllYears
-    numIatrogenicAKI2AllYears = g_TotalAKI2AllYears - g_TotalAKI2OnAdmissionAllYears
-    numIatrogenicAKI3AllYears = g_TotalAKI3AllYears - g_TotalAKI3OnAdmissionAllYears
+    numIatrogenicAKI1AllYears = g_TotalAKI1AllYears - totalAKI1OnAdmission
+    numIatrogenicAKI2AllYears = g_TotalAKI2AllYears - totalAKI2OnAdmission
+    numIatrogenicAKI3AllYears = g_TotalAKI3AllYears - totalAKI3OnAdmission
     RecordNumberResult("Num Iatrogenic Any AKI All Years", numIatrogenicAnyAKIAllYears)
     RecordNumberResult("Num Iatrogenic AKI 1 All Years", numIatrogenicAKI1AllYears)
     RecordNumberResult("Num Iatrogenic AKI 2 All Years", numIatrogenicAKI2AllYears)
@@ -1186,10 +1219,9 @@ def ComputeBaseline(filePathName):
     ##################################
     # Number of Consecutive Days Without Labs
     #RecordVectorResult("Num Consecutive Days without checking Creatinine", g_NumPtsWithConsecutiveSkippedDays)
-    fractionSkippedDays = []
-    for numLabs in g_NumPtsWithConsecutiveSkippedDays:
-        fractionLabsWithCr = round(float(numLabs / g_TotalNumLabsChecked), 4)
-        fractionSkippedDays.append(fractionLabsWithCr)
+    # The division is done on whole arrays, but the rounding uses round() because np.round 
+    # rounds exact halves to even and so would change the reported fractions.
+    fractionSkippedDays = [round(x, 4) for x in (g_NumPtsWithConsecutiveSkippedDays / g_TotalNumLabsChecked).tolist()]
     DrawLineGraph("Fraction of Creatinine Labs After Consecutive Skipped Days", 
                   "Num Consecutive Days Skipped", g_NumDaysSkippedXAxis, 
                   "Fractions of Cr Labs", fractionSkippedDays, 
@@ -1197,22 +1229,20 @@ def ComputeBaseline(filePathName):
 
 
     # Iatrogenic vs PoA AKI
-    numIatrogenicAKIAll = sum(g_DayNumOfAKI) - g_DayNumOfAKI[0]
-    numIatrogenicAKI1 = sum(g_DayNumOfAKI1) - g_DayNumOfAKI1[0]
-    numIatrogenicAKI2 = sum(g_DayNumOfAKI2) - g_DayNumOfAKI2[0]
-    numIatrogenicAKI3 = sum(g_DayNumOfAKI3) - g_DayNumOfAKI3[0]
-    fractionOfAKIPerDay = [round((x / numIatrogenicAKIAll), 3) for x in g_DayNumOfAKI]
-    fractionOfAKI1PerDay = [round((x / numIatrogenicAKI1), 3) for x in g_DayNumOfAKI1]
-    fractionOfAKI2PerDay = [round((x / numIatrogenicAKI2), 3) for x in g_DayNumOfAKI2]
-    fractionOfAKI3PerDay = [round((x / numIatrogenicAKI3), 3) for x in g_DayNumOfAKI3]
-    fractionOfAKIPerDay[0] = 0
-    fractionOfAKI1PerDay[0] = 0
-    fractionOfAKI2PerDay[0] = 0
-    fractionOfAKI3PerDay[0] = 0
-    print("g_DayNumOfAKI = " + str(g_DayNumOfAKI))
-    print("g_DayNumOfAKI1 = " + str(g_DayNumOfAKI1))
-    print("g_DayNumOfAKI2 = " + str(g_DayNumOfAKI2))
-    print("g_DayNumOfAKI3 = " + str(g_DayNumOfAKI3))
+    # Row 0 of g_DayNumOfAKIByGrade is never used, so it holds all AKIs here.
+    # Day 0 is AKI on admission, so it is not counted as iatrogenic.
+    dayNumOfAKIByGrade = g_DayNumOfAKIByGrade.copy()
+    dayNumOfAKIByGrade[0] = g_DayNumOfAKIByGrade.sum(axis=0)
+    numIatrogenicAKIByGrade = dayNumOfAKIByGrade[:, 1:].sum(axis=1, keepdims=True)
+    fractionOfAKIPerDayByGrade = dayNumOfAKIByGrade / numIatrogenicAKIByGrade
+    fractionOfAKIPerDayByGrade[:, 0] = 0
+    dayNumOfAKI, dayNumOfAKI1, dayNumOfAKI2, dayNumOfAKI3 = dayNumOfAKIByGrade.tolist()
+    fractionOfAKIPerDay, fractionOfAKI1PerDay, fractionOfAKI2PerDay, fractionOfAKI3PerDay = [
+        [round(x, 3) for x in fractionList] for fractionList in fractionOfAKIPerDayByGrade.tolist()]
+    print("g_DayNumOfAKI = " + str(dayNumOfAKI))
+    print("g_DayNumOfAKI1 = " + str(dayNumOfAKI1))
+    print("g_DayNumOfAKI2 = " + str(dayNumOfAKI2))
+    print("g_DayNumOfAKI3 = " + str(dayNumOfAKI3))
     print("fractionOfAKIPerDay = " + str(fractionOfAKIPerDay))
     print("fractionOfAKI1PerDay = " + str(fractionOfAKI1PerDay))
     print("fractionOfAKI2PerDay = " + str(fractionOfAKI2PerDay))
@@ -1227,10 +1257,9 @@ def ComputeBaseline(filePathName):
 
     ##################################
     # Characterize Our AKIs
-    fractionOfAKIsWithBaseline = [0] * NUM_BASELINE_CR_BUCKETS
-    for index in range(NUM_BASELINE_CR_BUCKETS):
-        if (g_BaselineCrBeforeAKI[index] > 0):
-            fractionOfAKIsWithBaseline[index] = round(float(g_BaselineCrBeforeAKI[index]) / float(g_TotalAKIAllYears), 3)
+    fractionOfAKIsWithBaseline = np.divide(g_BaselineCrBeforeAKI, g_TotalAKIAllYears, 
+                                           out=np.zeros(NUM_BASELINE_CR_BUCKETS), where=(g_BaselineCrBeforeAKI > 0))
+    fractionOfAKIsWithBaseline = [round(x, 3) for x in fractionOfAKIsWithBaseline.tolist()]
     #RecordVectorResult("Number of AKI With Baseline Cr (in 0.25 increments) before AKI", g_BaselineCrBeforeAKI)
     #RecordVectorResult("Fraction Of AKIs With Baseline Cr (in 0.25 increments)", fractionOfAKIsWithBaseline)
 
@@ -1244,21 +1273,21 @@ def ComputeBaseline(filePathName):
                  False, reportDirectoryPath + "BaselineCrBeforeAKI.jpg")
 
 
-    RecordNumberResult("Number of AKI in Pt on Diuretic", g_OnDiureticsAtAKI)
-    RecordNumberResult("Number of AKI in Pt on Vanc", g_OnVancAtAKI)
-    RecordNumberResult("Number of AKI in Pt on ACE/ARB", g_OnACEARBAtAKI)
-    RecordNumberResult("Number of AKI in Pt on NSAID", g_OnNSAIDAtAKI)
-    RecordNumberResult("Number of AKI in Pt on Tac/Csa", g_OnTacCsaAtAKI)
-    RecordNumberResult("Number of AKI in Pt on Pamidronate", g_OnPamidAtAKI)
-    RecordNumberResult("Number of AKI in Pt on Chemo", g_OnChemoAtAKI)
+    RecordNumberResult("Number of AKI in Pt on Diuretic", g_NumAKIsOnMedClass[MED_CLASS_DIURETIC])
+    RecordNumberResult("Number of AKI in Pt on Vanc", g_NumAKIsOnMedClass[MED_CLASS_VANC])
+    RecordNumberResult("Number of AKI in Pt on ACE/ARB", g_NumAKIsOnMedClass[MED_CLASS_ACE_ARB])
+    RecordNumberResult("Number of AKI in Pt on NSAID", g_NumAKIsOnMedClass[MED_CLASS_NSAID])
+    RecordNumberResult("Number of AKI in Pt on Tac/Csa", g_NumAKIsOnMedClass[MED_CLASS_TAC_CSA])
+    RecordNumberResult("Number of AKI in Pt on Pamidronate", g_NumAKIsOnMedClass[MED_CLASS_PAMID])
+    RecordNumberResult("Number of AKI in Pt on Chemo", g_NumAKIsOnMedClass[MED_CLASS_CHEMO])
 
-    fractionAKIOnDiureticsAtAKI = round(float(g_OnDiureticsAtAKI / g_TotalAKIAllYears), 4)
-    fractionAKIOnVancAtAKI = round(float(g_OnVancAtAKI / g_TotalAKIAllYears), 4)
-    fractionAKIOnACEARBAtAKI = round(float(g_OnACEARBAtAKI / g_TotalAKIAllYears), 4)
-    fractionAKIOnNSAIDAtAKI = round(float(g_OnNSAIDAtAKI / g_TotalAKIAllYears), 4)
-    fractionAKIOnTacCsaAtAKI = round(float(g_OnTacCsaAtAKI / g_TotalAKIAllYears), 4)
-    fractionAKIOnPamidAtAKI = round(float(g_OnPamidAtAKI / g_TotalAKIAllYears), 4)
-    fractionAKIOnChemoAtAKI = round(float(g_OnChemoAtAKI / g_TotalAKIAllYears), 4)
+    fractionAKIOnDiureticsAtAKI = round(float(g_NumAKIsOnMedClass[MED_CLASS_DIURETIC] / g_TotalAKIAllYears), 4)
+    fractionAKIOnVancAtAKI = round(float(g_NumAKIsOnMedClass[MED_CLASS_VANC] / g_TotalAKIAllYears), 4)
+    fractionAKIOnACEARBAtAKI = round(float(g_NumAKIsOnMedClass[MED_CLASS_ACE_ARB] / g_TotalAKIAllYears), 4)
+    fractionAKIOnNSAIDAtAKI = round(float(g_NumAKIsOnMedClass[MED_CLASS_NSAID] / g_TotalAKIAllYears), 4)
+    fractionAKIOnTacCsaAtAKI = round(float(g_NumAKIsOnMedClass[MED_CLASS_TAC_CSA] / g_TotalAKIAllYears), 4)
+    fractionAKIOnPamidAtAKI = round(float(g_NumAKIsOnMedClass[MED_CLASS_PAMID] / g_TotalAKIAllYears), 4)
+    fractionAKIOnChemoAtAKI = round(float(g_NumAKIsOnMedClass[MED_CLASS_CHEMO] / g_TotalAKIAllYears), 4)
 
     RecordNumberResult("Fraction of AKI in Pt on Diuretic", fractionAKIOnDiureticsAtAKI)
     RecordNumberResult("Fraction of AKI in Pt on Vanc", fractionAKIOnVancAtAKI)
@@ -1276,15 +1305,17 @@ def ComputeBaseline(filePathName):
 
     ##################################
     # Num Skipped Labs before AKIs
+    numAKIAfterSkippedDays = g_AKICountsAfterSkippedDays[AKI_COUNTS_ALL_PATIENTS].tolist()
     #DrawMultiLineGraph("Num AKI After Consecutive Days without checking Creatinine", 
     #                   "Num Consecutive Days without checking Creatinine", g_NumDaysSkippedXAxis,
     #                   "Num Patients", 
     #                   ["No AKI", "KDIGO 1", "KDIGO 2", "KDIGO 3"], 
-    #                   [g_NumAKI0AfterSkippedDays, g_NumAKI1AfterSkippedDays, g_NumAKI2AfterSkippedDays, g_NumAKI3AfterSkippedDays], 
+    #                   [numAKIAfterSkippedDays[0], numAKIAfterSkippedDays[1], numAKIAfterSkippedDays[2], numAKIAfterSkippedDays[3]], 
     #                   False, reportDirectoryPath + "NumAKIvsNumSkippedDaysLine.jpg")
-    fractionOfAKI1PerDay = [round((x / g_TotalAKI1AllYears), 3) for x in g_NumAKI1AfterSkippedDays]
-    fractionOfAKI2PerDay = [round((x / g_TotalAKI2AllYears), 3) for x in g_NumAKI2AfterSkippedDays]
-    fractionOfAKI3PerDay = [round((x / g_TotalAKI3AllYears), 3) for x in g_NumAKI3AfterSkippedDays]
+    totalAKIByGrade = np.array([g_TotalAKI1AllYears, g_TotalAKI2AllYears, g_TotalAKI3AllYears])
+    fractionOfAKIPerDayByGrade = g_AKICountsAfterSkippedDays[AKI_COUNTS_ALL_PATIENTS, 1:] / totalAKIByGrade[:, np.newaxis]
+    fractionOfAKI1PerDay, fractionOfAKI2PerDay, fractionOfAKI3PerDay = [
+        [round(x, 3) for x in fractionList] for fractionList in fractionOfAKIPerDayByGrade.tolist()]
     DrawMultiLineGraph("Fraction of AKI After N Consecutive Days without checking Creatinine", 
                         "Num Consecutive Days without checking Creatinine", g_NumDaysSkippedXAxis,
                         "Num Patients", 
@@ -1383,39 +1414,23 @@ def ComputeCostVariables(filePathName):
         admissionList = srcTDF.GetAdmissionsForCurrentPatient()
         for admissionInfo in admissionList:
             # Get all data points for the patient.
-            firstDay = admissionInfo['FirstDay']
-            lastDay = admissionInfo['LastDay']
-            firstDayInt = int(firstDay)
-            lastDayInt = int(lastDay)
+            firstDayInt = admissionInfo['FirstDay']
+            lastDayInt = admissionInfo['LastDay']
 
             # Check if the patient looks like a dialysis patient.
             gfrEventList = srcTDF.GetValuesBetweenDays("GFR", firstDayInt, lastDayInt, False)
-            fIsDialysisPatient = True
-            for eventInfo in gfrEventList:
-                valueFloat = eventInfo["Val"]
-                if (valueFloat >= MIN_GFR_FOR_NON_ESRD):
-                    fIsDialysisPatient = False
-            # End - for eventInfo in gfrEventList:
-
+            fIsDialysisPatient = not np.any(gfrEventList["Val"] >= MIN_GFR_FOR_NON_ESRD)
             if (fIsDialysisPatient):
                 continue
             totalNumAdmissions += 1
 
             # Count the Hgb
             hgbEventList = srcTDF.GetValuesBetweenDays("Hgb", firstDayInt, lastDayInt, False)
-            for eventInfo in hgbEventList:
-                valueFloat = eventInfo["Val"]
-                if (valueFloat > 0):
-                    totalNumHgb += 1
-            # End - for eventInfo in hgbEventList:
+            totalNumHgb += int(np.count_nonzero(hgbEventList["Val"] > 0))
 
             # Count the Cr
             crEventList = srcTDF.GetValuesBetweenDays("Cr", firstDayInt, lastDayInt, False)
-            for eventInfo in crEventList:
-                valueFloat = eventInfo["Val"]
-                if (valueFloat > 0):
-                    totalNumCr += 1
-            # End - for eventInfo in crEventList:
+            totalNumCr += int(np.count_nonzero(crEventList["Val"] > 0))
 
         fFoundPatient = srcTDF.GotoNextPatient()
     # End - while (patientNode):
@@ -1440,37 +1455,10 @@ def ComputeCostVariables(filePathName):
 #
 ################################################################################
 def PrintJavaScriptArrays():
-    declStr = ""
-    for sensNum in g_SensitivityListForAllAKI:
-        if (declStr != ""):
-            declStr += ", "
-        declStr += str(sensNum)
-    # End - for sensNum in g_SensitivityListForAllAKI:
-    print("const AllAKISensitivityWithRandomSkipsArray = [" + declStr + "];")
-
-    declStr = ""
-    for sensNum in g_SensitivityListForAKI1:
-        if (declStr != ""):
-            declStr += ", "
-        declStr += str(sensNum)
-    # End - for sensNum in g_SensitivityListForAKI1:
-    print("const AKI1SensitivityWithRandomSkipsArray = [" + declStr + "];")
-
-    declStr = ""
-    for sensNum in g_SensitivityListForAKI2:
-        if (declStr != ""):
-            declStr += ", "
-        declStr += str(sensNum)
-    # End - for sensNum in g_SensitivityListForAKI2:
-    print("const AKI2SensitivityWithRandomSkipsArray = [" + declStr + "];")
-
-    declStr = ""
-    for sensNum in g_SensitivityListForAKI3:
-        if (declStr != ""):
-            declStr += ", "
-        declStr += str(sensNum)
-    # End - for sensNum in g_SensitivityListForAKI3:
-    print("const AKI3SensitivityWithRandomSkipsArray = [" + declStr + "];")
+    arrayNameList = ["AllAKI", "AKI1", "AKI2", "AKI3"]
+    for gradeIndex, arrayName in enumerate(arrayNameList):
+        declStr = ", ".join(str(sensNum) for sensNum in g_SensitivityRandom[gradeIndex])
+        print("const " + arrayName + "SensitivityWithRandomSkipsArray = [" + declStr + "];")
 # End - PrintJavaScriptArrays
 
 
@@ -1725,29 +1713,29 @@ def FindAKIWithRandomSkips(filePathName, randomChanceOfSkip, fLongAdmissionsOnly
 
     ##################################
     # Num AKIs after different lengths of Skipped Labs
+    numAKIAfterSkippedDays = g_AKICountsAfterSkippedDays[AKI_COUNTS_ALL_PATIENTS].tolist()
+    numAKIOnCKDAfterSkippedDays = g_AKICountsAfterSkippedDays[AKI_COUNTS_CKD_PATIENTS].tolist()
     #print("\n=======================")
-    #RecordVectorResult(testResultPercentPrefix + "Num Without AKI After Consecutive Days without checking Creatinine", g_NumAKI0AfterSkippedDays)
-    #RecordVectorResult(testResultPercentPrefix + "Num KDIGO 1 AKI After Days without checking Creatinine", g_NumAKI1AfterSkippedDays)
-    #RecordVectorResult(testResultPercentPrefix + "Num KDIGO 2 AKI After Days without checking Creatinine", g_NumAKI2AfterSkippedDays)
-    #RecordVectorResult(testResultPercentPrefix + "Num KDIGO 3 AKI After Days without checking Creatinine", g_NumAKI3AfterSkippedDays)
+    #RecordVectorResult(testResultPercentPrefix + "Num Without AKI After Consecutive Days without checking Creatinine", numAKIAfterSkippedDays[0])
+    #RecordVectorResult(testResultPercentPrefix + "Num KDIGO 1 AKI After Days without checking Creatinine", numAKIAfterSkippedDays[1])
+    #RecordVectorResult(testResultPercentPrefix + "Num KDIGO 2 AKI After Days without checking Creatinine", numAKIAfterSkippedDays[2])
+    #RecordVectorResult(testResultPercentPrefix + "Num KDIGO 3 AKI After Days without checking Creatinine", numAKIAfterSkippedDays[3])
     #DrawMultiLineGraph("Num AKI After Consecutive Days without checking Creatinine", 
     #                  testResultPercentPrefix + "Num Consecutive Days without checking Creatinine", g_NumDaysSkippedXAxis,
     #                   "Num Patients", 
     #                   ["No AKI", "KDIGO 1", "KDIGO 2", "KDIGO 3"], 
-    #                   [g_NumAKI0AfterSkippedDays, g_NumAKI1AfterSkippedDays, g_NumAKI2AfterSkippedDays, g_NumAKI3AfterSkippedDays], 
+    #                   [numAKIAfterSkippedDays[0], numAKIAfterSkippedDays[1], numAKIAfterSkippedDays[2], numAKIAfterSkippedDays[3]], 
     #                   False, reportDirectoryPath + testResultPercentPrefix + "NumAKIvsNumSkippedDaysLine.jpg")
 
 
-    FractionPtsAfterNSkippedDaysWithNoAKI = [0.0] * MAX_NUM_SKIPPED_DAYS
-    FractionPtsAfterNSkippedDaysWithAKI1 = [0.0] * MAX_NUM_SKIPPED_DAYS
-    FractionPtsAfterNSkippedDaysWithAKI2 = [0.0] * MAX_NUM_SKIPPED_DAYS
-    FractionPtsAfterNSkippedDaysWithAKI3 = [0.0] * MAX_NUM_SKIPPED_DAYS
-    for index in range(MAX_NUM_SKIPPED_DAYS):
-        if (g_NumPtsWithConsecutiveSkippedDays[index] > 0):
-            FractionPtsAfterNSkippedDaysWithNoAKI[index] = round(float(g_NumAKI0AfterSkippedDays[index]) / float(g_NumPtsWithConsecutiveSkippedDays[index]), 4)
-            FractionPtsAfterNSkippedDaysWithAKI1[index] = round(float(g_NumAKI1AfterSkippedDays[index]) / float(g_NumPtsWithConsecutiveSkippedDays[index]), 4)
-            FractionPtsAfterNSkippedDaysWithAKI2[index] = round(float(g_NumAKI2AfterSkippedDays[index]) / float(g_NumPtsWithConsecutiveSkippedDays[index]), 4)
-            FractionPtsAfterNSkippedDaysWithAKI3[index] = round(float(g_NumAKI3AfterSkippedDays[index]) / float(g_NumPtsWithConsecutiveSkippedDays[index]), 4)
+    # Same masked divide as FindAKIWithBandSkips; days with no labs after them stay at 0.
+    fractionPtsAfterNSkippedDaysByGrade = np.divide(g_AKICountsAfterSkippedDays[AKI_COUNTS_ALL_PATIENTS],
+                                                    g_NumPtsWithConsecutiveSkippedDays,
+                                                    out=np.zeros((NUM_AKI_GRADES, MAX_NUM_SKIPPED_DAYS)),
+                                                    where=(g_NumPtsWithConsecutiveSkippedDays > 0))
+    (FractionPtsAfterNSkippedDaysWithNoAKI, FractionPtsAfterNSkippedDaysWithAKI1,
+        FractionPtsAfterNSkippedDaysWithAKI2, FractionPtsAfterNSkippedDaysWithAKI3) = [
+        [round(x, 4) for x in fractionList] for fractionList in fractionPtsAfterNSkippedDaysByGrade.tolist()]
 
     #RecordVectorResult(testResultPercentPrefix + "Fraction of Pts with NO AKI After N Consecutive Skipped Days", 
     #    g_FractionPtsAfterNSkippedDaysWithNoAKI)
@@ -1766,16 +1754,16 @@ def FindAKIWithRandomSkips(filePathName, randomChanceOfSkip, fLongAdmissionsOnly
     #                   False, reportDirectoryPath + testResultPercentPrefix + "FractionAKIvsNumSkippedDaysLine.jpg")
 
     #print("")
-    #RecordVectorResult(testResultPercentPrefix + "Num Without AKI on CKD After Consecutive Days without checking Creatinine", g_NumAKI0OnCKDAfterSkippedDays)
-    #RecordVectorResult(testResultPercentPrefix + "Num KDIGO 1 AKI on CKD After Days without checking Creatinine", g_NumAKI1OnCKDAfterSkippedDays)
-    #RecordVectorResult(testResultPercentPrefix + "Num KDIGO 2 AKI on CKD After Days without checking Creatinine", g_NumAKI2OnCKDAfterSkippedDays)
-    #RecordVectorResult(testResultPercentPrefix + "Num KDIGO 3 AKI on CKD After Days without checking Creatinine", g_NumAKI3OnCKDAfterSkippedDays)
+    #RecordVectorResult(testResultPercentPrefix + "Num Without AKI on CKD After Consecutive Days without checking Creatinine", numAKIOnCKDAfterSkippedDays[0])
+    #RecordVectorResult(testResultPercentPrefix + "Num KDIGO 1 AKI on CKD After Days without checking Creatinine", numAKIOnCKDAfterSkippedDays[1])
+    #RecordVectorResult(testResultPercentPrefix + "Num KDIGO 2 AKI on CKD After Days without checking Creatinine", numAKIOnCKDAfterSkippedDays[2])
+    #RecordVectorResult(testResultPercentPrefix + "Num KDIGO 3 AKI on CKD After Days without checking Creatinine", numAKIOnCKDAfterSkippedDays[3])
 
     DrawMultiLineGraph("Num AKI on CKD After Consecutive Days without checking Creatinine", 
                        "Num Consecutive Days without checking Creatinine", g_NumDaysSkippedXAxis,
                        "Num Patients", 
                        ["No AKI", "KDIGO 1", "KDIGO 2", "KDIGO 3"], 
-                       [g_NumAKI0OnCKDAfterSkippedDays, g_NumAKI1OnCKDAfterSkippedDays, g_NumAKI2OnCKDAfterSkippedDays, g_NumAKI3OnCKDAfterSkippedDays], 
+                       [numAKIOnCKDAfterSkippedDays[0], numAKIOnCKDAfterSkippedDays[1], numAKIOnCKDAfterSkippedDays[2], numAKIOnCKDAfterSkippedDays[3]], 
                        False, reportDirectoryPath + testResultPercentPrefix + "NumAKIOnCKDvsNumSkippedDaysLine.jpg")
 
     #WriteCSVFile(reportDirectoryPath + testResultPercentPrefix + "RandomSkipObservedAKI.csv")
@@ -1792,12 +1780,11 @@ def FindAKIWithRandomSkips(filePathName, randomChanceOfSkip, fLongAdmissionsOnly
     print("g_" + prefixStr + "NumLabsConsidered" + testResultPercentSuffix + " = " + str(g_TotalNumLabsConsidered))
     print("g_" + prefixStr + "NumLabsSkipped" + testResultPercentSuffix + " = " + str(g_TotalNumLabsSkipped))
     print("g_" + prefixStr + "NumAKI" + testResultPercentSuffix + " = " + str(g_NumAKINPercentSkip))
-    print("g_" + prefixStr + "NumPtsWithConsecutiveSkippedDays" + testResultPercentSuffix + " = " + str(g_NumPtsWithConsecutiveSkippedDays))
+    print("g_" + prefixStr + "NumPtsWithConsecutiveSkippedDays" + testResultPercentSuffix + " = " + str(g_NumPtsWithConsecutiveSkippedDays.tolist()))
     print("g_" + prefixStr + "FractionAKI" + testResultPercentSuffix + " = " + str(g_FractionAKINPercentSkip))
-    print("g_" + prefixStr + "SensitivityAnyAKI" + testResultPercentSuffix + " = " + str(sensitivityAnyAKI))
-    print("g_" + prefixStr + "SensitivityAKI1" + testResultPercentSuffix + " = " + str(sensitivityAKI1))
-    print("g_" + prefixStr + "SensitivityAKI2" + testResultPercentSuffix + " = " + str(sensitivityAKI2))
-    print("g_" + prefixStr + "SensitivityAKI3" + testResultPercentSuffix + " = " + str(sensitivityAKI3))
+    # Column 0 of the sensitivity table is the 10% run, so a 0% run has no column.
+    if (testResultIndex > 0):
+        print("g_" + prefixStr + "SensitivityRandom[:, " + str(testResultIndex - 1) + "] = " + str(sensitivityWithSkips))
 # End - FindAKIWithRandomSkips
 
 
@@ -1831,21 +1818,10 @@ def SummarizeRandomSkips():
                  False, reportDirectoryPath + "NumLabsSkipped.jpg")
 
 
-    sensitivityToAnyAKIvsRandomProb = [g_SensitivityAnyAKI10PercentRandom, g_SensitivityAnyAKI20PercentRandom, g_SensitivityAnyAKI30PercentRandom, 
-                                    g_SensitivityAnyAKI40PercentRandom, g_SensitivityAnyAKI50PercentRandom, g_SensitivityAnyAKI60PercentRandom,
-                                    g_SensitivityAnyAKI70PercentRandom, g_SensitivityAnyAKI80PercentRandom, g_SensitivityAnyAKI90PercentRandom]
-
-    sensitivityToAKI1vsRandomProb = [g_SensitivityAKI110PercentRandom, g_SensitivityAKI120PercentRandom, g_SensitivityAKI130PercentRandom, 
-                                    g_SensitivityAKI140PercentRandom, g_SensitivityAKI150PercentRandom, g_SensitivityAKI160PercentRandom,
-                                    g_SensitivityAKI170PercentRandom, g_SensitivityAKI180PercentRandom, g_SensitivityAKI190PercentRandom]
-
-    sensitivityToAKI2vsRandomProb = [g_SensitivityAKI210PercentRandom, g_SensitivityAKI220PercentRandom, g_SensitivityAKI230PercentRandom, 
-                                    g_SensitivityAKI240PercentRandom, g_SensitivityAKI250PercentRandom, g_SensitivityAKI260PercentRandom,
-                                    g_SensitivityAKI270PercentRandom, g_SensitivityAKI280PercentRandom, g_SensitivityAKI290PercentRandom]
-
-    sensitivityToAKI3vsRandomProb = [g_SensitivityAKI310PercentRandom, g_SensitivityAKI320PercentRandom, g_SensitivityAKI330PercentRandom, 
-                                    g_SensitivityAKI340PercentRandom, g_SensitivityAKI350PercentRandom, g_SensitivityAKI360PercentRandom,
-                                    g_SensitivityAKI370PercentRandom, g_SensitivityAKI380PercentRandom, g_SensitivityAKI390PercentRandom]
+    sensitivityToAnyAKIvsRandomProb = g_SensitivityRandom[0]
+    sensitivityToAKI1vsRandomProb = g_SensitivityRandom[1]
+    sensitivityToAKI2vsRandomProb = g_SensitivityRandom[2]
+    sensitivityToAKI3vsRandomProb = g_SensitivityRandom[3]
 
 
     DrawMultiLineGraph("Sensitivity of AKI Detected on Daily Labs with Percent Labs Skipped", 
@@ -1911,21 +1887,10 @@ def SummarizeLongAdmissions():
                  False, reportDirectoryPath + "NumLabsSkipped.jpg")
 
 
-    sensitivityToAnyAKIvsRandomProb = [g_LongAdmissionSensitivityAnyAKI10PercentRandom, g_LongAdmissionSensitivityAnyAKI20PercentRandom, g_LongAdmissionSensitivityAnyAKI30PercentRandom, 
-                                    g_LongAdmissionSensitivityAnyAKI40PercentRandom, g_LongAdmissionSensitivityAnyAKI50PercentRandom, g_LongAdmissionSensitivityAnyAKI60PercentRandom,
-                                    g_LongAdmissionSensitivityAnyAKI70PercentRandom, g_LongAdmissionSensitivityAnyAKI80PercentRandom, g_LongAdmissionSensitivityAnyAKI90PercentRandom]
-
-    sensitivityToAKI1vsRandomProb = [g_LongAdmissionSensitivityAKI110PercentRandom, g_LongAdmissionSensitivityAKI120PercentRandom, g_LongAdmissionSensitivityAKI130PercentRandom, 
-                                    g_LongAdmissionSensitivityAKI140PercentRandom, g_LongAdmissionSensitivityAKI150PercentRandom, g_LongAdmissionSensitivityAKI160PercentRandom,
-                                    g_LongAdmissionSensitivityAKI170PercentRandom, g_LongAdmissionSensitivityAKI180PercentRandom, g_LongAdmissionSensitivityAKI190PercentRandom]
-
-    sensitivityToAKI2vsRandomProb = [g_LongAdmissionSensitivityAKI210PercentRandom, g_LongAdmissionSensitivityAKI220PercentRandom, g_LongAdmissionSensitivityAKI230PercentRandom, 
-                                    g_LongAdmissionSensitivityAKI240PercentRandom, g_LongAdmissionSensitivityAKI250PercentRandom, g_LongAdmissionSensitivityAKI260PercentRandom,
-                                    g_LongAdmissionSensitivityAKI270PercentRandom, g_LongAdmissionSensitivityAKI280PercentRandom, g_LongAdmissionSensitivityAKI290PercentRandom]
-
-    sensitivityToAKI3vsRandomProb = [g_LongAdmissionSensitivityAKI310PercentRandom, g_LongAdmissionSensitivityAKI320PercentRandom, g_LongAdmissionSensitivityAKI330PercentRandom, 
-                                    g_LongAdmissionSensitivityAKI340PercentRandom, g_LongAdmissionSensitivityAKI350PercentRandom, g_LongAdmissionSensitivityAKI360PercentRandom,
-                                    g_LongAdmissionSensitivityAKI370PercentRandom, g_LongAdmissionSensitivityAKI380PercentRandom, g_LongAdmissionSensitivityAKI390PercentRandom]
+    sensitivityToAnyAKIvsRandomProb = g_LongAdmissionSensitivityRandom[0]
+    sensitivityToAKI1vsRandomProb = g_LongAdmissionSensitivityRandom[1]
+    sensitivityToAKI2vsRandomProb = g_LongAdmissionSensitivityRandom[2]
+    sensitivityToAKI3vsRandomProb = g_LongAdmissionSensitivityRandom[3]
 
     DrawMultiLineGraph("Sensitivity of AKI Detected on Daily Labs with Percent Labs Skipped", 
                        "Percent Labs Skipped", xAxisValueList, "Sensitivity", 
@@ -1989,7 +1954,7 @@ def FindAKIWithBandSkips(filePathName, randomChanceOfSkip):
                        False, reportDirectoryPath + "FractionAKIFromDailyvsBandSkippedLabs.jpg")
 
     print("")
-    RecordVectorResult("Num Consecutive Days without checking Creatinine with Skipped Labs", g_NumPtsWithConsecutiveSkippedDays)
+    RecordVectorResult("Num Consecutive Days without checking Creatinine with Skipped Labs", g_NumPtsWithConsecutiveSkippedDays.tolist())
     DrawBarGraph("Consecutive Days without checking Creatinine with Band Skipped Labs", 
                  "Num Consecutive Days Skipped", g_NumDaysSkippedXAxisString, 
                  "Num Patients", g_NumPtsWithConsecutiveSkippedDays, 
@@ -2021,28 +1986,29 @@ def FindAKIWithBandSkips(filePathName, randomChanceOfSkip):
 
     ##################################
     # Num AKIs after different lengths of Skipped Labs
+    numAKIAfterSkippedDays = g_AKICountsAfterSkippedDays[AKI_COUNTS_ALL_PATIENTS].tolist()
+    numAKIOnCKDAfterSkippedDays = g_AKICountsAfterSkippedDays[AKI_COUNTS_CKD_PATIENTS].tolist()
     #print("\n=======================")
-    #RecordVectorResult("Num Without AKI After Consecutive Days without checking Creatinine", g_NumAKI0AfterSkippedDays)
-    #RecordVectorResult("Num KDIGO 1 AKI After Days without checking Creatinine", g_NumAKI1AfterSkippedDays)
-    #RecordVectorResult("Num KDIGO 2 AKI After Days without checking Creatinine", g_NumAKI2AfterSkippedDays)
-    #RecordVectorResult("Num KDIGO 3 AKI After Days without checking Creatinine", g_NumAKI3AfterSkippedDays)
+    #RecordVectorResult("Num Without AKI After Consecutive Days without checking Creatinine", numAKIAfterSkippedDays[0])
+    #RecordVectorResult("Num KDIGO 1 AKI After Days without checking Creatinine", numAKIAfterSkippedDays[1])
+    #RecordVectorResult("Num KDIGO 2 AKI After Days without checking Creatinine", numAKIAfterSkippedDays[2])
+    #RecordVectorResult("Num KDIGO 3 AKI After Days without checking Creatinine", numAKIAfterSkippedDays[3])
     #DrawMultiLineGraph("Num AKI After Consecutive Days without checking Creatinine", 
     #                   "Num Consecutive Days without checking Creatinine", g_NumDaysSkippedXAxis,
     #                   "Num Patients", 
     #                   ["No AKI", "KDIGO 1", "KDIGO 2", "KDIGO 3"], 
-    #                   [g_NumAKI0AfterSkippedDays, g_NumAKI1AfterSkippedDays, g_NumAKI2AfterSkippedDays, g_NumAKI3AfterSkippedDays], 
+    #                   [numAKIAfterSkippedDays[0], numAKIAfterSkippedDays[1], numAKIAfterSkippedDays[2], numAKIAfterSkippedDays[3]], 
     #                   False, reportDirectoryPath + "NumAKIvsNumSkippedDaysLine.jpg")
 
-    g_FractionPtsAfterNSkippedDaysWithNoAKI = [0.0] * MAX_NUM_SKIPPED_DAYS
-    g_FractionPtsAfterNSkippedDaysWithAKI1 = [0.0] * MAX_NUM_SKIPPED_DAYS
-    g_FractionPtsAfterNSkippedDaysWithAKI2 = [0.0] * MAX_NUM_SKIPPED_DAYS
-    g_FractionPtsAfterNSkippedDaysWithAKI3 = [0.0] * MAX_NUM_SKIPPED_DAYS
-    for index in range(MAX_NUM_SKIPPED_DAYS):
-        if (g_NumPtsWithConsecutiveSkippedDays[index] > 0):
-            g_FractionPtsAfterNSkippedDaysWithNoAKI[index] = round(float(g_NumAKI0AfterSkippedDays[index]) / float(g_NumPtsWithConsecutiveSkippedDays[index]), 4)
-            g_FractionPtsAfterNSkippedDaysWithAKI1[index] = round(float(g_NumAKI1AfterSkippedDays[index]) / float(g_NumPtsWithConsecutiveSkippedDays[index]), 4)
-            g_FractionPtsAfterNSkippedDaysWithAKI2[index] = round(float(g_NumAKI2AfterSkippedDays[index]) / float(g_NumPtsWithConsecutiveSkippedDays[index]), 4)
-            g_FractionPtsAfterNSkippedDaysWithAKI3[index] = round(float(g_NumAKI3AfterSkippedDays[index]) / float(g_NumPtsWithConsecutiveSkippedDays[index]), 4)
+    # Days with no labs after them stay at 0. As in ComputeBaseline, round() keeps
+    # the reported values the same as before, which np.round would not.
+    fractionPtsAfterNSkippedDaysByGrade = np.divide(g_AKICountsAfterSkippedDays[AKI_COUNTS_ALL_PATIENTS],
+                                                    g_NumPtsWithConsecutiveSkippedDays,
+                                                    out=np.zeros((NUM_AKI_GRADES, MAX_NUM_SKIPPED_DAYS)),
+                                                    where=(g_NumPtsWithConsecutiveSkippedDays > 0))
+    (g_FractionPtsAfterNSkippedDaysWithNoAKI, g_FractionPtsAfterNSkippedDaysWithAKI1,
+        g_FractionPtsAfterNSkippedDaysWithAKI2, g_FractionPtsAfterNSkippedDaysWithAKI3) = [
+        [round(x, 4) for x in fractionList] for fractionList in fractionPtsAfterNSkippedDaysByGrade.tolist()]
     #RecordVectorResult("Fraction of Pts with NO AKI After N Consecutive Skipped Days", g_FractionPtsAfterNSkippedDaysWithNoAKI)
     #RecordVectorResult("Fraction of Pts with AKI 1 After N Consecutive Skipped Days", g_FractionPtsAfterNSkippedDaysWithAKI1)
     #RecordVectorResult("Fraction of Pts with AKI 2 After N Consecutive Skipped Days", g_FractionPtsAfterNSkippedDaysWithAKI2)
@@ -2056,15 +2022,15 @@ def FindAKIWithBandSkips(filePathName, randomChanceOfSkip):
                        False, reportDirectoryPath + "FractionAKIvsNumSkippedDaysLine.jpg")
 
     #print("")
-    #RecordVectorResult("Num Without AKI on CKD After Consecutive Days without checking Creatinine", g_NumAKI0OnCKDAfterSkippedDays)
-    #RecordVectorResult("Num KDIGO 1 AKI on CKD After Days without checking Creatinine", g_NumAKI1OnCKDAfterSkippedDays)
-    #RecordVectorResult("Num KDIGO 2 AKI on CKD After Days without checking Creatinine", g_NumAKI2OnCKDAfterSkippedDays)
-    #RecordVectorResult("Num KDIGO 3 AKI on CKD After Days without checking Creatinine", g_NumAKI3OnCKDAfterSkippedDays)
+    #RecordVectorResult("Num Without AKI on CKD After Consecutive Days without checking Creatinine", numAKIOnCKDAfterSkippedDays[0])
+    #RecordVectorResult("Num KDIGO 1 AKI on CKD After Days without checking Creatinine", numAKIOnCKDAfterSkippedDays[1])
+    #RecordVectorResult("Num KDIGO 2 AKI on CKD After Days without checking Creatinine", numAKIOnCKDAfterSkippedDays[2])
+    #RecordVectorResult("Num KDIGO 3 AKI on CKD After Days without checking Creatinine", numAKIOnCKDAfterSkippedDays[3])
     #DrawMultiLineGraph("Num Pts with AKI on CKD After Consecutive Days without checking Creatinine", 
     #                   "Num Consecutive Days without checking Creatinine", g_NumDaysSkippedXAxis,
     #                   "Num Patients", 
     #                   ["No AKI", "KDIGO 1", "KDIGO 2", "KDIGO 3"], 
-    #                   [g_NumAKI0OnCKDAfterSkippedDays, g_NumAKI1OnCKDAfterSkippedDays, g_NumAKI2OnCKDAfterSkippedDays, g_NumAKI3OnCKDAfterSkippedDays], 
+    #                   [numAKIOnCKDAfterSkippedDays[0], numAKIOnCKDAfterSkippedDays[1], numAKIOnCKDAfterSkippedDays[2], numAKIOnCKDAfterSkippedDays[3]], 
     #                   False, reportDirectoryPath + "NumAKIOnCKDvsNumSkippedDaysLine.jpg")
 
     #WriteCSVFile(reportDirectoryPath + "BandSkipObservedAKI.csv")
@@ -2076,12 +2042,11 @@ def FindAKIWithBandSkips(filePathName, randomChanceOfSkip):
     print("g_NumLabsConsidered" + testResultPercentSuffix + "BandSkipping = " + str(g_TotalNumLabsConsidered))
     print("g_NumLabsSkipped" + testResultPercentSuffix + "BandSkipping = " + str(g_TotalNumLabsSkipped))
     print("g_NumAKI" + testResultPercentSuffix + "BandSkipping = " + str(g_NumAKINPercentSkip))
-    print("g_NumPtsWithConsecutiveSkippedDays" + testResultPercentSuffix + "BandSkipping = " + str(g_NumPtsWithConsecutiveSkippedDays))
+    print("g_NumPtsWithConsecutiveSkippedDays" + testResultPercentSuffix + "BandSkipping = " + str(g_NumPtsWithConsecutiveSkippedDays.tolist()))
     print("g_FractionAKI" + testResultPercentSuffix + "BandSkipping = " + str(g_FractionAKINPercentSkip))
-    print("g_SensitivityAnyAKI" + testResultPercentSuffix + "BandSkipping = " + str(sensitivityAnyAKI))
-    print("g_SensitivityAKI1" + testResultPercentSuffix + "BandSkipping = " + str(sensitivityAKI1))
-    print("g_SensitivityAKI2" + testResultPercentSuffix + "BandSkipping = " + str(sensitivityAKI2))
-    print("g_SensitivityAKI3" + testResultPercentSuffix + "BandSkipping = " + str(sensitivityAKI3))
+    # Column 0 of the sensitivity table is the 10% run, so a 0% run has no column.
+    if (testResultIndex > 0):
+        print("g_SensitivityBandSkipping[:, " + str(testResultIndex - 1) + "] = " + str(sensitivityWithSkips))
 # End - FindAKIWithBandSkips
 
 
@@ -2129,25 +2094,11 @@ def SummarizeBollingerBandResults():
 
 
 
-    sensitivityToAnyAKIvsRandomProb = [g_SensitivityAnyAKI10PercentRandom, g_SensitivityAnyAKI20PercentRandom, g_SensitivityAnyAKI30PercentRandom, 
-                                    g_SensitivityAnyAKI40PercentRandom, g_SensitivityAnyAKI50PercentRandom, g_SensitivityAnyAKI60PercentRandom,
-                                    g_SensitivityAnyAKI70PercentRandom, g_SensitivityAnyAKI80PercentRandom, g_SensitivityAnyAKI90PercentRandom]
-
-    sensitivityToAnyAKIvsRandomBand = [g_SensitivityAnyAKI10PercentBandSkipping, g_SensitivityAnyAKI20PercentBandSkipping, g_SensitivityAnyAKI30PercentBandSkipping, 
-                                    g_SensitivityAnyAKI40PercentBandSkipping, g_SensitivityAnyAKI50PercentBandSkipping, g_SensitivityAnyAKI60PercentBandSkipping, 
-                                    g_SensitivityAnyAKI70PercentBandSkipping, g_SensitivityAnyAKI80PercentBandSkipping, g_SensitivityAnyAKI90PercentBandSkipping]
-
-    sensitivityToAKI1vsRandomBand = [g_SensitivityAKI110PercentBandSkipping, g_SensitivityAKI120PercentBandSkipping, g_SensitivityAKI130PercentBandSkipping, 
-                                    g_SensitivityAKI140PercentBandSkipping, g_SensitivityAKI150PercentBandSkipping, g_SensitivityAKI160PercentBandSkipping, 
-                                    g_SensitivityAKI170PercentBandSkipping, g_SensitivityAKI180PercentBandSkipping, g_SensitivityAKI190PercentBandSkipping]
-
-    sensitivityToAKI2vsRandomBand = [g_SensitivityAKI210PercentBandSkipping, g_SensitivityAKI220PercentBandSkipping, g_SensitivityAKI230PercentBandSkipping, 
-                                    g_SensitivityAKI240PercentBandSkipping, g_SensitivityAKI250PercentBandSkipping, g_SensitivityAKI260PercentBandSkipping, 
-                                    g_SensitivityAKI270PercentBandSkipping, g_SensitivityAKI280PercentBandSkipping, g_SensitivityAKI290PercentBandSkipping]
-
-    sensitivityToAKI3vsRandomBand = [g_SensitivityAKI310PercentBandSkipping, g_SensitivityAKI320PercentBandSkipping, g_SensitivityAKI330PercentBandSkipping, 
-                                    g_SensitivityAKI340PercentBandSkipping, g_SensitivityAKI350PercentBandSkipping, g_SensitivityAKI360PercentBandSkipping, 
-                                    g_SensitivityAKI370PercentBandSkipping, g_SensitivityAKI380PercentBandSkipping, g_SensitivityAKI390PercentBandSkipping]
+    sensitivityToAnyAKIvsRandomProb = g_SensitivityRandom[0]
+    sensitivityToAnyAKIvsRandomBand = g_SensitivityBandSkipping[0]
+    sensitivityToAKI1vsRandomBand = g_SensitivityBandSkipping[1]
+    sensitivityToAKI2vsRandomBand = g_SensitivityBandSkipping[2]
+    sensitivityToAKI3vsRandomBand = g_SensitivityBandSkipping[3]
 
     DrawMultiLineGraph("Sensitivity of AKI Detected on Daily Labs with Percent Labs Band Skipped", 
                        "Percent Labs Skipped", xAxisValueList, "Sensitivity", 
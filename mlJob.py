@@ -280,6 +280,7 @@ import random
 import numpy
 
 from xml.dom.minidom import getDOMImplementation
+import xml.etree.ElementTree as ET
 
 from sklearn.metrics import f1_score
 from sklearn.metrics import auc
@@ -3507,5 +3508,100 @@ def MLJob_ReadExistingMLJob(jobFilePathName):
 
 
 
+################################################################################
+# 
+# [MLJob_PeekJobFile]
+#
+# This is a public procedure, it is called by the client.
+#
+# This reads only the Network section of a job file, which names the output
+# variable and whether the network is logistic. It does not build a DOM or
+# read the results or the saved network matrices, so a caller can skip jobs
+# it does not want before paying for MLJob_ReadExistingMLJob.
+#
+# Returns:    err, outputVarName, resultValueType, fIsLogistic
+################################################################################
+def MLJob_PeekJobFile(jobFilePathName):
+    networkElementName = NETWORK_ELEMENT_NAME.lower()
+    networkNode = None
+    depth = 0
+
+    try:
+        with open(jobFilePathName, "rb") as fileH:
+            for event, elem in ET.iterparse(fileH, events=("start", "end")):
+                if (event == "start"):
+                    # Like ReadJobFromString, only accept files whose root is a job.
+                    if ((depth == 0) and (elem.tag != ROOT_ELEMENT_NAME)):
+                        return JOB_E_INVALID_FILE, "", tdf.TDF_DATA_TYPE_FLOAT, False
+                    depth += 1
+                    continue
+
+                depth -= 1
+                # Only look at the direct children of the root, and stop at the network.
+                if (depth == 1):
+                    if (elem.tag.lower() == networkElementName):
+                        networkNode = elem
+                        break
+                    elem.clear()
+            # End - for event, elem in ET.iterparse(fileH, events=("start", "end")):
+    except OSError:
+        return JOB_E_CANNOT_OPEN_FILE, "", tdf.TDF_DATA_TYPE_FLOAT, False
+    except ET.ParseError:
+        return JOB_E_INVALID_FILE, "", tdf.TDF_DATA_TYPE_FLOAT, False
+
+    # These follow GetNetworkOutputVarName, InferResultInfo and ReadJobFromString.
+    outputLayerNode = MLJobPeekGetChildNode(networkNode, "OutputLayer")
+    if (outputLayerNode is None):
+        outputLayerNode = MLJobPeekGetChildNode(networkNode, "InputLayer")
+    outputVarName = MLJobPeekGetChildText(outputLayerNode, "ResultValue").lstrip().replace(' ', '')
+
+    if (outputVarName != ""):
+        resultValueType = tdf.TDF_GetVariableType(outputVarName)
+    else:
+        resultValueType = tdf.TDF_DATA_TYPE_FLOAT
+
+    fIsLogistic = False
+    logisticStr = MLJobPeekGetChildText(networkNode, NETWORK_LOGISTIC_ELEMENT_NAME).lower().strip()
+    if ((logisticStr == "true") or (logisticStr == "1") or (logisticStr == "yes")):
+        fIsLogistic = True
+
+    return JOB_E_NO_ERROR, outputVarName, resultValueType, fIsLogistic
+# End - MLJob_PeekJobFile
+
+
+
+################################################################################
+# These match the case-insensitive lookups in xmlTools, but for ElementTree nodes.
+################################################################################
+def MLJobPeekGetChildNode(parentNode, childName):
+    if (parentNode is None):
+        return None
+
+    childName = childName.lower()
+    for childNode in parentNode:
+        if (childNode.tag.lower() == childName):
+            return childNode
+
+    return None
+# End - MLJobPeekGetChildNode
+
+
+def MLJobPeekGetChildText(parentNode, childName):
+    childNode = MLJobPeekGetChildNode(parentNode, childName)
+    if (childNode is None):
+        return ""
+
+    # Like XMLTools_GetTextContents, this is only the text directly inside the node.
+    textStr = childNode.text or ""
+    for grandChildNode in childNode:
+        textStr += grandChildNode.tail or ""
+
+    return textStr
+# End - MLJobPeekGetChildText
+
+
+
+
+
 
 
@@ -429,6 +429,10 @@ TDF_INVALID_VALUE = -314159265
 # may compare to 0 to test validity.
 TDF_SMALLEST_VALID_VALUE = -1000
 
+# GetValuesBetweenDays returns an array of these records, so callers can
+# read all the days or all the values as one array, like valueArray["Val"].
+TDF_DAY_VALUE_DTYPE = np.dtype([("Day", np.int64), ("Val", np.float64)])
+
 g_TDF_Log_Buffer = ""
 
 MIN_CR_RISE_FOR_AKI = 0.3
@@ -5096,7 +5100,7 @@ class TDFFileReader():
     #
     # [TDFFileReader::GetValuesBetweenDays]
     #
-    # This returns one lists of values, and is used when we 
+    # This returns one array of (Day, Val) records, and is used when we 
     # look for changes in the timing of values.
     #####################################################
 
@@ -5111,7 +5115,7 @@ class TDFFileReader():
         labInfo, nameStem, valueOffset, functionName = TDF_ParseOneVariableName(valueName)
         if (labInfo is None):
             TDF_Log("!Error! Cannot parse variable: " + valueName)
-            return valueList
+            return np.array(valueList, dtype=TDF_DAY_VALUE_DTYPE)
 
         functionObject = None
         if (functionName != ""):
@@ -5155,11 +5159,10 @@ class TDFFileReader():
             if (valueFloat > float(labMaxVal)):
                 valueFloat = float(labMaxVal)
 
-            newDict = {"Day": currentDayNum, "Val": valueFloat}
-            valueList.append(newDict)
+            valueList.append((currentDayNum, valueFloat))
         # End - for timeLineIndex in range(self.LastTimeLineIndex + 1)
 
-        return valueList
+        return np.array(valueList, dtype=TDF_DAY_VALUE_DTYPE)
     # End - GetValuesBetweenDays()
 
 